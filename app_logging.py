@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Merkezi log modülü
+
+Tüm modüller get_logger() ile "hukuk_takip" altındaki logger'ları kullanır.
+Kayıtlar çağıran thread'de yalnızca bir kuyruğa eklenir; dosyaya yazma
+tek bir arka plan thread'inde (QueueListener) ve boyuta göre döndürülen
+dosyaya yapılır. Aynı hata kısa sürede tekrar tekrar gelirse (ör. bozuk bir
+tarih sütunu her liste yenilemesinde) yalnızca ilki yazılır.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+LOGGER_NAME = "hukuk_takip"
+LOG_FILE = "hukuk_takip_errors.log"
+
+# Döndürme: dosya bu boyutu geçince .1, .2 ... olarak saklanır
+MAX_BYTES = 1024 * 1024
+BACKUP_COUNT = 3
+
+# Kayıtlara extra= ile eklenebilen yapısal alanlar
+STRUCTURED_FIELDS = ('dosya_numarasi', 'dosya_id', 'elapsed_ms')
+
+_listener = None
+_queue_handler = None
+_setup_lock = threading.Lock()
+
+
+class StructuredFormatter(logging.Formatter):
+    """Mesajın sonuna yapısal alanları anahtar=değer olarak ekleyen biçimlendirici"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s [%(module)s] %(message)s",
+                         datefmt='%Y-%m-%d %H:%M:%S')
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Kaydı biçimlendir"""
+        text = super().format(record)
+        fields = [f"{name}={getattr(record, name)}" for name in STRUCTURED_FIELDS
+                  if getattr(record, name, None) is not None]
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            fields.append(f"bastirilan={suppressed}")
+        return f"{text} | {' '.join(fields)}" if fields else text
+
+
+class RateLimitFilter(logging.Filter):
+    """Aynı kaynaktan gelen tekrar eden kayıtları sınırla
+
+    Anahtar (logger, seviye, mesaj şablonu)'dur; böylece farklı dosya
+    numaralarıyla gelen aynı tarih hatası tek bir kayıt sayılır. Aralık
+    dolduktan sonraki ilk kayıt, arada bastırılan kayıt sayısını taşır.
+    Yalnızca level ve üstü sınırlanır; süre ölçümleri gibi alt seviyeli
+    kayıtlar olduğu gibi geçer.
+    """
+
+    def __init__(self, interval: float = 60.0, clock=time.monotonic,
+                 level: int = logging.WARNING):
+        super().__init__()
+        self.interval = interval
+        self.level = level
+        self.clock = clock
+        self._state: Dict[Tuple, list] = {}  # anahtar -> [son yazılma, bastırılan]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Kayıt yazılmalı mı?"""
+        if record.levelno < self.level:
+            return True
+        key = (record.name, record.levelno, str(record.msg))
+        now = self.clock()
+        with self._lock:
+            state = self._state.get(key)
+            if state is not None and now - state[0] < self.interval:
+                state[1] += 1
+                return False
+            record.suppressed = state[1] if state is not None else 0
+            self._state[key] = [now, 0]
+            if len(self._state) > 1000:
+                # Eski anahtarları at (bellek sınırsız büyümesin)
+                limit = now - self.interval
+                self._state = {k: v for k, v in self._state.items() if v[0] >= limit}
+        return True
+
+
+def setup_logging(log_path: str = LOG_FILE, level: int = logging.INFO,
+                  console: bool = True, rate_limit_seconds: float = 60.0) -> logging.Logger:
+    """Kuyruk tabanlı loglamayı kur (birden fazla çağrılırsa yalnızca ilki geçerli)"""
+    global _listener, _queue_handler
+    logger = logging.getLogger(LOGGER_NAME)
+    with _setup_lock:
+        if _listener is not None:
+            return logger
+
+        formatter = StructuredFormatter()
+        handlers = []
+        try:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_path, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT,
+                encoding='utf-8', delay=True
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError:
+            pass  # Log dosyası açılamıyorsa konsolla devam et
+
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.WARNING)
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+
+        _queue_handler = logging.handlers.QueueHandler(queue.Queue(-1))
+        _queue_handler.addFilter(RateLimitFilter(rate_limit_seconds))
+        _listener = logging.handlers.QueueListener(
+            _queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+
+        logger.addHandler(_queue_handler)
+        logger.setLevel(level)
+        logger.propagate = False
+        atexit.register(shutdown_logging)
+    return logger
+
+
+def shutdown_logging():
+    """Kuyruktaki kayıtları yaz ve arka plan thread'ini durdur"""
+    global _listener, _queue_handler
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.removeHandler(_queue_handler)
+        logger.propagate = True
+        _listener = None
+        _queue_handler = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Modül için uygulama logger'ını getir"""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+@contextmanager
+def log_duration(logger: logging.Logger, message: str, *args, level: int = logging.DEBUG,
+                 **fields):
+    """Blok süresini elapsed_ms alanıyla logla"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        if logger.isEnabledFor(level):
+            logger.log(level, message, *args, extra=dict(fields, elapsed_ms=elapsed_ms))
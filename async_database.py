@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Asenkron veritabanı erişimi ve Tk / asyncio köprüsü
+
+AsyncDatabaseManager, DatabaseManager metotlarını sınırlı bir thread
+havuzunda çalıştıran awaitable sürümler sunar. TkAsyncBridge ise asyncio
+döngüsünü ayrı bir thread'de çalıştırır ve sonuçları root.after ile Tk ana
+thread'ine geri taşır; böylece yavaş diskte bile pencere donmaz.
+"""
+
+import asyncio
+import functools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from app_logging import get_logger
+from database import DatabaseManager
+
+logger = get_logger(__name__)
+
+
+class AsyncDatabaseManager:
+    """DatabaseManager için awaitable cephe (sınırlı thread havuzu üzerinde)
+
+    Her havuz thread'i DatabaseManager'ın kendi okuyucu bağlantısını kullanır;
+    yazmalar yine tek yazıcı thread'inden geçer.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, max_workers: int = 2):
+        self.db_manager = db_manager
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="veritabani-async")
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Senkron bir fonksiyonu havuzda çalıştır ve sonucunu bekle"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def get_all_dosyalar(self, include_completed: bool = True, limit: int = None,
+                               offset: int = 0) -> List[Dict]:
+        """Tüm dosyaları getir"""
+        return await self.run(self.db_manager.get_all_dosyalar, include_completed, limit, offset)
+
+    async def get_dosyalar_page(self, include_completed: bool = True, after=None, before=None,
+                                limit: int = 200) -> List[Dict]:
+        """Keyset sayfası getir"""
+        return await self.run(self.db_manager.get_dosyalar_page, include_completed,
+                              after=after, before=before, limit=limit)
+
+    async def get_dosya_by_id(self, dosya_id: int) -> Optional[Dict]:
+        """ID'ye göre dosya getir"""
+        return await self.run(self.db_manager.get_dosya_by_id, dosya_id)
+
+    async def get_dosyalar_by_ids(self, dosya_ids: List[int]) -> Dict[int, Dict]:
+        """Birden fazla dosyayı id ile getir"""
+        return await self.run(self.db_manager.get_dosyalar_by_ids, dosya_ids)
+
+    async def search_dosyalar(self, search_term: str) -> List[Dict]:
+        """Dosya ara"""
+        return await self.run(self.db_manager.search_dosyalar, search_term)
+
+    async def get_statistics(self) -> Dict:
+        """İstatistikleri getir"""
+        return await self.run(self.db_manager.get_statistics)
+
+    async def get_dashboard_snapshot(self, today=None) -> Dict:
+        """Dashboard anlık görüntüsünü getir"""
+        return await self.run(self.db_manager.get_dashboard_snapshot, today)
+
+    async def get_upcoming_deadlines(self, days_ahead: int = 7) -> List[Dict]:
+        """Yaklaşan son tarihleri getir"""
+        return await self.run(self.db_manager.get_upcoming_deadlines, days_ahead)
+
+    async def get_dosyalar_by_date(self, target_date: str) -> List[Dict]:
+        """Belirli bir tarihteki dosyaları getir"""
+        return await self.run(self.db_manager.get_dosyalar_by_date, target_date)
+
+    async def get_dosyalar_by_range(self, start_date: str, end_date: str) -> Dict[str, List[Dict]]:
+        """Tarih aralığındaki olayları getir"""
+        return await self.run(self.db_manager.get_dosyalar_by_range, start_date, end_date)
+
+    async def get_changes_since(self, seq: int):
+        """Değişiklik günlüğünü getir"""
+        return await self.run(self.db_manager.get_changes_since, seq)
+
+    async def add_dosya(self, dosya_numarasi: str, dilekce_son_teslim_tarihi: str,
+                        notlar: str = "") -> bool:
+        """Yeni dosya ekle"""
+        return await self.run(self.db_manager.add_dosya, dosya_numarasi,
+                              dilekce_son_teslim_tarihi, notlar)
+
+    async def update_dosya(self, dosya_id: int, **alanlar) -> bool:
+        """Dosyayı güncelle"""
+        return await self.run(self.db_manager.update_dosya, dosya_id, **alanlar)
+
+    async def delete_dosya(self, dosya_id: int) -> bool:
+        """Dosyayı sil"""
+        return await self.run(self.db_manager.delete_dosya, dosya_id)
+
+    def close(self):
+        """Thread havuzunu kapat"""
+        self._executor.shutdown(wait=False)
+
+
+class TkAsyncBridge:
+    """asyncio döngüsünü arka planda çalıştırıp sonuçları Tk thread'ine taşır
+
+    submit() Tk ana thread'inden çağrılır; tamamlanan işlerin geri çağrıları
+    da Tk ana thread'inde çalışır. Bekleyen iş yokken yoklama yapılmaz.
+    """
+
+    # Sonuç kuyruğunu yoklama aralığı (ms) - bir kare süresi kadar
+    POLL_INTERVAL_MS = 16
+
+    def __init__(self, root):
+        self.root = root
+        self._results = queue.Queue()
+        self._pending = 0
+        self._polling = False
+        self._latest = {}  # anahtar -> en son gönderilen işin sıra numarası
+        self._sequence = 0
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="tk-asyncio", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        """asyncio döngüsünü bu thread'de çalıştır"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro, on_done: Callable = None, on_error: Callable = None,
+               key: str = None):
+        """Coroutine'i arka planda çalıştır, sonucu on_done ile Tk thread'inde ver
+
+        Aynı key ile yeni bir iş gönderilirse eski işin sonucu yok sayılır
+        (ör. yazarken arama: yalnızca son sorgunun sonucu gösterilir).
+        """
+        self._sequence += 1
+        sequence = self._sequence
+        if key is not None:
+            self._latest[key] = sequence
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future.add_done_callback(
+            lambda f: self._results.put((f, on_done, on_error, key, sequence))
+        )
+
+        self._pending += 1
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+        return future
+
+    def cancel(self, key: str):
+        """Verilen anahtarla bekleyen işin sonucunu yok say"""
+        self._latest.pop(key, None)
+
+    def _poll(self):
+        """Tamamlanan işlerin geri çağrılarını Tk ana thread'inde çalıştır"""
+        while True:
+            try:
+                future, on_done, on_error, key, sequence = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            self._pending -= 1
+            if key is not None and self._latest.get(key) != sequence:
+                continue  # Daha yeni bir iş gönderilmiş
+
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+                else:
+                    logger.error("Arka plan işi hatası: %s", e)
+                continue
+
+            if on_done:
+                on_done(result)
+
+        if self._pending > 0:
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def close(self):
+        """asyncio döngüsünü durdur"""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=1)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Canvas tabanlı takvim ızgarası
+
+Ay görünümü 42 Frame + 84 Label yerine tek bir tk.Canvas üzerine çizilir.
+Her hücrenin öğeleri (zemin, gün numarası, rozetler) bir kez oluşturulur;
+ay değişince yalnızca durumu değişen öğeler itemconfig ile güncellenir,
+pencere boyutu değişince öğeler coords ile yerine taşınır. Tıklama ve
+ipucu için hangi hücrenin altında olunduğu ızgara geometrisinden bulunur.
+"""
+
+import tkinter as tk
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Hücre durumu: (gün metni, arka plan, yazı rengi, son teslim sayısı, sunum sayısı)
+CellState = Tuple[str, str, str, int, int]
+
+
+class CalendarCanvas:
+    """6 hafta x 7 günlük ay ızgarasını tek Canvas üzerinde çizen bileşen"""
+
+    DAY_NAMES = ['Pazartesi', 'Salı', 'Çarşamba', 'Perşembe', 'Cuma', 'Cumartesi', 'Pazar']
+    WEEKS = 6
+    HEADER_HEIGHT = 24
+    BADGE_SIZE = 18
+
+    # Rozet renkleri: son teslim (ST) ve ana avukata sunum (AS)
+    BADGE_COLORS = {'dilekce': '#d9534f', 'sunum': '#337ab7'}
+
+    # İpucu gösterilmeden önce beklenecek süre (ms) ve en fazla satır
+    TOOLTIP_DELAY_MS = 400
+    TOOLTIP_MAX_LINES = 12
+
+    def __init__(self, parent, on_day_click: Callable[[date], None] = None):
+        self.on_day_click = on_day_click
+        self.canvas = tk.Canvas(parent, background='white', highlightthickness=0,
+                                width=700, height=420)
+
+        self.cells = []  # Her hücre: öğe id'leri, tarih, durum, olaylar
+        self._size = None
+        self._layout_pending = False
+        self._hover_index = None
+        self._tooltip_after_id = None
+
+        self._create_items()
+
+        self.canvas.bind('<Configure>', self._on_configure)
+        self.canvas.bind('<Button-1>', self._on_click)
+        self.canvas.bind('<Motion>', self._on_motion)
+        self.canvas.bind('<Leave>', lambda e: self._hide_tooltip())
+
+    def pack(self, **kwargs):
+        """Canvas'ı yerleştir"""
+        self.canvas.pack(**kwargs)
+
+    def _create_items(self):
+        """Başlık ve hücre öğelerini bir kez oluştur (konumlar layout ile verilir)"""
+        canvas = self.canvas
+        self.header_items = [
+            canvas.create_text(0, 0, text=name, font=('Arial', 10, 'bold'), tags=('baslik',))
+            for name in self.DAY_NAMES
+        ]
+
+        for index in range(self.WEEKS * 7):
+            cell_tag = f'hucre_{index}'
+            badges = {}
+            for olay_turu, color in self.BADGE_COLORS.items():
+                badges[olay_turu] = (
+                    canvas.create_oval(0, 0, 0, 0, fill=color, outline='',
+                                       state='hidden', tags=('rozet', cell_tag)),
+                    canvas.create_text(0, 0, text='', fill='white', font=('Arial', 8, 'bold'),
+                                       state='hidden', tags=('rozet', cell_tag))
+                )
+            self.cells.append({
+                'rect': canvas.create_rectangle(0, 0, 0, 0, fill='white', outline='#d0d0d0',
+                                                tags=('zemin', cell_tag)),
+                'day': canvas.create_text(0, 0, text='', anchor='nw', font=('Arial', 12, 'bold'),
+                                          tags=('gun', cell_tag)),
+                'badges': badges,
+                'date': None,
+                'state': None,
+                'olaylar': (),
+            })
+
+        # İpucu öğeleri en üstte, başta gizli
+        self.tooltip_rect = canvas.create_rectangle(0, 0, 0, 0, fill='#ffffe0', outline='#808080',
+                                                    state='hidden', tags=('ipucu',))
+        self.tooltip_text = canvas.create_text(0, 0, text='', anchor='nw', font=('Arial', 9),
+                                               state='hidden', tags=('ipucu',))
+
+    # --- Geometri ---
+
+    def cell_size(self) -> Tuple[float, float]:
+        """Hücre genişliği ve yüksekliği"""
+        width, height = self._size or (int(self.canvas['width']), int(self.canvas['height']))
+        return width / 7, max(height - self.HEADER_HEIGHT, 1) / self.WEEKS
+
+    def cell_at(self, x: float, y: float) -> Optional[int]:
+        """Koordinattaki hücrenin sırası (ızgara dışıysa None)"""
+        if y < self.HEADER_HEIGHT or x < 0:
+            return None
+        cell_width, cell_height = self.cell_size()
+        column = int(x // cell_width)
+        row = int((y - self.HEADER_HEIGHT) // cell_height)
+        if column >= 7 or row >= self.WEEKS:
+            return None
+        return row * 7 + column
+
+    def _on_configure(self, event):
+        """Boyut değişince yeniden yerleşimi (olay yığını başına bir kez) planla"""
+        if self._size == (event.width, event.height):
+            return
+        self._size = (event.width, event.height)
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.canvas.after_idle(self.layout)
+
+    def layout(self):
+        """Tüm öğeleri mevcut boyuta göre konumlandır (öğeler yeniden oluşturulmaz)"""
+        self._layout_pending = False
+        self._hide_tooltip()
+        canvas = self.canvas
+        cell_width, cell_height = self.cell_size()
+
+        for column, item in enumerate(self.header_items):
+            canvas.coords(item, (column + 0.5) * cell_width, self.HEADER_HEIGHT / 2)
+
+        badge = self.BADGE_SIZE
+        for index, cell in enumerate(self.cells):
+            row, column = divmod(index, 7)
+            x0 = column * cell_width
+            y0 = self.HEADER_HEIGHT + row * cell_height
+            x1, y1 = x0 + cell_width, y0 + cell_height
+
+            canvas.coords(cell['rect'], x0 + 1, y0 + 1, x1 - 1, y1 - 1)
+            canvas.coords(cell['day'], x0 + 5, y0 + 4)
+
+            # Rozetler hücrenin sol alt köşesinde yan yana
+            bx = x0 + 5
+            by = y1 - badge - 4
+            for oval, text in cell['badges'].values():
+                canvas.coords(oval, bx, by, bx + badge, by + badge)
+                canvas.coords(text, bx + badge / 2, by + badge / 2)
+                bx += badge + 4
+
+    # --- Durum ---
+
+    def set_cell(self, index: int, date_obj: date, state: CellState, olaylar: Sequence[Dict]):
+        """Hücrenin tarihini ve görünümünü ayarla; yalnızca değişen öğeler güncellenir"""
+        cell = self.cells[index]
+        cell['date'] = date_obj
+        cell['olaylar'] = olaylar
+        old_state = cell['state']
+        if state == old_state:
+            return
+
+        day_text, bg_color, text_color, dilekce_count, sunum_count = state
+        old_day, old_bg, old_fg, old_dilekce, old_sunum = old_state or (None,) * 5
+        canvas = self.canvas
+
+        if bg_color != old_bg:
+            canvas.itemconfigure(cell['rect'], fill=bg_color)
+
+        day_options = {}
+        if day_text != old_day:
+            day_options['text'] = day_text
+        if text_color != old_fg:
+            day_options['fill'] = text_color
+        if day_options:
+            canvas.itemconfigure(cell['day'], **day_options)
+
+        for olay_turu, count, old_count in (('dilekce', dilekce_count, old_dilekce),
+                                            ('sunum', sunum_count, old_sunum)):
+            if count == old_count:
+                continue
+            oval, text = cell['badges'][olay_turu]
+            badge_state = 'normal' if count else 'hidden'
+            canvas.itemconfigure(oval, state=badge_state)
+            canvas.itemconfigure(text, state=badge_state, text=str(count) if count else '')
+
+        cell['state'] = state
+
+    # --- Etkileşim ---
+
+    def _on_click(self, event):
+        """Tıklanan hücrenin tarihini bildir"""
+        index = self.cell_at(event.x, event.y)
+        if index is not None and self.cells[index]['date'] and self.on_day_click:
+            self.on_day_click(self.cells[index]['date'])
+
+    def _on_motion(self, event):
+        """Fare başka bir hücreye geçince ipucunu yeniden planla"""
+        index = self.cell_at(event.x, event.y)
+        if index == self._hover_index:
+            return
+        self._hide_tooltip()
+        self._hover_index = index
+        if index is not None and self.cells[index]['olaylar']:
+            self._tooltip_after_id = self.canvas.after(
+                self.TOOLTIP_DELAY_MS, lambda: self._show_tooltip(index, event.x, event.y)
+            )
+
+    def tooltip_lines(self, index: int) -> List[str]:
+        """Hücredeki dosya numaralarını ipucu satırlarına çevir"""
+        lines = []
+        for olay in self.cells[index]['olaylar']:
+            prefix = "ST" if olay['type'] == 'dilekce' else "AS"
+            lines.append(f"{prefix}: {olay['dosya']['dosya_numarasi']}")
+        if len(lines) > self.TOOLTIP_MAX_LINES:
+            hidden = len(lines) - self.TOOLTIP_MAX_LINES + 1
+            lines = lines[:self.TOOLTIP_MAX_LINES - 1] + [f"... ve {hidden} dosya daha"]
+        return lines
+
+    def _show_tooltip(self, index: int, x: float, y: float):
+        """İpucunu imlecin yanında, Canvas sınırları içinde göster"""
+        self._tooltip_after_id = None
+        if index != self._hover_index:
+            return
+        canvas = self.canvas
+        canvas.itemconfigure(self.tooltip_text, text="\n".join(self.tooltip_lines(index)),
+                             state='normal')
+
+        # Önce ölç, sonra taşmayacak şekilde yerleştir
+        canvas.coords(self.tooltip_text, 0, 0)
+        x0, y0, x1, y1 = canvas.bbox(self.tooltip_text)
+        width, height = x1 - x0 + 8, y1 - y0 + 6
+        canvas_width, canvas_height = self._size or (canvas.winfo_width(), canvas.winfo_height())
+        left = min(x + 12, max(canvas_width - width, 0))
+        top = min(y + 12, max(canvas_height - height, 0))
+
+        canvas.coords(self.tooltip_rect, left, top, left + width, top + height)
+        canvas.coords(self.tooltip_text, left + 4, top + 3)
+        canvas.itemconfigure(self.tooltip_rect, state='normal')
+        canvas.tag_raise('ipucu')
+
+    def _hide_tooltip(self):
+        """İpucunu gizle ve bekleyen gösterimi iptal et"""
+        if self._tooltip_after_id is not None:
+            self.canvas.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = None
+        self._hover_index = None
+        self.canvas.itemconfigure('ipucu', state='hidden')
@@ -8,19 +8,145 @@ Takvim görünümü modülü
 import tkinter as tk
 from tkinter import ttk, messagebox
 import calendar
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, date
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from app_logging import get_logger
+from calendar_canvas import CalendarCanvas, CellState
 from database import DatabaseManager
 
+logger = get_logger(__name__)
+
+
+def month_grid_range(year: int, month: int) -> Tuple[date, date]:
+    """Ay görünümündeki 6x7 ızgaranın ilk ve son günü"""
+    first_day = date(year, month, 1)
+    start_date = first_day - timedelta(days=first_day.weekday())  # Pazartesi = 0
+    return start_date, start_date + timedelta(days=6 * 7 - 1)
+
+
+def adjacent_month(year: int, month: int, delta: int) -> Tuple[int, int]:
+    """Verilen aydan delta ay ilerideki (yıl, ay)"""
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+class MonthCache:
+    """Takvim ayları için LRU önbellek
+
+    Her kayıt bir ayın ızgarasındaki ({'YYYY-MM-DD': [olaylar]}) verisidir.
+    Veritabanının değişiklik sayacı değişince önbellek boşaltılır. Komşu aylar
+    arka planda önceden yüklenir; ileri/geri gezinme ve gün tıklamaları
+    çoğunlukla veritabanına gitmeden karşılanır.
+    """
+    
+    # Bellekte tutulacak en fazla ay sayısı
+    MAX_MONTHS = 12
+    
+    def __init__(self, db_manager: DatabaseManager, max_months: int = None):
+        self.db_manager = db_manager
+        self.max_months = max_months or self.MAX_MONTHS
+        self._months = OrderedDict()  # (yıl, ay) -> (başlangıç, bitiş, veri)
+        self._loading = {}  # (yıl, ay) -> Future
+        self._seq = None  # Önbelleğin geçerli olduğu değişiklik sayacı
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="takvim-onbellek")
+    
+    def validate(self):
+        """Veritabanı değiştiyse önbelleği boşalt"""
+        seq = self.db_manager.get_change_counter()
+        with self._lock:
+            if seq != self._seq:
+                self._months.clear()
+                self._seq = seq
+    
+    def get_month(self, year: int, month: int) -> Dict[str, List[Dict]]:
+        """Ayın ızgara verisini getir (önbellekte yoksa yükle)"""
+        key = (year, month)
+        with self._lock:
+            if key in self._months:
+                self._months.move_to_end(key)
+                return self._months[key][2]
+            future = self._loading.get(key)
+        
+        if future is not None:
+            # Arka planda yükleniyor: sonucu bekle
+            data = future.result()
+            if data is not None:
+                return data
+        return self._load(key)
+    
+    def get_day(self, date_obj: date) -> Optional[List[Dict]]:
+        """Günün olaylarını önbellekteki aylardan getir (yoksa None)"""
+        date_str = date_obj.strftime('%Y-%m-%d')
+        with self._lock:
+            for start_date, end_date, data in reversed(self._months.values()):
+                if start_date <= date_obj <= end_date:
+                    return data.get(date_str, [])
+        return None
+    
+    def prefetch(self, year: int, month: int):
+        """Önceki ve sonraki ayı arka planda yükle"""
+        for delta in (-1, 1):
+            key = adjacent_month(year, month, delta)
+            with self._lock:
+                if key in self._months or key in self._loading:
+                    continue
+                future = Future()
+                self._loading[key] = future
+            self._executor.submit(self._prefetch_one, key, future)
+    
+    def _prefetch_one(self, key: Tuple[int, int], future: Future):
+        """Arka plan thread'inde bir ayı yükle"""
+        try:
+            data = self._load(key)
+            with self._lock:
+                # Önbelleğe alınmadıysa (veri değişti) bekleyen yeniden yüklesin
+                cached = key in self._months
+            future.set_result(data if cached else None)
+        except Exception as e:
+            logger.warning("Takvim ön yükleme hatası: %s", e)
+            future.set_result(None)
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+    
+    def _load(self, key: Tuple[int, int]) -> Dict[str, List[Dict]]:
+        """Ayı veritabanından yükle ve (hala geçerliyse) önbelleğe koy"""
+        seq = self.db_manager.get_change_counter()
+        start_date, end_date = month_grid_range(*key)
+        data = self.db_manager.get_dosyalar_by_range(
+            start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+        )
+        with self._lock:
+            # Yükleme sırasında veri değiştiyse eski sonucu saklama
+            if seq == self._seq:
+                self._months[key] = (start_date, end_date, data)
+                self._months.move_to_end(key)
+                while len(self._months) > self.max_months:
+                    self._months.popitem(last=False)
+        return data
+    
+    def close(self):
+        """Arka plan thread'ini kapat"""
+        self._executor.shutdown(wait=False)
+
+
 class CalendarView:
     def __init__(self, parent, db_manager: DatabaseManager):
         self.parent = parent
         self.db_manager = db_manager
         self.current_date = datetime.now()
         
+        # Ay verileri önbelleği (komşu aylar arka planda yüklenir)
+        self.month_cache = MonthCache(db_manager)
+        
         # Ana frame
         self.main_frame = ttk.Frame(parent, padding="10")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
+        self.main_frame.bind('<Destroy>', lambda e: self.month_cache.close())
         
         # Kontrol paneli oluştur
         self.create_control_panel()
@@ -71,66 +197,9 @@ class CalendarView:
             legend_label.grid(row=0, column=i, padx=2)
     
     def create_calendar(self):
-        """Takvim oluştur"""
-        # Takvim frame'i
-        self.calendar_frame = ttk.Frame(self.main_frame)
-        self.calendar_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Haftanın günleri başlıkları
-        days = ['Pazartesi', 'Salı', 'Çarşamba', 'Perşembe', 'Cuma', 'Cumartesi', 'Pazar']
-        
-        for i, day in enumerate(days):
-            day_label = ttk.Label(self.calendar_frame, text=day, 
-                                 font=('Arial', 10, 'bold'), anchor='center')
-            day_label.grid(row=0, column=i, sticky='ew', padx=1, pady=1)
-        
-        # Grid konfigürasyonu
-        for i in range(7):
-            self.calendar_frame.columnconfigure(i, weight=1)
-        
-        # Takvim günleri için liste
-        self.day_buttons = []
-        
-        # 6 satır x 7 sütun = 42 gün
-        for week in range(6):
-            week_buttons = []
-            for day in range(7):
-                row = week + 1  # 0. satır başlıklar için
-                
-                # Gün butonu frame'i
-                day_frame = tk.Frame(self.calendar_frame, relief='raised', borderwidth=1,
-                                   width=100, height=80)
-                day_frame.grid(row=row, column=day, sticky='nsew', padx=1, pady=1)
-                day_frame.grid_propagate(False)
-                
-                # Gün numarası etiketi
-                day_label = tk.Label(day_frame, text="", font=('Arial', 12, 'bold'),
-                                   background='white', anchor='nw')
-                day_label.place(x=5, y=5)
-                
-                # Dosya bilgileri etiketi
-                info_label = tk.Label(day_frame, text="", font=('Arial', 8),
-                                    background='white', anchor='nw', justify='left',
-                                    wraplength=90)
-                info_label.place(x=5, y=25)
-                
-                # Tıklama olayı
-                day_frame.bind('<Button-1>', lambda e, d=(week, day): self.on_day_click(d))
-                day_label.bind('<Button-1>', lambda e, d=(week, day): self.on_day_click(d))
-                info_label.bind('<Button-1>', lambda e, d=(week, day): self.on_day_click(d))
-                
-                week_buttons.append({
-                    'frame': day_frame,
-                    'day_label': day_label,
-                    'info_label': info_label,
-                    'date': None
-                })
-                
-            self.day_buttons.append(week_buttons)
-        
-        # Grid satırlarını genişletilebilir yap
-        for i in range(7):
-            self.calendar_frame.rowconfigure(i, weight=1)
+        """Takvim ızgarasını oluştur (tek Canvas üzerinde)"""
+        self.calendar_grid = CalendarCanvas(self.main_frame, on_day_click=self.show_day_details)
+        self.calendar_grid.pack(fill=tk.BOTH, expand=True)
     
     def create_detail_panel(self):
         """Detay panelini oluştur"""
@@ -171,7 +240,7 @@ class CalendarView:
         self.update_calendar()
     
     def update_calendar(self):
-        """Takvimi güncelle"""
+        """Takvimi güncelle (yalnızca durumu değişen hücreler yeniden çizilir)"""
         # Ay/yıl başlığını güncelle
         month_names = [
             '', 'Ocak', 'Şubat', 'Mart', 'Nisan', 'Mayıs', 'Haziran',
@@ -180,193 +249,84 @@ class CalendarView:
         month_year_text = f"{month_names[self.current_date.month]} {self.current_date.year}"
         self.month_year_var.set(month_year_text)
         
-        # Ayın ilk günü ve gün sayısı
-        first_day = self.current_date.replace(day=1)
-        days_in_month = calendar.monthrange(self.current_date.year, self.current_date.month)[1]
-        
-        # İlk günün hafta içindeki pozisyonu (Pazartesi = 0)
-        first_weekday = first_day.weekday()
-        
-        # Bugünün tarihi
+        # Izgaranın ilk günü (önceki ayın sonlarından başlar) ve bugün - bir kez
+        start_date, _ = month_grid_range(self.current_date.year, self.current_date.month)
         today = datetime.now().date()
         
         # Dosya verilerini al
         dosyalar_by_date = self.get_dosyalar_by_month()
         
         # Takvim günlerini doldur
-        current_day = 1
-        
-        for week in range(6):
-            for day in range(7):
-                button_info = self.day_buttons[week][day]
-                
-                # Bu pozisyonda gösterilecek tarih
-                if week == 0 and day < first_weekday:
-                    # Önceki ayın sonları
-                    prev_month_date = first_day - timedelta(days=first_weekday - day)
-                    self.setup_day_button(button_info, prev_month_date, dosyalar_by_date, 
-                                         is_current_month=False)
-                elif current_day <= days_in_month:
-                    # Bu ayın günleri
-                    current_date = first_day.replace(day=current_day)
-                    self.setup_day_button(button_info, current_date, dosyalar_by_date, 
-                                         is_current_month=True, is_today=(current_date == today))
-                    current_day += 1
-                else:
-                    # Sonraki ayın başları
-                    next_month_start = first_day.replace(month=first_day.month + 1 if first_day.month < 12 else 1,
-                                                       year=first_day.year if first_day.month < 12 else first_day.year + 1,
-                                                       day=1)
-                    next_month_date = next_month_start + timedelta(days=current_day - days_in_month - 1)
-                    self.setup_day_button(button_info, next_month_date, dosyalar_by_date, 
-                                         is_current_month=False)
-                    current_day += 1
+        for index in range(CalendarCanvas.WEEKS * 7):
+            date_obj = start_date + timedelta(days=index)
+            olaylar = dosyalar_by_date.get(date_obj.strftime('%Y-%m-%d'), ())
+            state = self.build_cell_state(
+                date_obj, olaylar,
+                is_current_month=(date_obj.month == self.current_date.month),
+                today=today
+            )
+            self.calendar_grid.set_cell(index, date_obj, state, olaylar)
     
-    def setup_day_button(self, button_info: Dict, date_obj: date, dosyalar_by_date: Dict, 
-                        is_current_month: bool = True, is_today: bool = False):
-        """Günlük butonu ayarla"""
-        button_info['date'] = date_obj
-        date_str = date_obj.strftime('%Y-%m-%d')
-        
-        # Gün numarasını ayarla
-        day_text = str(date_obj.day)
-        button_info['day_label'].config(text=day_text)
-        
-        # Renk ve metin ayarları
-        bg_color = 'white'
-        text_color = 'black'
-        info_text = ''
-        
-        # Bugün mü?
-        if is_today:
-            bg_color = '#ffff99'
-        
-        # Bu ay mı?
-        if not is_current_month:
-            text_color = '#cccccc'
-        
-        # Bu tarihteki dosyalar var mı?
-        if date_str in dosyalar_by_date:
-            dosyalar = dosyalar_by_date[date_str]
-            
-            # Dosya türlerine göre renk belirle
-            has_dilekce = any(d['type'] == 'dilekce' for d in dosyalar)
-            has_sunum = any(d['type'] == 'sunum' for d in dosyalar)
-            
-            if has_dilekce and has_sunum:
-                bg_color = '#ffddff'  # Mor
-            elif has_dilekce:
-                if date_obj < datetime.now().date():
-                    bg_color = '#ff9999'  # Kırmızı (geçmiş)
-                else:
-                    bg_color = '#ffcccc'  # Açık kırmızı
-            elif has_sunum:
-                if date_obj < datetime.now().date():
-                    bg_color = '#9999ff'  # Koyu mavi (geçmiş)
-                else:
-                    bg_color = '#ccccff'  # Açık mavi
-            
-            # Bilgi metnini oluştur
-            dilekce_count = len([d for d in dosyalar if d['type'] == 'dilekce'])
-            sunum_count = len([d for d in dosyalar if d['type'] == 'sunum'])
-            
-            info_parts = []
-            if dilekce_count > 0:
-                info_parts.append(f"ST: {dilekce_count}")  # Son Teslim
-            if sunum_count > 0:
-                info_parts.append(f"AS: {sunum_count}")   # Ana avukata Sunum
-            
-            info_text = '\n'.join(info_parts)
-        
-        # Bugün ise rengi koru ama kenarlık ekle
-        if is_today and bg_color == 'white':
-            bg_color = '#ffffcc'
-        
-        # Widget'ları güncelle
-        button_info['frame'].config(background=bg_color)
-        button_info['day_label'].config(foreground=text_color, background=bg_color)
-        button_info['info_label'].config(text=info_text, foreground=text_color, background=bg_color)
+    @staticmethod
+    def build_cell_state(date_obj: date, olaylar, is_current_month: bool,
+                         today: date) -> CellState:
+        """Hücrenin görünümünü hesapla: (gün metni, arka plan, yazı rengi, ST sayısı, AS sayısı)"""
+        # Bugün sarı, diğer ayların günleri soluk
+        bg_color = '#ffff99' if date_obj == today else 'white'
+        text_color = 'black' if is_current_month else '#cccccc'
+        
+        # Olay türlerini tek geçişte say
+        dilekce_count = sunum_count = 0
+        for olay in olaylar:
+            if olay['type'] == 'dilekce':
+                dilekce_count += 1
+            elif olay['type'] == 'sunum':
+                sunum_count += 1
+        
+        is_past = date_obj < today
+        if dilekce_count and sunum_count:
+            bg_color = '#ffddff'  # Mor
+        elif dilekce_count:
+            bg_color = '#ff9999' if is_past else '#ffcccc'  # Kırmızı (geçmiş) / açık kırmızı
+        elif sunum_count:
+            bg_color = '#9999ff' if is_past else '#ccccff'  # Koyu mavi (geçmiş) / açık mavi
+        
+        return str(date_obj.day), bg_color, text_color, dilekce_count, sunum_count
     
     def get_dosyalar_by_month(self) -> Dict:
-        """Bu aydaki dosyaları al (takvim görünümü için geniş aralık)"""
+        """Bu ayın takvim ızgarasındaki dosyaları al (önbellekten)"""
         try:
-            # Ayın ilk günü
-            first_day = self.current_date.replace(day=1)
-            
-            # Takvimde görünen tüm günleri kapsayacak aralık
-            # Önceki aydan başlayıp sonraki aya kadar
-            first_weekday = first_day.weekday()  # Pazartesi = 0
-            start_date = first_day - timedelta(days=first_weekday)
-            
-            # Ayın son günü
-            if self.current_date.month == 12:
-                last_day = first_day.replace(year=first_day.year + 1, month=1) - timedelta(days=1)
-            else:
-                last_day = first_day.replace(month=first_day.month + 1) - timedelta(days=1)
-            
-            # Takvim grid'inin son günü (6 hafta * 7 gün = 42 gün)
-            days_in_month = last_day.day
-            total_days_needed = first_weekday + days_in_month
-            weeks_needed = (total_days_needed + 6) // 7  # Yukarı yuvarlama
-            end_date = start_date + timedelta(days=weeks_needed * 7 - 1)
-            
-            # Tüm dosyaları al
-            all_dosyalar = self.db_manager.get_all_dosyalar(include_completed=True)
-            
-            # Tarihe göre grupla
-            dosyalar_by_date = {}
-            
-            for dosya in all_dosyalar:
-                # Son teslim tarihi
-                try:
-                    dilekce_date = datetime.strptime(dosya['dilekce_son_teslim_tarihi'], '%Y-%m-%d').date()
-                    if start_date <= dilekce_date <= end_date:
-                        date_str = dilekce_date.strftime('%Y-%m-%d')
-                        if date_str not in dosyalar_by_date:
-                            dosyalar_by_date[date_str] = []
-                        dosyalar_by_date[date_str].append({
-                            'dosya': dosya,
-                            'type': 'dilekce'
-                        })
-                except ValueError as e:
-                    print(f"Takvim tarih formatı hatası: {e} - Dosya: {dosya.get('dosya_numarasi', 'N/A')}")
-                    pass
-                
-                # Ana avukata sunum tarihi
-                try:
-                    sunum_date = datetime.strptime(dosya['ana_avukata_sunum_tarihi'], '%Y-%m-%d').date()
-                    if start_date <= sunum_date <= end_date:
-                        date_str = sunum_date.strftime('%Y-%m-%d')
-                        if date_str not in dosyalar_by_date:
-                            dosyalar_by_date[date_str] = []
-                        dosyalar_by_date[date_str].append({
-                            'dosya': dosya,
-                            'type': 'sunum'
-                        })
-                except ValueError as e:
-                    print(f"Takvim tarih formatı hatası: {e} - Dosya: {dosya.get('dosya_numarasi', 'N/A')}")
-                    pass
+            self.month_cache.validate()
+            year, month = self.current_date.year, self.current_date.month
+            dosyalar_by_date = self.month_cache.get_month(year, month)
             
+            # Kullanıcı büyük olasılıkla komşu aya geçecek
+            self.month_cache.prefetch(year, month)
             return dosyalar_by_date
             
         except Exception as e:
             messagebox.showerror("Hata", f"Dosya verileri alınırken hata oluştu: {str(e)}")
             return {}
     
-    def on_day_click(self, day_coords):
-        """Güne tıklandığında"""
-        week, day = day_coords
-        button_info = self.day_buttons[week][day]
-        
-        if button_info['date']:
-            self.show_day_details(button_info['date'])
+    def get_day_dosyalar(self, date_obj: date) -> List[Dict]:
+        """Günün dosyalarını önbellekteki ay verisinden al (yoksa veritabanından)"""
+        self.month_cache.validate()
+        olaylar = self.month_cache.get_day(date_obj)
+        if olaylar is None:
+            return self.db_manager.get_dosyalar_by_date(date_obj.strftime('%Y-%m-%d'))
+        
+        # Aynı dosyanın iki olayı aynı güne düşebilir; bir kez göster
+        dosyalar = {}
+        for olay in olaylar:
+            dosyalar.setdefault(olay['dosya']['id'], olay['dosya'])
+        return list(dosyalar.values())
     
     def show_day_details(self, date_obj: date):
         """Günün detaylarını göster"""
         try:
             # Bu tarihteki dosyaları al
             date_str = date_obj.strftime('%Y-%m-%d')
-            dosyalar = self.db_manager.get_dosyalar_by_date(date_str)
+            dosyalar = self.get_day_dosyalar(date_obj)
             
             # Detay metnini oluştur
             detail_text = f"Tarih: {date_obj.strftime('%d.%m.%Y (%A)')}\n"
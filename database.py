@@ -7,28 +7,449 @@ Veritabanı yönetimi modülü
 
 import sqlite3
 import os
+import json
+import queue
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
+
+from app_logging import get_logger
+from judicial_calendar import JudicialCalendar, get_default_calendar
+from records import Dosya
+
+logger = get_logger(__name__)
+
+# Türkçe büyük/küçük harf katlama: I/İ/ı hepsi 'i' olarak eşlenir, böylece
+# "ISTANBUL", "İstanbul" ve "ıstanbul" aramaları aynı sonucu verir. ASCII
+# dışı harfler SQLite lower() ile küçültülemediği için ayrıca listelenir;
+# FTS trigger'ları aynı eşlemeyi yerleşik SQL fonksiyonlarıyla uygular.
+_TURKCE_HARFLER = {'İ': 'i', 'ı': 'i', 'Ç': 'ç', 'Ğ': 'ğ', 'Ö': 'ö', 'Ş': 'ş', 'Ü': 'ü',
+                   'Â': 'â', 'Î': 'î', 'Û': 'û'}
+_TURKCE_KATLAMA = str.maketrans({
+    **{chr(kod): chr(kod + 32) for kod in range(ord('A'), ord('Z') + 1)},
+    **_TURKCE_HARFLER,
+})
+
+
+def turkce_katla(metin: Optional[str]) -> str:
+    """Metni Türkçe'ye duyarlı şekilde arama için küçült"""
+    if metin is None:
+        return ''
+    return str(metin).translate(_TURKCE_KATLAMA)
+
+
+def _sql_turkce_katla(ifade: str) -> str:
+    """turkce_katla ile aynı sonucu veren, yalnızca yerleşik fonksiyonlu SQL ifadesi
+
+    Trigger'larda Python fonksiyonu kullanılmaz; böylece veritabanına başka
+    SQLite istemcilerinden (sqlite3 komut satırı, DB Browser) de yazılabilir.
+    """
+    ifade = f"coalesce({ifade}, '')"
+    for buyuk, kucuk in _TURKCE_HARFLER.items():
+        ifade = f"replace({ifade}, '{buyuk}', '{kucuk}')"
+    return f"lower({ifade})"
+
+
+def _create_fts_index(cursor, db_manager=None):
+    """Tam metin arama (FTS5 trigram) gölge indeksini ve trigger'ları oluştur"""
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS dosyalar_fts
+            USING fts5(dosya_numarasi, notlar, tokenize = 'trigram')
+        ''')
+    except sqlite3.OperationalError:
+        # SQLite FTS5/trigram desteği yok: arama LIKE ile devam eder
+        return
+
+    _create_fts_triggers(cursor)
+
+
+def _create_fts_triggers(cursor, db_manager=None):
+    """FTS trigger'larını (yeniden) oluştur ve indeksi baştan doldur"""
+    if cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'dosyalar_fts'"
+    ).fetchone() is None:
+        return
+
+    for trigger in ('dosyalar_fts_insert', 'dosyalar_fts_delete', 'dosyalar_fts_update'):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    cursor.execute(f'''
+        CREATE TRIGGER dosyalar_fts_insert
+        AFTER INSERT ON dosyalar
+        BEGIN
+            INSERT INTO dosyalar_fts (rowid, dosya_numarasi, notlar)
+            VALUES (NEW.id, {_sql_turkce_katla('NEW.dosya_numarasi')},
+                    {_sql_turkce_katla('NEW.notlar')});
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER dosyalar_fts_delete
+        AFTER DELETE ON dosyalar
+        BEGIN
+            DELETE FROM dosyalar_fts WHERE rowid = OLD.id;
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER dosyalar_fts_update
+        AFTER UPDATE OF dosya_numarasi, notlar ON dosyalar
+        BEGIN
+            UPDATE dosyalar_fts
+            SET dosya_numarasi = {_sql_turkce_katla('NEW.dosya_numarasi')},
+                notlar = {_sql_turkce_katla('NEW.notlar')}
+            WHERE rowid = NEW.id;
+        END
+    ''')
+
+    # Mevcut kayıtları indekse (yeniden) aktar
+    cursor.execute("DELETE FROM dosyalar_fts")
+    cursor.execute(f'''
+        INSERT INTO dosyalar_fts (rowid, dosya_numarasi, notlar)
+        SELECT id, {_sql_turkce_katla('dosya_numarasi')}, {_sql_turkce_katla('notlar')}
+        FROM dosyalar
+    ''')
+
+
+def _sunum_tarihlerini_yeniden_yaz(cursor, takvim: JudicialCalendar) -> int:
+    """Tüm dosyaların sunum tarihini takvime göre yeniden yaz (çağıranın işleminde)
+
+    Her farklı son teslim tarihi için sunum tarihi bir kez hesaplanır, geçici
+    tabloya yazılır ve tek UPDATE ile yalnızca değişen satırlara uygulanır.
+    """
+    eslemeler = []
+    for (dilekce,) in cursor.execute(
+        "SELECT DISTINCT dilekce_son_teslim_tarihi FROM dosyalar"
+    ).fetchall():
+        try:
+            eslemeler.append((dilekce, takvim.sunum_tarihi(dilekce)))
+        except (TypeError, ValueError):
+            continue  # Bozuk tarih: satır olduğu gibi bırakılır
+
+    # Sütun türleri dosyalar ile aynı olmalı; aksi halde tür dönüşümü
+    # yüzünden eşleme tablosunun birincil anahtarı kullanılamaz
+    cursor.execute('''
+        CREATE TEMP TABLE IF NOT EXISTS sunum_esleme (
+            dilekce DATE PRIMARY KEY,
+            sunum DATE NOT NULL
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute("DELETE FROM temp.sunum_esleme")
+    cursor.executemany("INSERT INTO temp.sunum_esleme (dilekce, sunum) VALUES (?, ?)", eslemeler)
+    cursor.execute('''
+        UPDATE dosyalar
+        SET ana_avukata_sunum_tarihi = (
+            SELECT sunum FROM temp.sunum_esleme
+            WHERE dilekce = dosyalar.dilekce_son_teslim_tarihi
+        )
+        WHERE EXISTS (
+            SELECT 1 FROM temp.sunum_esleme
+            WHERE dilekce = dosyalar.dilekce_son_teslim_tarihi
+              AND sunum IS NOT dosyalar.ana_avukata_sunum_tarihi
+        )
+    ''')
+    guncellenen = cursor.rowcount
+    cursor.execute("DROP TABLE temp.sunum_esleme")
+    return guncellenen
+
+
+def _sunum_tarihlerini_is_gunune_cevir(cursor, db_manager):
+    """Eski (2 takvim günü) sunum tarihlerini yöneticinin adli takvimine göre düzelt
+
+    add_dosya / update_dosya ile aynı kurallar kullanılır.
+    """
+    _sunum_tarihlerini_yeniden_yaz(cursor, db_manager.judicial_calendar)
+
+
+def _bildirim_durumu_ekle(cursor, db_manager=None):
+    """Bildirim defterine durum sütununu ekle (eski kayıtlar gönderilmiş sayılır)"""
+    sutunlar = {row[1] for row in cursor.execute("PRAGMA table_info(bildirim_kayitlari)")}
+    if 'durum' not in sutunlar:
+        cursor.execute("ALTER TABLE bildirim_kayitlari "
+                       "ADD COLUMN durum TEXT NOT NULL DEFAULT 'gonderildi'")
+
+
+# Bellek içi veritabanlarına verilen paylaşımlı önbellek adları için sayaç
+_bellek_sayaci = itertools.count(1)
+
+
+def _baglanti_ac(db_path: str, uri: bool = False) -> sqlite3.Connection:
+    """Ortak ayarlarla yeni bir SQLite bağlantısı aç"""
+    connection = sqlite3.connect(db_path, check_same_thread=False, timeout=10, uri=uri)
+    connection.row_factory = sqlite3.Row  # Dict benzeri erişim için
+    return connection
+
+
+def _yazici_dongusu(yazma_kuyrugu: "queue.Queue"):
+    """Yazma isteklerini tek thread'de sırayla çalıştır (None gelince çık)"""
+    while True:
+        istek = yazma_kuyrugu.get()
+        if istek is None:
+            break
+        future, func, args, kwargs = istek
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        del istek, func, args, kwargs
+
+
+def _yazma_islemi(method):
+    """Metodu DatabaseManager'ın tek yazıcı thread'inde çalıştır"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self._submit_write(method, self, *args, **kwargs)
+    return wrapper
+
 
 class DatabaseManager:
-    def __init__(self, db_path: str = "hukuk_takip.db"):
-        """Veritabanı yöneticisini başlat"""
+    # Şema göçleri: (sürüm, ifadeler). Uygulanan son sürüm PRAGMA user_version
+    # içinde tutulur; her göç tek bir işlem (transaction) içinde çalışır.
+    # Fonksiyon adımları (imleç, veritabanı yöneticisi) ile çağrılır.
+    SCHEMA_MIGRATIONS = [
+        (1, (
+            # Tarih aralığı sorguları (takvim, tarihe göre getirme)
+            "CREATE INDEX IF NOT EXISTS idx_dosyalar_son_teslim "
+            "ON dosyalar (dilekce_son_teslim_tarihi)",
+            "CREATE INDEX IF NOT EXISTS idx_dosyalar_sunum "
+            "ON dosyalar (ana_avukata_sunum_tarihi)",
+            # Durum filtresi + sıralama, tamamlanan sayımı
+            "CREATE INDEX IF NOT EXISTS idx_dosyalar_durum_son_teslim "
+            "ON dosyalar (tamamlandi, dilekce_son_teslim_tarihi)",
+            # Yalnızca aktif dosyalar (yaklaşan tarihler, haftalık istatistik)
+            "CREATE INDEX IF NOT EXISTS idx_dosyalar_aktif_son_teslim "
+            "ON dosyalar (dilekce_son_teslim_tarihi) WHERE tamamlandi = FALSE",
+            "CREATE INDEX IF NOT EXISTS idx_dosyalar_aktif_sunum "
+            "ON dosyalar (ana_avukata_sunum_tarihi) WHERE tamamlandi = FALSE",
+        )),
+        (2, (
+            _create_fts_index,
+        )),
+        (3, (
+            # Değişiklik günlüğü: arayüzün yalnızca farkı uygulayabilmesi için
+            '''CREATE TABLE IF NOT EXISTS degisiklikler (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                dosya_id INTEGER NOT NULL,
+                islem TEXT NOT NULL
+            )''',
+            '''CREATE TRIGGER IF NOT EXISTS degisiklik_insert
+            AFTER INSERT ON dosyalar
+            BEGIN
+                INSERT INTO degisiklikler (dosya_id, islem) VALUES (NEW.id, 'I');
+            END''',
+            '''CREATE TRIGGER IF NOT EXISTS degisiklik_update
+            AFTER UPDATE OF dosya_numarasi, dilekce_son_teslim_tarihi,
+                            ana_avukata_sunum_tarihi, tamamlandi, notlar ON dosyalar
+            BEGIN
+                INSERT INTO degisiklikler (dosya_id, islem) VALUES (NEW.id, 'U');
+            END''',
+            '''CREATE TRIGGER IF NOT EXISTS degisiklik_delete
+            AFTER DELETE ON dosyalar
+            BEGIN
+                INSERT INTO degisiklikler (dosya_id, islem) VALUES (OLD.id, 'D');
+            END''',
+            # Günlük sınırlı kalsın: en son 10000 kayıt tutulur
+            '''CREATE TRIGGER IF NOT EXISTS degisiklik_budama
+            AFTER INSERT ON degisiklikler
+            BEGIN
+                DELETE FROM degisiklikler WHERE seq <= NEW.seq - 10000;
+            END''',
+        )),
+        (4, (
+            # Ertelenen bildirimler: yalnızca bekleyenler tutulur, tetiklenen silinir
+            '''CREATE TABLE IF NOT EXISTS hatirlaticilar (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                zaman INTEGER NOT NULL,
+                baslik TEXT NOT NULL,
+                mesaj TEXT NOT NULL,
+                veri TEXT,
+                olusturma_tarihi DATETIME DEFAULT CURRENT_TIMESTAMP
+            )''',
+            "CREATE INDEX IF NOT EXISTS idx_hatirlaticilar_zaman ON hatirlaticilar(zaman)",
+        )),
+        (5, (
+            # Bildirim gruplamasında sunum tarihi tarafı için (durum, tarih) indeksi
+            '''CREATE INDEX IF NOT EXISTS idx_dosyalar_durum_sunum
+               ON dosyalar(tamamlandi, ana_avukata_sunum_tarihi)''',
+        )),
+        (6, (
+            # Bildirim gönderim defteri: aynı olay aynı kanala bir kez gönderilir
+            '''CREATE TABLE IF NOT EXISTS bildirim_kayitlari (
+                dosya_id INTEGER NOT NULL,
+                olay_turu TEXT NOT NULL,
+                olay_tarihi DATE NOT NULL,
+                kanal TEXT NOT NULL,
+                gonderim_zamani DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (dosya_id, olay_turu, olay_tarihi, kanal)
+            )''',
+            '''CREATE TRIGGER IF NOT EXISTS bildirim_kayitlari_dosya_silme
+            AFTER DELETE ON dosyalar
+            BEGIN
+                DELETE FROM bildirim_kayitlari WHERE dosya_id = OLD.id;
+            END''',
+        )),
+        (7, (
+            # Sunum tarihi artık iş günü olarak hesaplanır (hafta sonu, tatil, adli tatil hariç)
+            _sunum_tarihlerini_is_gunune_cevir,
+        )),
+        (8, (
+            # FTS trigger'ları Python fonksiyonu yerine yerleşik SQL ile katlar
+            _create_fts_triggers,
+        )),
+        (9, (
+            # Defter kaydı önce 'bekliyor' olarak alınır, gösterim sonrası onaylanır
+            _bildirim_durumu_ekle,
+        )),
+    ]
+
+    # Trigram indeksi en az 3 karakterlik aramalarda kullanılabilir
+    FTS_MIN_TERM_LENGTH = 3
+
+    def __init__(self, db_path: str = "hukuk_takip.db",
+                 judicial_calendar: Optional[JudicialCalendar] = None,
+                 row_records: bool = False):
+        """Veritabanı yöneticisini başlat
+
+        Yazmalar tek bir yazıcı thread'inde sırayla yapılır; okumalar her
+        thread'in kendi bağlantısıyla yapılır (WAL sayesinde yazmayı beklemez).
+        row_records açıksa dosya okuyan metotlar sözlük yerine Dosya kaydı
+        döndürür (sözlük arayüzü aynıdır, tarihler date olarak çözülmüştür).
+        """
         self.db_path = db_path
-        self.connection = None
+        self._bellek_uri = None
+        if db_path == ':memory:':
+            # Okuyucular kendi bağlantılarını açabilsin diye adlandırılmış,
+            # paylaşımlı önbellekli bir bellek veritabanı kullanılır
+            self._bellek_uri = f"file:hukuk_takip_{next(_bellek_sayaci)}?mode=memory&cache=shared"
+        # Sunum tarihini hesaplayan iş günü takvimi
+        self.judicial_calendar = judicial_calendar or get_default_calendar()
+        self.row_records = row_records
+        self.connection = None  # Yazıcı bağlantısı
+        self._dosya_cache = OrderedDict()  # id -> dosya (LRU)
+        self._dosya_cache_nesli = 0  # Her geçersiz kılmada artar
+        self._yil_cache = OrderedDict()  # (yıl, tamamlananlar) -> (sayaç, günlük sayılar)
+        self._cache_lock = threading.Lock()
+        self._local = threading.local()
+        self._readers = {}  # thread -> okuyucu bağlantısı
+        self._readers_lock = threading.Lock()
+        self._write_queue = queue.Queue()
+        self._writer_thread = None
         self.connect()
         self.create_tables()
+        self.fts_available = self._table_exists('dosyalar_fts')
+        if self.row_records and self._column_names('dosyalar') != Dosya.FIELDS:
+            # Eski/farklı şemada SELECT * sırası kayıtla eşleşmez; sözlüğe dön
+            logger.warning("dosyalar sütunları Dosya kaydıyla uyuşmuyor, sözlük kullanılacak")
+            self.row_records = False
+        self._start_writer()
     
     def connect(self):
-        """Veritabanına bağlan"""
+        """Veritabanına bağlan (yazıcı bağlantısı, WAL günlük kipi)"""
         try:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row  # Dict benzeri erişim için
+            if self._bellek_uri:
+                # Bellek içi veritabanında WAL yoktur
+                self.connection = _baglanti_ac(self._bellek_uri, uri=True)
+            else:
+                self.connection = _baglanti_ac(self.db_path)
+                # WAL: okuyucular yazıcıyı, yazıcı okuyucuları beklemez
+                self.connection.execute("PRAGMA journal_mode = WAL")
+                self.connection.execute("PRAGMA synchronous = NORMAL")
+        except sqlite3.Error as e:
+            raise Exception(f"Veritabanı bağlantı hatası: {e}")
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """Çağıran thread'e ait okuyucu bağlantıyı getir (yoksa aç)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection
+
+        try:
+            if self._bellek_uri:
+                connection = _baglanti_ac(self._bellek_uri, uri=True)
+                # Paylaşımlı önbellekte tablo kilitleri beklenmeden SQLITE_LOCKED
+                # döner; okuyucu kilit almasın, yazıcıyı da engellemesin
+                connection.execute("PRAGMA read_uncommitted = ON")
+            else:
+                connection = _baglanti_ac(self.db_path)
+            connection.execute("PRAGMA query_only = ON")
         except sqlite3.Error as e:
             raise Exception(f"Veritabanı bağlantı hatası: {e}")
+
+        with self._readers_lock:
+            # Sonlanmış thread'lerin bağlantılarını kapat, havuz küçük kalsın
+            for thread in [t for t in self._readers if not t.is_alive()]:
+                self._readers.pop(thread).close()
+            self._readers[threading.current_thread()] = connection
+
+        self._local.connection = connection
+        return connection
+
+    def _start_writer(self):
+        """Yazma kuyruğunu işleyen thread'i başlat"""
+        self._writer_thread = threading.Thread(
+            target=_yazici_dongusu, args=(self._write_queue,),
+            name="veritabani-yazici", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _submit_write(self, func, *args, **kwargs):
+        """Yazma işlemini yazıcı thread'ine gönder ve sonucunu bekle"""
+        writer = self._writer_thread
+        if writer is None or threading.current_thread() is writer:
+            # Başlatma sırasında veya zaten yazıcı thread'indeyken doğrudan çalıştır
+            return func(*args, **kwargs)
+
+        future = Future()
+        self._write_queue.put((future, func, args, kwargs))
+        return future.result()
+
+    def _table_exists(self, name: str) -> bool:
+        """Tablonun (veya sanal tablonun) var olup olmadığını kontrol et"""
+        row = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone()
+        return row is not None
+
+    def _column_names(self, table: str) -> Tuple[str, ...]:
+        """Tablonun sütun adları (SELECT * sırasıyla)"""
+        return tuple(row['name'] for row in self.connection.execute(f"PRAGMA table_info({table})"))
+
+    def _dosya_cursor(self) -> sqlite3.Cursor:
+        """Dosya satırları için okuyucu imleç (row_records açıksa Dosya üretir)"""
+        cursor = self._read_connection().cursor()
+        if self.row_records:
+            cursor.row_factory = Dosya.row_factory
+        return cursor
+
+    def _dosya_listesi(self, rows) -> List[Dict]:
+        """fetchall sonucunu dosya listesine çevir (kayıtlar zaten hazırsa kopyalamadan)"""
+        if self.row_records:
+            return rows
+        return [dict(row) for row in rows]
     
+    @property
+    def schema_version(self) -> int:
+        """Veritabanının şema sürümü (PRAGMA user_version)"""
+        return self.connection.execute("PRAGMA user_version").fetchone()[0]
+
+    @property
+    def latest_schema_version(self) -> int:
+        """Kodun bildiği en son şema sürümü"""
+        return self.SCHEMA_MIGRATIONS[-1][0] if self.SCHEMA_MIGRATIONS else 0
+
+    @_yazma_islemi
     def create_tables(self):
-        """Gerekli tabloları oluştur"""
+        """Gerekli tabloları oluştur ve şema göçlerini uygula"""
         try:
+            # Güncel veritabanında hiçbir DDL çalıştırma (hızlı açılış)
+            if self.schema_version >= self.latest_schema_version:
+                return
+
             cursor = self.connection.cursor()
             
             # Ana dosyalar tablosu
@@ -47,19 +468,74 @@ class DatabaseManager:
             
             # Trigger - güncelleme tarihini otomatik ayarla
             cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS update_timestamp 
+                CREATE TRIGGER IF NOT EXISTS update_timestamp
                 AFTER UPDATE ON dosyalar
                 BEGIN
-                    UPDATE dosyalar SET guncelleme_tarihi = CURRENT_TIMESTAMP 
+                    UPDATE dosyalar SET guncelleme_tarihi = CURRENT_TIMESTAMP
                     WHERE id = NEW.id;
                 END
             ''')
-            
+
             self.connection.commit()
             
         except sqlite3.Error as e:
             raise Exception(f"Tablo oluşturma hatası: {e}")
+
+        self.migrate()
+
+    @_yazma_islemi
+    def migrate(self):
+        """Bekleyen şema göçlerini sırayla uygula (mevcut dosyayı yerinde yükseltir)"""
+        current_version = self.schema_version
+        cursor = self.connection.cursor()
+
+        for version, statements in self.SCHEMA_MIGRATIONS:
+            if version <= current_version:
+                continue
+
+            try:
+                cursor.execute("BEGIN")
+                for statement in statements:
+                    # Göç adımı SQL metni ya da (imleç, yönetici) alan bir fonksiyon olabilir
+                    if callable(statement):
+                        statement(cursor, self)
+                    else:
+                        cursor.execute(statement)
+                cursor.execute(f"PRAGMA user_version = {int(version)}")
+                self.connection.commit()
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                raise Exception(f"Şema göçü hatası (sürüm {version}): {e}")
+
+            current_version = version
     
+    def _hesapla_sunum_tarihi(self, dilekce_son_teslim_tarihi: str) -> str:
+        """Ana avukata sunum tarihini hesapla (adli takvime göre iş günü öncesi)"""
+        return self.judicial_calendar.sunum_tarihi(dilekce_son_teslim_tarihi)
+
+    @_yazma_islemi
+    def recompute_sunum_tarihleri(self, judicial_calendar: Optional[JudicialCalendar] = None) -> int:
+        """Tüm sunum tarihlerini (yeni kurallarla) tek işlemde yeniden hesapla
+
+        judicial_calendar verilirse bundan sonraki hesaplamalarda da kullanılır.
+        Değişen satır sayısını döndürür.
+        """
+        if judicial_calendar is not None:
+            self.judicial_calendar = judicial_calendar
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            guncellenen = _sunum_tarihlerini_yeniden_yaz(cursor, self.judicial_calendar)
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Sunum tarihi yeniden hesaplama hatası: {e}")
+
+        if guncellenen:
+            self.invalidate_dosya_cache()
+        return guncellenen
+
+    @_yazma_islemi
     def add_dosya(self, dosya_numarasi: str, dilekce_son_teslim_tarihi: str, 
                   notlar: str = "") -> bool:
         """Yeni dosya ekle"""
@@ -68,17 +544,15 @@ class DatabaseManager:
             if not dosya_numarasi or not dosya_numarasi.strip():
                 raise ValueError("Dosya numarası boş olamaz")
             
-            # Ana avukata sunum tarihini hesapla (2 takvim günü öncesi)
-            dilekce_tarihi = datetime.strptime(dilekce_son_teslim_tarihi, "%Y-%m-%d")
-            sunum_tarihi = dilekce_tarihi - timedelta(days=2)
+            # Ana avukata sunum tarihini hesapla
+            sunum_tarihi = self._hesapla_sunum_tarihi(dilekce_son_teslim_tarihi)
             
             cursor = self.connection.cursor()
             cursor.execute('''
                 INSERT INTO dosyalar 
                 (dosya_numarasi, dilekce_son_teslim_tarihi, ana_avukata_sunum_tarihi, notlar)
                 VALUES (?, ?, ?, ?)
-            ''', (dosya_numarasi, dilekce_son_teslim_tarihi, 
-                  sunum_tarihi.strftime("%Y-%m-%d"), notlar))
+            ''', (dosya_numarasi, dilekce_son_teslim_tarihi, sunum_tarihi, notlar))
             
             self.connection.commit()
             return True
@@ -90,6 +564,169 @@ class DatabaseManager:
         except ValueError as e:
             raise Exception(f"Tarih formatı hatası: {e}")
     
+    # Toplu ekleme sonuç durumları
+    BULK_INSERTED = 'eklendi'
+    BULK_DUPLICATE = 'mevcut'
+    BULK_INVALID = 'gecersiz'
+
+    # IN (...) sorgularında tek seferde kullanılacak parametre sayısı
+    _IN_CHUNK_SIZE = 500
+
+    # get_dosya_by_id için bellekte tutulan en fazla satır sayısı
+    DOSYA_CACHE_SIZE = 256
+
+    # get_year_event_counts için bellekte tutulan en fazla yıl sayısı
+    YIL_CACHE_SIZE = 4
+
+    # Onaylanmamış bildirim talebinin geçerlilik süresi (saniye); bu süre
+    # dolunca (ör. gösterim öncesi çökme) olay yeniden talep edilebilir
+    BILDIRIM_TALEP_SURESI = 600
+
+    @_yazma_islemi
+    def add_dosyalar_bulk(self, dosyalar: Iterable) -> List[Dict]:
+        """Çok sayıda dosyayı tek işlemde (executemany) ekle
+
+        Her öğe (dosya_numarasi, dilekce_son_teslim_tarihi[, notlar]) demeti ya da
+        aynı anahtarları içeren bir sözlük olabilir. Geçersiz veya zaten mevcut
+        satırlar toplu işlemi durdurmaz; girdi sırasıyla her satır için
+        {'dosya_numarasi', 'durum', 'hata'} döner. 'durum' değeri BULK_INSERTED,
+        BULK_DUPLICATE veya BULK_INVALID olur.
+        """
+        results = []
+        candidates = []  # (sonuç indeksi, insert parametreleri)
+        seen = set()
+
+        # 1) Doğrulama ve sunum tarihi hesaplama (veritabanına dokunmadan)
+        for item in dosyalar:
+            dosya_numarasi = None
+            try:
+                if isinstance(item, dict):
+                    dosya_numarasi = item.get('dosya_numarasi')
+                    dilekce_son_teslim_tarihi = item.get('dilekce_son_teslim_tarihi')
+                    notlar = item.get('notlar') or ""
+                else:
+                    dosya_numarasi, dilekce_son_teslim_tarihi = item[0], item[1]
+                    notlar = (item[2] if len(item) > 2 else "") or ""
+
+                if not dosya_numarasi or not str(dosya_numarasi).strip():
+                    raise ValueError("Dosya numarası boş olamaz")
+                sunum_tarihi = self._hesapla_sunum_tarihi(dilekce_son_teslim_tarihi)
+            except (TypeError, ValueError, IndexError) as e:
+                results.append({'dosya_numarasi': dosya_numarasi,
+                                'durum': self.BULK_INVALID, 'hata': str(e)})
+                continue
+
+            if dosya_numarasi in seen:
+                results.append({'dosya_numarasi': dosya_numarasi, 'durum': self.BULK_DUPLICATE,
+                                'hata': f"'{dosya_numarasi}' numaralı dosya listede tekrar ediyor"})
+                continue
+
+            seen.add(dosya_numarasi)
+            results.append({'dosya_numarasi': dosya_numarasi,
+                            'durum': self.BULK_INSERTED, 'hata': None})
+            candidates.append((len(results) - 1,
+                               (dosya_numarasi, dilekce_son_teslim_tarihi, sunum_tarihi, notlar)))
+
+        if not candidates:
+            return results
+
+        # 2) Mevcut kayıt kontrolü ve ekleme tek yazma işlemi içinde
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+
+            existing = self._mevcut_numaralar(cursor, [params[0] for _, params in candidates])
+
+            rows = []
+            for index, params in candidates:
+                if params[0] in existing:
+                    results[index]['durum'] = self.BULK_DUPLICATE
+                    results[index]['hata'] = f"'{params[0]}' numaralı dosya zaten mevcut!"
+                else:
+                    rows.append(params)
+
+            cursor.executemany('''
+                INSERT INTO dosyalar
+                (dosya_numarasi, dilekce_son_teslim_tarihi, ana_avukata_sunum_tarihi, notlar)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+
+            self.connection.commit()
+            return results
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Toplu dosya ekleme hatası: {e}")
+
+    def _mevcut_numaralar(self, cursor, numaralar: List[str]) -> set:
+        """Verilen dosya numaralarından veritabanında bulunanları döndür"""
+        existing = set()
+        for i in range(0, len(numaralar), self._IN_CHUNK_SIZE):
+            chunk = numaralar[i:i + self._IN_CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor.execute(
+                f"SELECT dosya_numarasi FROM dosyalar WHERE dosya_numarasi IN ({placeholders})",
+                chunk
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
+    @_yazma_islemi
+    def upsert_dosyalar(self, dosyalar: Iterable[Tuple]) -> Dict[str, int]:
+        """Dosyaları dosya numarasına göre ekle ya da güncelle (tek işlem)
+
+        Öğeler (dosya_numarasi, dilekce_son_teslim_tarihi, notlar[, tamamlandi])
+        demetleridir; notlar veya tamamlandi None ise mevcut kaydın değeri
+        korunur. Aynı numara birden fazla kez geçerse son satır geçerli olur.
+        """
+        try:
+            # Numara -> (tarih, sunum tarihi, notlar, tamamlandı); sıra korunur
+            rows = {}
+            for item in dosyalar:
+                dosya_numarasi, dilekce_son_teslim_tarihi, notlar = item[:3]
+                tamamlandi = item[3] if len(item) > 3 else None
+                rows[dosya_numarasi] = (dilekce_son_teslim_tarihi,
+                                        self._hesapla_sunum_tarihi(dilekce_son_teslim_tarihi),
+                                        notlar, tamamlandi)
+        except ValueError as e:
+            raise Exception(f"Tarih formatı hatası: {e}")
+
+        if not rows:
+            return {'eklenen': 0, 'guncellenen': 0}
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            existing = self._mevcut_numaralar(cursor, list(rows.keys()))
+
+            cursor.executemany('''
+                UPDATE dosyalar
+                SET dilekce_son_teslim_tarihi = ?, ana_avukata_sunum_tarihi = ?,
+                    notlar = COALESCE(?, notlar), tamamlandi = COALESCE(?, tamamlandi)
+                WHERE dosya_numarasi = ?
+            ''', [(tarih, sunum, notlar, tamamlandi, numara)
+                  for numara, (tarih, sunum, notlar, tamamlandi) in rows.items()
+                  if numara in existing])
+
+            cursor.executemany('''
+                INSERT INTO dosyalar
+                (dosya_numarasi, dilekce_son_teslim_tarihi, ana_avukata_sunum_tarihi,
+                 notlar, tamamlandi)
+                VALUES (?, ?, ?, ?, ?)
+            ''', [(numara, tarih, sunum, notlar or "", bool(tamamlandi))
+                  for numara, (tarih, sunum, notlar, tamamlandi) in rows.items()
+                  if numara not in existing])
+
+            self.connection.commit()
+            if existing:
+                self.invalidate_dosya_cache()
+            return {'eklenen': len(rows) - len(existing), 'guncellenen': len(existing)}
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Toplu güncelleme hatası: {e}")
+
+    @_yazma_islemi
     def update_dosya(self, dosya_id: int, dosya_numarasi: str = None, 
                      dilekce_son_teslim_tarihi: str = None, 
                      notlar: str = None, tamamlandi: bool = None) -> bool:
@@ -110,10 +747,8 @@ class DatabaseManager:
                 params.append(dilekce_son_teslim_tarihi)
                 
                 # Ana avukata sunum tarihini yeniden hesapla
-                dilekce_tarihi = datetime.strptime(dilekce_son_teslim_tarihi, "%Y-%m-%d")
-                sunum_tarihi = dilekce_tarihi - timedelta(days=2)
                 updates.append("ana_avukata_sunum_tarihi = ?")
-                params.append(sunum_tarihi.strftime("%Y-%m-%d"))
+                params.append(self._hesapla_sunum_tarihi(dilekce_son_teslim_tarihi))
             
             if notlar is not None:
                 updates.append("notlar = ?")
@@ -132,6 +767,7 @@ class DatabaseManager:
             cursor.execute(query, params)
             
             self.connection.commit()
+            self.invalidate_dosya_cache([dosya_id])
             return cursor.rowcount > 0
             
         except sqlite3.IntegrityError:
@@ -141,12 +777,14 @@ class DatabaseManager:
         except ValueError as e:
             raise Exception(f"Tarih formatı hatası: {e}")
     
+    @_yazma_islemi
     def delete_dosya(self, dosya_id: int) -> bool:
         """Dosyayı sil"""
         try:
             cursor = self.connection.cursor()
             cursor.execute("DELETE FROM dosyalar WHERE id = ?", (dosya_id,))
             self.connection.commit()
+            self.invalidate_dosya_cache([dosya_id])
             return cursor.rowcount > 0
         except sqlite3.Error as e:
             raise Exception(f"Dosya silme hatası: {e}")
@@ -154,7 +792,7 @@ class DatabaseManager:
     def get_all_dosyalar(self, include_completed: bool = True, limit: int = None, offset: int = 0) -> List[Dict]:
         """Tüm dosyaları getir (pagination desteği ile)"""
         try:
-            cursor = self.connection.cursor()
+            cursor = self._dosya_cursor()
             
             base_query = '''
                 SELECT * FROM dosyalar 
@@ -169,25 +807,160 @@ class DatabaseManager:
                 where_clause = "WHERE tamamlandi = FALSE"
                 params = []
             
-            # Pagination parametreleri
+            # Pagination parametreleri (bağlı parametre olarak)
             pagination_clause = ""
             if limit is not None:
-                pagination_clause = f" LIMIT {limit}"
-                if offset > 0:
-                    pagination_clause += f" OFFSET {offset}"
+                pagination_clause = " LIMIT ? OFFSET ?"
+                params.extend([int(limit), int(offset)])
             
             query = base_query.format(where_clause) + pagination_clause
             cursor.execute(query, params)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return self._dosya_listesi(cursor.fetchall())
             
         except sqlite3.Error as e:
             raise Exception(f"Dosyalar getirme hatası: {e}")
     
+    def get_dosyalar_page(self, include_completed: bool = True,
+                          after: Optional[Tuple[str, int]] = None,
+                          before: Optional[Tuple[str, int]] = None,
+                          limit: int = 200) -> List[Dict]:
+        """Keyset sayfalama: (dilekce_son_teslim_tarihi, id) sırasında bir sayfa getir
+
+        after verilirse bu anahtardan sonraki, before verilirse bu anahtardan
+        önceki satırlar döner; her iki durumda da sonuç artan sıradadır. OFFSET
+        kullanılmadığından maliyet sayfanın konumundan bağımsızdır.
+        """
+        conditions = []
+        params = []
+
+        if not include_completed:
+            conditions.append("tamamlandi = FALSE")
+
+        order = "ASC"
+        if after is not None:
+            conditions.append("(dilekce_son_teslim_tarihi, id) > (?, ?)")
+            params.extend(after)
+        elif before is not None:
+            conditions.append("(dilekce_son_teslim_tarihi, id) < (?, ?)")
+            params.extend(before)
+            order = "DESC"
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(int(limit))
+
+        try:
+            cursor = self._dosya_cursor()
+            cursor.execute(f'''
+                SELECT * FROM dosyalar
+                {where_clause}
+                ORDER BY dilekce_son_teslim_tarihi {order}, id {order}
+                LIMIT ?
+            ''', params)
+
+            rows = self._dosya_listesi(cursor.fetchall())
+            if order == "DESC":
+                rows.reverse()
+            return rows
+
+        except sqlite3.Error as e:
+            raise Exception(f"Sayfa getirme hatası: {e}")
+
+    def iter_dosyalar(self, include_completed: bool = True, start_date: str = None,
+                      end_date: str = None, batch_size: int = 1000) -> Iterator[Dict]:
+        """Dosyaları fetchmany partileriyle tek tek üret (tüm tabloyu belleğe almaz)
+
+        start_date / end_date verilirse son teslim tarihine göre filtrelenir.
+        """
+        conditions = []
+        params = []
+
+        if not include_completed:
+            conditions.append("tamamlandi = FALSE")
+        if start_date is not None:
+            conditions.append("dilekce_son_teslim_tarihi >= ?")
+            params.append(start_date)
+        if end_date is not None:
+            conditions.append("dilekce_son_teslim_tarihi <= ?")
+            params.append(end_date)
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        try:
+            cursor = self._dosya_cursor()
+            cursor.execute(f'''
+                SELECT * FROM dosyalar
+                {where_clause}
+                ORDER BY dilekce_son_teslim_tarihi ASC, id ASC
+            ''', params)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from self._dosya_listesi(rows)
+
+        except sqlite3.Error as e:
+            raise Exception(f"Dosyalar getirme hatası: {e}")
+
+    def get_change_counter(self) -> int:
+        """Değişiklik sayacı: dosyalar tablosundaki her yazmada artar"""
+        try:
+            row = self._read_connection().execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM degisiklikler"
+            ).fetchone()
+            return row[0]
+        except sqlite3.Error as e:
+            raise Exception(f"Değişiklik sayacı hatası: {e}")
+
+    def get_changes_since(self, seq: int) -> Tuple[int, Optional[List[int]]]:
+        """Verilen sayaçtan sonra değişen dosya id'lerini getir
+
+        (yeni sayaç, id listesi) döner. Günlük budandığı için aradaki kayıtlar
+        artık yoksa id listesi None olur; çağıran tam yenileme yapmalıdır.
+        """
+        try:
+            cursor = self._read_connection().cursor()
+            cursor.execute('''
+                SELECT seq, dosya_id FROM degisiklikler
+                WHERE seq > ? ORDER BY seq ASC
+            ''', (seq,))
+            rows = cursor.fetchall()
+            if not rows:
+                return seq, []
+
+            if seq > 0 and rows[0]['seq'] > seq + 1:
+                # Watermark'tan sonraki kayıtların bir kısmı budanmış
+                oldest = cursor.execute("SELECT MIN(seq) FROM degisiklikler").fetchone()[0]
+                if oldest > seq + 1:
+                    return rows[-1]['seq'], None
+
+            # Sırayı koruyarak tekilleştir
+            ids = list(dict.fromkeys(row['dosya_id'] for row in rows))
+            return rows[-1]['seq'], ids
+
+        except sqlite3.Error as e:
+            raise Exception(f"Değişiklik getirme hatası: {e}")
+
+    def get_dosyalar_by_ids(self, dosya_ids: List[int]) -> Dict[int, Dict]:
+        """Birden fazla dosyayı birincil anahtar ile getir (id -> dosya)"""
+        try:
+            cursor = self._dosya_cursor()
+            dosyalar = {}
+            for i in range(0, len(dosya_ids), self._IN_CHUNK_SIZE):
+                chunk = dosya_ids[i:i + self._IN_CHUNK_SIZE]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(f"SELECT * FROM dosyalar WHERE id IN ({placeholders})", chunk)
+                for dosya in self._dosya_listesi(cursor.fetchall()):
+                    dosyalar[dosya['id']] = dosya
+            return dosyalar
+        except sqlite3.Error as e:
+            raise Exception(f"Dosya getirme hatası: {e}")
+
     def get_dosya_count(self, include_completed: bool = True) -> int:
         """Toplam dosya sayısını getir"""
         try:
-            cursor = self.connection.cursor()
+            cursor = self._read_connection().cursor()
             
             if include_completed:
                 cursor.execute("SELECT COUNT(*) as count FROM dosyalar")
@@ -200,35 +973,98 @@ class DatabaseManager:
             raise Exception(f"Dosya sayısı getirme hatası: {e}")
     
     def get_dosya_by_id(self, dosya_id: int) -> Optional[Dict]:
-        """ID'ye göre dosya getir"""
+        """ID'ye göre dosya getir (önbellekten, yoksa birincil anahtar ile)"""
+        with self._cache_lock:
+            cached = self._dosya_cache.get(dosya_id)
+            if cached is not None:
+                self._dosya_cache.move_to_end(dosya_id)
+                return cached.copy()
+            nesil = self._dosya_cache_nesli
+
         try:
-            cursor = self.connection.cursor()
+            cursor = self._dosya_cursor()
             cursor.execute("SELECT * FROM dosyalar WHERE id = ?", (dosya_id,))
             row = cursor.fetchone()
-            return dict(row) if row else None
         except sqlite3.Error as e:
             raise Exception(f"Dosya getirme hatası: {e}")
+
+        if row is None:
+            return None
+
+        dosya = row if self.row_records else dict(row)
+        with self._cache_lock:
+            # Okuma sırasında bir yazma önbelleği geçersiz kıldıysa satır eski
+            # olabilir; önbelleğe alınmaz
+            if nesil != self._dosya_cache_nesli:
+                return dosya.copy()
+            self._dosya_cache[dosya_id] = dosya
+            if len(self._dosya_cache) > self.DOSYA_CACHE_SIZE:
+                self._dosya_cache.popitem(last=False)
+        return dosya.copy()
+
+    def invalidate_dosya_cache(self, dosya_ids: Iterable[int] = None):
+        """Satır önbelleğini temizle (başka bağlantıların yazdığı değişiklikler için)"""
+        with self._cache_lock:
+            self._dosya_cache_nesli += 1
+            if dosya_ids is None:
+                self._dosya_cache.clear()
+                return
+            for dosya_id in dosya_ids:
+                self._dosya_cache.pop(dosya_id, None)
     
     def search_dosyalar(self, search_term: str) -> List[Dict]:
-        """Dosya numarasına göre arama yap"""
+        """Dosya numarası ve notlarda arama yap (sıralı sonuç)
+
+        Dosya numarası tam eşleşmeleri önce, ardından önek eşleşmeleri,
+        sonra FTS5 (bm25) alaka sırası gelir.
+        """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                SELECT * FROM dosyalar 
-                WHERE dosya_numarasi LIKE ? OR notlar LIKE ?
-                ORDER BY dilekce_son_teslim_tarihi ASC
-            ''', (f"%{search_term}%", f"%{search_term}%"))
+            cursor = self._dosya_cursor()
+            katli_terim = turkce_katla(search_term.strip())
+
+            if self.fts_available and len(katli_terim) >= self.FTS_MIN_TERM_LENGTH:
+                # Trigram indeksi: alt dize eşleşmesi için tırnaklı ifade
+                fts_sorgu = '"' + katli_terim.replace('"', '""') + '"'
+                cursor.execute('''
+                    SELECT d.* FROM dosyalar_fts f
+                    JOIN dosyalar d ON d.id = f.rowid
+                    WHERE dosyalar_fts MATCH ?
+                    ORDER BY (f.dosya_numarasi = ?) DESC,
+                             (substr(f.dosya_numarasi, 1, ?) = ?) DESC,
+                             f.rank ASC,
+                             d.dilekce_son_teslim_tarihi ASC
+                ''', (fts_sorgu, katli_terim, len(katli_terim), katli_terim))
+            elif self.fts_available:
+                # Kısa terimler: indeksin zaten katlanmış metni üzerinde LIKE taraması.
+                # FTS5'in içerik tablosu (c0 = dosya_numarasi, c1 = notlar) sanal
+                # tablodan çok daha hızlı taranır; satır başına Python çağrısı yoktur
+                cursor.execute('''
+                    SELECT * FROM dosyalar
+                    WHERE id IN (
+                        SELECT id FROM dosyalar_fts_content
+                        WHERE c0 LIKE ? OR c1 LIKE ?
+                    )
+                    ORDER BY dilekce_son_teslim_tarihi ASC
+                ''', (f"%{katli_terim}%", f"%{katli_terim}%"))
+            else:
+                # FTS5 yoksa katlama yerleşik SQL fonksiyonlarıyla yapılır
+                cursor.execute(f'''
+                    SELECT * FROM dosyalar
+                    WHERE {_sql_turkce_katla('dosya_numarasi')} LIKE ?
+                       OR {_sql_turkce_katla('notlar')} LIKE ?
+                    ORDER BY dilekce_son_teslim_tarihi ASC
+                ''', (f"%{katli_terim}%", f"%{katli_terim}%"))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return self._dosya_listesi(cursor.fetchall())
             
         except sqlite3.Error as e:
             raise Exception(f"Arama hatası: {e}")
     
-    def get_upcoming_deadlines(self, days_ahead: int = 7) -> List[Dict]:
-        """Yaklaşan son tarihleri getir"""
+    def get_upcoming_deadlines(self, days_ahead: int = 7, today=None) -> List[Dict]:
+        """Yaklaşan son tarihleri getir (today verilmezse bugünden itibaren)"""
         try:
-            cursor = self.connection.cursor()
-            today = datetime.now().date()
+            cursor = self._dosya_cursor()
+            today = today or datetime.now().date()
             end_date = today + timedelta(days=days_ahead)
             
             cursor.execute('''
@@ -240,15 +1076,166 @@ class DatabaseManager:
             ''', (today.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"),
                   today.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return self._dosya_listesi(cursor.fetchall())
             
         except sqlite3.Error as e:
             raise Exception(f"Yaklaşan tarihler getirme hatası: {e}")
     
+    def get_notification_buckets(self, days_ahead: int = 7, today=None,
+                                 kanal: str = None) -> List[Dict]:
+        """Bildirimler için tarih ve olay türüne göre gruplanmış aktif dosyalar
+
+        Her grup: olay_tarihi, olay_turu ('son_teslim' / 'sunum'), kalan_gun,
+        tarih_str (GG.AA.YYYY) ve dosyalar [{'id', 'dosya_numarasi'}].
+        Gruplama ve gün farkı tek sorguda SQL tarafında hesaplanır. kanal
+        verilirse o kanala daha önce gönderilmiş olaylar dışarıda bırakılır.
+        """
+        try:
+            cursor = self._read_connection().cursor()
+            return self._notification_buckets(cursor, days_ahead, today, kanal)
+        except sqlite3.Error as e:
+            raise Exception(f"Bildirim gruplama hatası: {e}")
+
+    @_yazma_islemi
+    def claim_notification_buckets(self, days_ahead: int, today=None,
+                                   kanal: str = 'masaustu') -> List[Dict]:
+        """Kanala henüz gönderilmemiş bildirim gruplarını al ve 'bekliyor' olarak işaretle
+
+        Hesaplama ve işaretleme tek BEGIN IMMEDIATE işleminde yapılır; aynı
+        veritabanını kullanan birden fazla uygulama aynı olayı iki kez göndermez.
+        Gösterimden sonra confirm_notification_claims, gösterilemezse
+        release_notification_claims çağrılmalıdır; ikisi de çağrılmazsa talep
+        BILDIRIM_TALEP_SURESI sonunda düşer ve olay yeniden gönderilir.
+        """
+        today = today or datetime.now().date()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            buckets = self._notification_buckets(cursor, days_ahead, today, kanal)
+            # Süresi dolmuş talepler REPLACE ile yenilenir
+            cursor.executemany('''
+                INSERT OR REPLACE INTO bildirim_kayitlari
+                    (dosya_id, olay_turu, olay_tarihi, kanal, durum, gonderim_zamani)
+                VALUES (?, ?, ?, ?, 'bekliyor', CURRENT_TIMESTAMP)
+            ''', self._bildirim_anahtarlari(buckets, kanal))
+            # Geçmiş olaylar bir daha sorgulanmaz; defter küçük kalsın
+            cursor.execute("DELETE FROM bildirim_kayitlari WHERE olay_tarihi < ?",
+                           (today.strftime("%Y-%m-%d"),))
+            self.connection.commit()
+            return buckets
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Bildirim kaydı hatası: {e}")
+
+    @_yazma_islemi
+    def confirm_notification_claims(self, buckets: List[Dict], kanal: str = 'masaustu'):
+        """Talep edilen bildirimleri gönderildi olarak onayla"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany('''
+                UPDATE bildirim_kayitlari
+                SET durum = 'gonderildi', gonderim_zamani = CURRENT_TIMESTAMP
+                WHERE dosya_id = ? AND olay_turu = ? AND olay_tarihi = ? AND kanal = ?
+            ''', self._bildirim_anahtarlari(buckets, kanal))
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Bildirim onaylama hatası: {e}")
+
+    @_yazma_islemi
+    def release_notification_claims(self, buckets: List[Dict], kanal: str = 'masaustu'):
+        """Gösterilemeyen bildirimlerin talebini bırak (sonraki kontrolde tekrar gönderilir)"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany('''
+                DELETE FROM bildirim_kayitlari
+                WHERE dosya_id = ? AND olay_turu = ? AND olay_tarihi = ? AND kanal = ?
+                  AND durum = 'bekliyor'
+            ''', self._bildirim_anahtarlari(buckets, kanal))
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Bildirim talebi bırakma hatası: {e}")
+
+    @staticmethod
+    def _bildirim_anahtarlari(buckets: List[Dict], kanal: str) -> List[Tuple]:
+        """Gruplardaki her olayın defter anahtarı (dosya_id, olay_turu, olay_tarihi, kanal)"""
+        return [(dosya['id'], bucket['olay_turu'], bucket['olay_tarihi'], kanal)
+                for bucket in buckets for dosya in bucket['dosyalar']]
+
+    @classmethod
+    def _notification_buckets(cls, cursor, days_ahead: int, today,
+                              kanal: Optional[str]) -> List[Dict]:
+        """Bildirim gruplarını verilen imleçle hesapla"""
+        today = today or datetime.now().date()
+        bugun = today.strftime("%Y-%m-%d")
+        bitis = (today + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
+
+        # Gönderim defteriyle anti-join (birincil anahtar araması): gönderilmiş
+        # veya süresi dolmamış bir talebi olan olaylar dışarıda kalır
+        gonderilmemis = '''
+            AND NOT EXISTS (
+                SELECT 1 FROM bildirim_kayitlari b
+                WHERE b.dosya_id = dosyalar.id AND b.olay_turu = '{tur}'
+                  AND b.olay_tarihi = dosyalar.{sutun} AND b.kanal = ?
+                  AND (b.durum = 'gonderildi' OR b.gonderim_zamani > datetime('now', ?))
+            )'''
+        talep_siniri = f"-{int(cls.BILDIRIM_TALEP_SURESI)} seconds"
+        son_teslim_filtre = sunum_filtre = ''
+        params = [bugun, bugun, bitis]
+        if kanal is not None:
+            son_teslim_filtre = gonderilmemis.format(tur='son_teslim', sutun='dilekce_son_teslim_tarihi')
+            sunum_filtre = gonderilmemis.format(tur='sunum', sutun='ana_avukata_sunum_tarihi')
+            params += [kanal, talep_siniri]
+        params += [bugun, bitis]
+        if kanal is not None:
+            params += [kanal, talep_siniri]
+
+        cursor.execute(f'''
+            SELECT olay_tarihi, olay_turu,
+                   CAST(julianday(olay_tarihi) - julianday(?) AS INTEGER) AS kalan_gun,
+                   strftime('%d.%m.%Y', olay_tarihi) AS tarih_str,
+                   group_concat(id, ',') AS idler,
+                   group_concat(dosya_numarasi, char(31)) AS numaralar
+            FROM (
+                SELECT id, dosya_numarasi,
+                       dilekce_son_teslim_tarihi AS olay_tarihi, 'son_teslim' AS olay_turu
+                FROM dosyalar
+                WHERE tamamlandi = FALSE AND dilekce_son_teslim_tarihi BETWEEN ? AND ?
+                {son_teslim_filtre}
+                UNION ALL
+                SELECT id, dosya_numarasi,
+                       ana_avukata_sunum_tarihi AS olay_tarihi, 'sunum' AS olay_turu
+                FROM dosyalar
+                WHERE tamamlandi = FALSE AND ana_avukata_sunum_tarihi BETWEEN ? AND ?
+                {sunum_filtre}
+            )
+            GROUP BY olay_tarihi, olay_turu
+            ORDER BY olay_tarihi ASC, olay_turu ASC
+        ''', params)
+
+        buckets = []
+        for row in cursor.fetchall():
+            # İki group_concat aynı satır sırasıyla üretildiği için eşleşir
+            dosyalar = [
+                {'id': int(dosya_id), 'dosya_numarasi': numara}
+                for dosya_id, numara in zip(row['idler'].split(','),
+                                            row['numaralar'].split('\x1f'))
+            ]
+            dosyalar.sort(key=lambda d: d['dosya_numarasi'])
+            buckets.append({
+                'olay_tarihi': row['olay_tarihi'],
+                'olay_turu': row['olay_turu'],
+                'kalan_gun': row['kalan_gun'],
+                'tarih_str': row['tarih_str'],
+                'dosyalar': dosyalar
+            })
+        return buckets
+
     def get_dosyalar_by_date(self, target_date: str) -> List[Dict]:
         """Belirli tarihteki dosyaları getir"""
         try:
-            cursor = self.connection.cursor()
+            cursor = self._dosya_cursor()
             cursor.execute('''
                 SELECT * FROM dosyalar 
                 WHERE dilekce_son_teslim_tarihi = ? 
@@ -256,52 +1243,246 @@ class DatabaseManager:
                 ORDER BY dilekce_son_teslim_tarihi ASC
             ''', (target_date, target_date))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return self._dosya_listesi(cursor.fetchall())
             
         except sqlite3.Error as e:
             raise Exception(f"Tarihe göre dosya getirme hatası: {e}")
-    
+
+    def get_dosyalar_by_range(self, start_date: str, end_date: str) -> Dict[str, List[Dict]]:
+        """Tarih aralığındaki dosyaları tarihe ve olay türüne göre gruplu getir
+
+        Dönüş: {'YYYY-MM-DD': [{'dosya': {...}, 'type': 'dilekce' | 'sunum'}, ...]}
+        """
+        try:
+            cursor = self._read_connection().cursor()
+            # Her kol kendi tarih indeksini kullanır
+            cursor.execute('''
+                SELECT dilekce_son_teslim_tarihi AS olay_tarihi, 'dilekce' AS olay_turu, *
+                FROM dosyalar
+                WHERE dilekce_son_teslim_tarihi BETWEEN ? AND ?
+                UNION ALL
+                SELECT ana_avukata_sunum_tarihi AS olay_tarihi, 'sunum' AS olay_turu, *
+                FROM dosyalar
+                WHERE ana_avukata_sunum_tarihi BETWEEN ? AND ?
+                ORDER BY olay_tarihi ASC, dilekce_son_teslim_tarihi ASC
+            ''', (start_date, end_date, start_date, end_date))
+
+            dosyalar_by_date = {}
+            for row in cursor.fetchall():
+                if self.row_records:
+                    # İlk iki sütun olay bilgisi, kalanı SELECT * sırasıyla dosya satırı
+                    olay_tarihi, olay_turu, dosya = row[0], row[1], Dosya(*row[2:])
+                else:
+                    dosya = dict(row)
+                    olay_tarihi = dosya.pop('olay_tarihi')
+                    olay_turu = dosya.pop('olay_turu')
+                dosyalar_by_date.setdefault(olay_tarihi, []).append({
+                    'dosya': dosya,
+                    'type': olay_turu
+                })
+
+            return dosyalar_by_date
+
+        except sqlite3.Error as e:
+            raise Exception(f"Tarih aralığı getirme hatası: {e}")
+
+    def get_daily_event_counts(self, start_date: str, end_date: str,
+                               include_completed: bool = False) -> Dict[str, Tuple[int, int]]:
+        """Tarih aralığındaki günlük olay sayılarını tek GROUP BY sorgusuyla getir
+
+        Dönüş: {'YYYY-MM-DD': (son teslim sayısı, sunum sayısı)}; olay olmayan
+        günler yer almaz. Satırlar okunmaz, yalnızca tarih indeksleri taranır.
+        """
+        durum = "" if include_completed else "AND tamamlandi = FALSE"
+        try:
+            cursor = self._read_connection().cursor()
+            cursor.execute(f'''
+                SELECT olay_tarihi,
+                       SUM(olay_turu = 'dilekce') AS dilekce,
+                       SUM(olay_turu = 'sunum') AS sunum
+                FROM (
+                    SELECT dilekce_son_teslim_tarihi AS olay_tarihi, 'dilekce' AS olay_turu
+                    FROM dosyalar
+                    WHERE dilekce_son_teslim_tarihi BETWEEN ? AND ? {durum}
+                    UNION ALL
+                    SELECT ana_avukata_sunum_tarihi, 'sunum'
+                    FROM dosyalar
+                    WHERE ana_avukata_sunum_tarihi BETWEEN ? AND ? {durum}
+                )
+                GROUP BY olay_tarihi
+            ''', (start_date, end_date, start_date, end_date))
+
+            return {row['olay_tarihi']: (row['dilekce'], row['sunum']) for row in cursor}
+
+        except sqlite3.Error as e:
+            raise Exception(f"Günlük olay sayısı hatası: {e}")
+
+    def get_year_event_counts(self, year: int,
+                              include_completed: bool = False) -> Dict[str, Tuple[int, int]]:
+        """Yılın günlük olay sayıları (veritabanı değişmedikçe önbellekten)
+
+        Önbellekteki sözlüğün kopyası döner; çağıranın değişiklikleri önbelleği bozmaz.
+        """
+        key = (year, include_completed)
+        seq = self.get_change_counter()
+        with self._cache_lock:
+            cached = self._yil_cache.get(key)
+            if cached is not None and cached[0] == seq:
+                self._yil_cache.move_to_end(key)
+                return dict(cached[1])
+
+        counts = self.get_daily_event_counts(f"{year}-01-01", f"{year}-12-31",
+                                             include_completed)
+        with self._cache_lock:
+            self._yil_cache[key] = (seq, counts)
+            self._yil_cache.move_to_end(key)
+            if len(self._yil_cache) > self.YIL_CACHE_SIZE:
+                self._yil_cache.popitem(last=False)
+        return dict(counts)
+
     def get_statistics(self) -> Dict:
         """İstatistikleri getir"""
+        snapshot = self.get_dashboard_snapshot()
+        return {
+            'toplam_dosya': snapshot['toplam_dosya'],
+            'tamamlanan_dosya': snapshot['tamamlanan_dosya'],
+            'aktif_dosya': snapshot['aktif_dosya'],
+            'bu_hafta_son_tarih': snapshot['bu_hafta_son_tarih']
+        }
+
+    def get_dashboard_snapshot(self, today=None) -> Dict:
+        """Durum çubuğu ve dashboard sayılarını tek toplama sorgusuyla getir
+
+        Acil: son teslimi 3 gün içinde olan (veya geçmiş) aktif dosyalar.
+        """
+        today = today or datetime.now().date()
+        bugun = today.strftime("%Y-%m-%d")
+        hafta_sonu = (today + timedelta(days=7)).strftime("%Y-%m-%d")
+        acil_sinir = (today + timedelta(days=3)).strftime("%Y-%m-%d")
+
         try:
-            cursor = self.connection.cursor()
-            
-            # Toplam dosya sayısı
-            cursor.execute("SELECT COUNT(*) as toplam FROM dosyalar")
-            toplam = cursor.fetchone()['toplam']
-            
-            # Tamamlanan dosya sayısı
-            cursor.execute("SELECT COUNT(*) as tamamlanan FROM dosyalar WHERE tamamlandi = TRUE")
-            tamamlanan = cursor.fetchone()['tamamlanan']
-            
-            # Aktif dosya sayısı
-            aktif = toplam - tamamlanan
-            
-            # Bu hafta son tarihi olan dosyalar
-            today = datetime.now().date()
-            week_end = today + timedelta(days=7)
+            cursor = self._read_connection().cursor()
             cursor.execute('''
-                SELECT COUNT(*) as bu_hafta FROM dosyalar 
-                WHERE dilekce_son_teslim_tarihi BETWEEN ? AND ?
-                AND tamamlandi = FALSE
-            ''', (today.strftime("%Y-%m-%d"), week_end.strftime("%Y-%m-%d")))
-            bu_hafta = cursor.fetchone()['bu_hafta']
-            
+                SELECT
+                    COUNT(*) AS toplam,
+                    COALESCE(SUM(CASE WHEN tamamlandi THEN 1 ELSE 0 END), 0) AS tamamlanan,
+                    COALESCE(SUM(CASE WHEN NOT tamamlandi
+                                      AND dilekce_son_teslim_tarihi BETWEEN ? AND ?
+                                      THEN 1 ELSE 0 END), 0) AS bu_hafta,
+                    COALESCE(SUM(CASE WHEN NOT tamamlandi
+                                      AND dilekce_son_teslim_tarihi <= ?
+                                      THEN 1 ELSE 0 END), 0) AS acil,
+                    COALESCE(SUM(CASE WHEN NOT tamamlandi
+                                      AND dilekce_son_teslim_tarihi = ?
+                                      THEN 1 ELSE 0 END), 0) AS bugun
+                FROM dosyalar
+            ''', (bugun, hafta_sonu, acil_sinir, bugun))
+            row = cursor.fetchone()
+
             return {
-                'toplam_dosya': toplam,
-                'tamamlanan_dosya': tamamlanan,
-                'aktif_dosya': aktif,
-                'bu_hafta_son_tarih': bu_hafta
+                'toplam_dosya': row['toplam'],
+                'tamamlanan_dosya': row['tamamlanan'],
+                'aktif_dosya': row['toplam'] - row['tamamlanan'],
+                'bu_hafta_son_tarih': row['bu_hafta'],
+                'acil_dosya': row['acil'],
+                'bugun_son_tarih': row['bugun']
             }
-            
+
         except sqlite3.Error as e:
             raise Exception(f"İstatistik hatası: {e}")
     
+    @_yazma_islemi
+    def add_reminder(self, zaman: float, baslik: str, mesaj: str, veri: Dict = None) -> int:
+        """Hatırlatıcı ekle (zaman: epoch saniyesi), id döndür"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('''
+                INSERT INTO hatirlaticilar (zaman, baslik, mesaj, veri)
+                VALUES (?, ?, ?, ?)
+            ''', (int(zaman), baslik, mesaj,
+                  json.dumps(veri, ensure_ascii=False, default=str) if veri else None))
+            self.connection.commit()
+            return cursor.lastrowid
+        except sqlite3.Error as e:
+            raise Exception(f"Hatırlatıcı ekleme hatası: {e}")
+
+    def get_next_reminder_time(self) -> Optional[int]:
+        """En yakın bekleyen hatırlatıcının zamanı (yoksa None)"""
+        try:
+            row = self._read_connection().execute(
+                "SELECT MIN(zaman) FROM hatirlaticilar"
+            ).fetchone()
+            return row[0]
+        except sqlite3.Error as e:
+            raise Exception(f"Hatırlatıcı getirme hatası: {e}")
+
+    def get_reminder_count(self) -> int:
+        """Bekleyen hatırlatıcı sayısı"""
+        try:
+            return self._read_connection().execute(
+                "SELECT COUNT(*) FROM hatirlaticilar"
+            ).fetchone()[0]
+        except sqlite3.Error as e:
+            raise Exception(f"Hatırlatıcı sayma hatası: {e}")
+
+    @_yazma_islemi
+    def claim_due_reminders(self, until: float) -> List[Dict]:
+        """Zamanı until'e kadar gelen hatırlatıcıları tek işlemde al ve sil"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute('''
+                SELECT * FROM hatirlaticilar
+                WHERE zaman <= ?
+                ORDER BY zaman ASC, id ASC
+            ''', (int(until),))
+            rows = cursor.fetchall()
+            if rows:
+                cursor.execute("DELETE FROM hatirlaticilar WHERE zaman <= ?", (int(until),))
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise Exception(f"Hatırlatıcı alma hatası: {e}")
+
+        reminders = []
+        for row in rows:
+            reminder = dict(row)
+            reminder['veri'] = json.loads(reminder['veri']) if reminder['veri'] else {}
+            reminders.append(reminder)
+        return reminders
+
+    def backup(self, hedef_yol: str):
+        """Veritabanının tutarlı bir kopyasını çıkar (WAL içeriği dahil)"""
+        try:
+            hedef = sqlite3.connect(hedef_yol)
+            try:
+                self._read_connection().backup(hedef)
+            finally:
+                hedef.close()
+        except sqlite3.Error as e:
+            raise Exception(f"Yedekleme hatası: {e}")
+
     def close(self):
-        """Veritabanı bağlantısını kapat"""
-        if self.connection:
+        """Yazıcı thread'ini durdur ve tüm bağlantıları kapat"""
+        writer = getattr(self, '_writer_thread', None)
+        if writer is not None:
+            # Kuyrukta bekleyen yazmalar önce tamamlanır
+            self._write_queue.put(None)
+            if writer is not threading.current_thread():
+                writer.join()
+            self._writer_thread = None
+
+        readers_lock = getattr(self, '_readers_lock', None)
+        if readers_lock is not None:
+            with readers_lock:
+                for connection in self._readers.values():
+                    connection.close()
+                self._readers.clear()
+
+        if getattr(self, 'connection', None):
             self.connection.close()
+            self.connection = None
     
     def __del__(self):
         """Destructor - bağlantıyı kapat"""
-        self.close()
\ No newline at end of file
+        self.close()
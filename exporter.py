@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Dosyaları CSV / JSON Lines olarak dışa aktarma modülü
+
+Kayıtlar imleç üzerinden fetchmany partileriyle okunup doğrudan dosyaya
+yazılır; bellek kullanımı satır sayısından bağımsızdır.
+
+Komut satırından kullanım:
+    python exporter.py dosyalar.csv [--db hukuk_takip.db] [--aktif]
+                       [--baslangic 2024-01-01] [--bitis 2024-12-31]
+"""
+
+import csv
+import json
+import os
+import sys
+import argparse
+from typing import Callable, Dict, Optional
+
+from database import DatabaseManager
+
+# Dışa aktarılan alanlar (CSV başlığı). importer dosya numarası, son teslim
+# tarihi, tamamlanma durumu ve notları geri okur; sunum tarihi yeniden
+# hesaplanır, diğer sütunlar yok sayılır
+EXPORT_ALANLARI = (
+    'id',
+    'dosya_numarasi',
+    'dilekce_son_teslim_tarihi',
+    'ana_avukata_sunum_tarihi',
+    'tamamlandi',
+    'notlar',
+    'olusturma_tarihi',
+    'guncelleme_tarihi',
+)
+
+DESTEKLENEN_BICIMLER = ('csv', 'jsonl')
+
+
+def bicim_tespit_et(dosya_yolu: str) -> str:
+    """Dosya uzantısından dışa aktarma biçimini belirle"""
+    uzanti = os.path.splitext(dosya_yolu)[1].lower().lstrip('.')
+    if uzanti in ('jsonl', 'ndjson', 'json'):
+        return 'jsonl'
+    return 'csv'
+
+
+class DosyaExporter:
+    """Dosyalar tablosunu akış halinde CSV veya JSONL dosyasına yazar"""
+
+    def __init__(self, db_manager: DatabaseManager, batch_size: int = 1000,
+                 progress_callback: Optional[Callable[[int], None]] = None):
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.progress_callback = progress_callback
+
+    def export(self, dosya_yolu: str, bicim: str = None, include_completed: bool = True,
+               start_date: str = None, end_date: str = None) -> int:
+        """Filtrelere uyan dosyaları yaz, yazılan satır sayısını döndür"""
+        bicim = bicim or bicim_tespit_et(dosya_yolu)
+        if bicim not in DESTEKLENEN_BICIMLER:
+            raise ValueError(f"Desteklenmeyen biçim: {bicim}")
+
+        dosyalar = self.db_manager.iter_dosyalar(
+            include_completed=include_completed,
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=self.batch_size
+        )
+
+        with open(dosya_yolu, 'w', encoding='utf-8', newline='') as f:
+            if bicim == 'csv':
+                return self._write_csv(f, dosyalar)
+            return self._write_jsonl(f, dosyalar)
+
+    def _write_csv(self, f, dosyalar) -> int:
+        """CSV olarak yaz"""
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_ALANLARI)
+
+        count = 0
+        for dosya in dosyalar:
+            writer.writerow([self._deger(dosya, alan) for alan in EXPORT_ALANLARI])
+            count += 1
+            self._report(count)
+
+        self._report(count, force=True)
+        return count
+
+    def _write_jsonl(self, f, dosyalar) -> int:
+        """Her satırda bir JSON nesnesi olarak yaz"""
+        count = 0
+        for dosya in dosyalar:
+            kayit = {alan: self._deger(dosya, alan) for alan in EXPORT_ALANLARI}
+            f.write(json.dumps(kayit, ensure_ascii=False))
+            f.write('\n')
+            count += 1
+            self._report(count)
+
+        self._report(count, force=True)
+        return count
+
+    @staticmethod
+    def _deger(dosya: Dict, alan: str):
+        """Alan değerini dışa aktarma için hazırla"""
+        if alan == 'tamamlandi':
+            return bool(dosya[alan])
+        return dosya.get(alan)
+
+    def _report(self, count: int, force: bool = False):
+        """Parti sonlarında ilerleme bildir"""
+        if self.progress_callback and (force or count % self.batch_size == 0):
+            self.progress_callback(count)
+
+
+def main():
+    """Komut satırından dışa aktarma"""
+    parser = argparse.ArgumentParser(description="Dosyaları CSV / JSONL olarak dışa aktar")
+    parser.add_argument('hedef_dosya', help="Yazılacak dosya (.csv veya .jsonl)")
+    parser.add_argument('--db', default='hukuk_takip.db', help="Veritabanı dosyası")
+    parser.add_argument('--bicim', choices=DESTEKLENEN_BICIMLER, help="Çıktı biçimi")
+    parser.add_argument('--aktif', action='store_true', help="Yalnızca aktif dosyalar")
+    parser.add_argument('--baslangic', help="Son teslim tarihi alt sınırı (YYYY-AA-GG)")
+    parser.add_argument('--bitis', help="Son teslim tarihi üst sınırı (YYYY-AA-GG)")
+    args = parser.parse_args()
+
+    db = DatabaseManager(args.db)
+    try:
+        exporter = DosyaExporter(
+            db, progress_callback=lambda n: print(f"\r📤 {n} satır yazıldı", end='', flush=True)
+        )
+        count = exporter.export(args.hedef_dosya, bicim=args.bicim,
+                                include_completed=not args.aktif,
+                                start_date=args.baslangic, end_date=args.bitis)
+    except Exception as e:
+        print(f"\n❌ Dışa aktarma hatası: {e}")
+        return 1
+    finally:
+        db.close()
+
+    print(f"\n✅ {count} dosya dışa aktarıldı: {args.hedef_dosya}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
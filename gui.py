@@ -9,6 +9,7 @@ import tkinter as tk
 from tkinter import messagebox, simpledialog
 from datetime import datetime, timedelta
 import calendar
+import threading
 from typing import Dict, List, Optional
 
 # Modern UI için ttkbootstrap
@@ -28,6 +29,15 @@ except ImportError:
 
 from database import DatabaseManager
 from calendar_view import CalendarView
+from importer import DosyaImporter
+from exporter import DosyaExporter
+from virtual_tree import VirtualTreeview
+from year_heatmap import YearHeatmapWindow
+from records import dosya_tarihi
+from async_database import AsyncDatabaseManager, TkAsyncBridge
+from app_logging import get_logger, log_duration
+
+logger = get_logger(__name__)
 
 class MainGUI:
     def __init__(self, root, db_manager: DatabaseManager, notification_manager):
@@ -35,6 +45,11 @@ class MainGUI:
         self.db_manager = db_manager
         self.notification_manager = notification_manager
         
+        # Uzun sorgular arka planda çalışır, sonuçlar Tk thread'ine taşınır
+        self.async_db = AsyncDatabaseManager(db_manager)
+        self.async_bridge = TkAsyncBridge(root)
+        self._search_after_id = None
+        
         # Tema ayarları
         self.current_theme = "cosmo"  # Varsayılan tema
         self.dark_mode = False
@@ -101,6 +116,8 @@ class MainGUI:
         menubar.add_cascade(label="Dosya", menu=file_menu)
         file_menu.add_command(label="Yeni Dosya Ekle", command=self.show_add_dialog, accelerator="Ctrl+N")
         file_menu.add_separator()
+        file_menu.add_command(label="CSV'den İçe Aktar...", command=self.import_csv)
+        file_menu.add_command(label="Dışa Aktar (CSV/JSONL)...", command=self.export_data)
         file_menu.add_command(label="Veritabanını Yedekle", command=self.backup_database)
         file_menu.add_separator()
         file_menu.add_command(label="Çıkış", command=self.on_closing, accelerator="Ctrl+Q")
@@ -117,6 +134,7 @@ class MainGUI:
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Görünüm", menu=view_menu)
         view_menu.add_command(label="Takvim Görünümü", command=self.show_calendar_view)
+        view_menu.add_command(label="Yıllık İş Yükü", command=self.show_year_heatmap)
         view_menu.add_command(label="İstatistikler", command=self.show_statistics)
         view_menu.add_separator()
         view_menu.add_checkbutton(label="Tamamlananları Göster", variable=tk.BooleanVar(value=True), 
@@ -264,12 +282,23 @@ class MainGUI:
         
         # Scrollbar
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
         
         # Grid yerleştirme
         self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
+        # Renk kodları (bir kez tanımlanır)
+        self.tree.tag_configure('overdue', background='#ffcccc', foreground='#cc0000')
+        self.tree.tag_configure('due_today', background='#ffeecc', foreground='#cc6600')
+        self.tree.tag_configure('urgent', background='#ffffcc', foreground='#cc9900')
+        self.tree.tag_configure('warning', background='#ccffcc', foreground='#009900')
+        self.tree.tag_configure('normal', background='white', foreground='black')
+        self.tree.tag_configure('completed', background='#f0f0f0', foreground='#666666')
+        
+        # Sanal liste: yalnızca görünen pencere + ön yükleme payı ağaçta tutulur
+        self.virtual_list = VirtualTreeview(self.tree, scrollbar, self.build_tree_row)
+        self.change_seq = 0  # Listeye uygulanmış son değişiklik sırası
+        
         # Çift tıklama olayı
         self.tree.bind('<Double-1>', lambda e: self.edit_selected_dosya())
         
@@ -416,16 +445,10 @@ class MainGUI:
             today = datetime.now().date()
             urgent_date = today + timedelta(days=3)
             
-            dosyalar = self.db_manager.get_all_dosyalar(include_completed=False)
-            urgent_dosyalar = []
-            
-            for dosya in dosyalar:
-                try:
-                    son_teslim = datetime.strptime(dosya['dilekce_son_teslim_tarihi'], '%Y-%m-%d').date()
-                    if son_teslim <= urgent_date:
-                        urgent_dosyalar.append(dosya)
-                except:
-                    pass
+            # Dashboard'daki acil sayısıyla aynı koşul: aktif ve son teslim <= bugün + 3
+            urgent_dosyalar = list(self.db_manager.iter_dosyalar(
+                include_completed=False, end_date=urgent_date.strftime('%Y-%m-%d')
+            ))
             
             self.populate_tree(urgent_dosyalar)
             
@@ -449,38 +472,12 @@ class MainGUI:
         if hasattr(self, 'search_entry'):
             self.search_entry.focus()
     
-    def update_dashboard(self):
+    def update_dashboard(self, snapshot: Dict):
         """Dashboard kartlarını güncelle"""
-        try:
-            stats = self.db_manager.get_statistics()
-            
-            # Dashboard değerlerini güncelle
-            self.dashboard_vars['total'].set(str(stats['toplam_dosya']))
-            self.dashboard_vars['active'].set(str(stats['aktif_dosya']))
-            
-            # Acil dosya sayısını hesapla (3 gün içinde)
-            today = datetime.now().date()
-            urgent_date = today + timedelta(days=3)
-            
-            dosyalar = self.db_manager.get_all_dosyalar(include_completed=False)
-            urgent_count = 0
-            today_count = 0
-            
-            for dosya in dosyalar:
-                try:
-                    son_teslim = datetime.strptime(dosya['dilekce_son_teslim_tarihi'], '%Y-%m-%d').date()
-                    if son_teslim <= urgent_date:
-                        urgent_count += 1
-                    if son_teslim == today:
-                        today_count += 1
-                except:
-                    pass
-            
-            self.dashboard_vars['urgent'].set(str(urgent_count))
-            self.dashboard_vars['today'].set(str(today_count))
-            
-        except Exception as e:
-            print(f"Dashboard güncelleme hatası: {e}")
+        self.dashboard_vars['total'].set(str(snapshot['toplam_dosya']))
+        self.dashboard_vars['active'].set(str(snapshot['aktif_dosya']))
+        self.dashboard_vars['urgent'].set(str(snapshot['acil_dosya']))
+        self.dashboard_vars['today'].set(str(snapshot['bugun_son_tarih']))
         
     def create_status_panel(self, parent):
         """Durum panelini oluştur"""
@@ -495,14 +492,15 @@ class MainGUI:
         status_label.grid(row=0, column=0, sticky=tk.W)
         
         # İstatistik bilgileri
-        self.stats_var = tk.StringVar()\n        stats_label = ttk.Label(status_frame, textvariable=self.stats_var, style='Status.TLabel')
+        self.stats_var = tk.StringVar()
+        stats_label = ttk.Label(status_frame, textvariable=self.stats_var, style='Status.TLabel')
         stats_label.grid(row=0, column=1, sticky=tk.E)
         
     def show_add_dialog(self):
         """Yeni dosya ekleme diyaloğunu göster"""
         dialog = DosyaDialog(self.root, self.db_manager, title="Yeni Dosya Ekle")
         if dialog.result:
-            self.refresh_data()
+            self.apply_pending_changes()
             self.update_status("Yeni dosya eklendi.")
             
     def edit_selected_dosya(self):
@@ -512,19 +510,17 @@ class MainGUI:
             messagebox.showwarning("Uyarı", "Lütfen düzenlemek istediğiniz dosyayı seçin.")
             return
         
-        # Seçili öğenin ID'sini al
-        item_id = self.tree.item(selected[0])['values'][0]
+        # Ağaç öğelerinin iid değeri dosyanın birincil anahtarıdır
+        dosya_id = int(selected[0])
         
         # Veritabanından dosya bilgilerini al
         try:
-            # Dosya numarasına göre arama yap
-            dosyalar = self.db_manager.search_dosyalar(item_id)
-            if dosyalar:
-                dosya = dosyalar[0]
+            dosya = self.db_manager.get_dosya_by_id(dosya_id)
+            if dosya:
                 dialog = DosyaDialog(self.root, self.db_manager, dosya=dosya, 
                                    title="Dosya Düzenle")
                 if dialog.result:
-                    self.refresh_data()
+                    self.apply_pending_changes()
                     self.update_status("Dosya güncellendi.")
             else:
                 messagebox.showerror("Hata", "Dosya bulunamadı.")
@@ -542,16 +538,14 @@ class MainGUI:
         if not messagebox.askyesno("Onay", "Seçili dosyayı silmek istediğinizden emin misiniz?"):
             return
         
-        # Seçili öğenin ID'sini al
-        item_id = self.tree.item(selected[0])['values'][0]
+        # Ağaç öğelerinin iid değeri dosyanın birincil anahtarıdır
+        dosya_id = int(selected[0])
         
         try:
-            # Dosya numarasına göre dosyayı bul ve sil
-            dosyalar = self.db_manager.search_dosyalar(item_id)
-            if dosyalar:
-                dosya = dosyalar[0]
+            dosya = self.db_manager.get_dosya_by_id(dosya_id)
+            if dosya:
                 self.db_manager.delete_dosya(dosya['id'])
-                self.refresh_data()
+                self.apply_pending_changes()
                 self.update_status("Dosya silindi.")
             else:
                 messagebox.showerror("Hata", "Dosya bulunamadı.")
@@ -565,15 +559,14 @@ class MainGUI:
             messagebox.showwarning("Uyarı", "Lütfen işaretlemek istediğiniz dosyayı seçin.")
             return
         
-        item_id = self.tree.item(selected[0])['values'][0]
+        dosya_id = int(selected[0])
         
         try:
-            dosyalar = self.db_manager.search_dosyalar(item_id)
-            if dosyalar:
-                dosya = dosyalar[0]
+            dosya = self.db_manager.get_dosya_by_id(dosya_id)
+            if dosya:
                 new_status = not dosya['tamamlandi']
                 self.db_manager.update_dosya(dosya['id'], tamamlandi=new_status)
-                self.refresh_data()
+                self.apply_pending_changes()
                 status_text = "tamamlandı" if new_status else "aktif"
                 self.update_status(f"Dosya {status_text} olarak işaretlendi.")
             else:
@@ -587,12 +580,11 @@ class MainGUI:
         if not selected:
             return
         
-        item_id = self.tree.item(selected[0])['values'][0]
+        dosya_id = int(selected[0])
         
         try:
-            dosyalar = self.db_manager.search_dosyalar(item_id)
-            if dosyalar:
-                dosya = dosyalar[0]
+            dosya = self.db_manager.get_dosya_by_id(dosya_id)
+            if dosya:
                 details_window = DosyaDetayWindow(self.root, dosya)
             else:
                 messagebox.showerror("Hata", "Dosya bulunamadı.")
@@ -609,27 +601,36 @@ class MainGUI:
     
     def on_search_change(self, event):
         """Arama metni değiştiğinde"""
-        # Kısa bir gecikme ile otomatik arama
-        self.root.after(500, self.search_files)
+        # Kısa bir gecikme ile otomatik arama (her tuşta yeniden kurulur)
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(500, self.search_files)
     
     def search_files(self):
-        """Dosya arama"""
+        """Dosya arama (sorgu arka planda çalışır)"""
+        self._search_after_id = None
         search_term = self.search_var.get().strip()
         
-        try:
-            if search_term:
-                dosyalar = self.db_manager.search_dosyalar(search_term)
-                self.update_status(f"'{search_term}' için {len(dosyalar)} sonuç bulundu.")
-            else:
-                dosyalar = self.db_manager.get_all_dosyalar(
-                    include_completed=self.show_completed_var.get()
-                )
+        if not search_term:
+            # Bekleyen aramanın sonucu artık gösterilmemeli
+            self.async_bridge.cancel('arama')
+            try:
+                self.load_file_list()
                 self.update_status("Tüm dosyalar gösteriliyor.")
-            
+            except Exception as e:
+                messagebox.showerror("Hata", f"Arama hatası: {str(e)}")
+            return
+        
+        def on_done(dosyalar):
+            self.update_status(f"'{search_term}' için {len(dosyalar)} sonuç bulundu.")
             self.populate_tree(dosyalar)
-            
-        except Exception as e:
-            messagebox.showerror("Hata", f"Arama hatası: {str(e)}")
+        
+        self.status_var.set(f"'{search_term}' aranıyor...")
+        self.async_bridge.submit(
+            self.async_db.search_dosyalar(search_term), on_done,
+            lambda e: messagebox.showerror("Hata", f"Arama hatası: {str(e)}"),
+            key='arama'
+        )
     
     def show_calendar_view(self):
         """Takvim görünümünü göster"""
@@ -638,6 +639,13 @@ class MainGUI:
         except Exception as e:
             messagebox.showerror("Hata", f"Takvim görünümü hatası: {str(e)}")
     
+    def show_year_heatmap(self):
+        """Yıllık iş yükü ısı haritasını göster"""
+        try:
+            YearHeatmapWindow(self.root, self.db_manager)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Yıllık görünüm hatası: {str(e)}")
+    
     def show_statistics(self):
         """İstatistikleri göster"""
         try:
@@ -653,7 +661,6 @@ class MainGUI:
     def backup_database(self):
         """Veritabanını yedekle"""
         try:
-            import shutil
             from tkinter import filedialog
             
             backup_file = filedialog.asksaveasfilename(
@@ -663,12 +670,96 @@ class MainGUI:
             )
             
             if backup_file:
-                shutil.copy2("hukuk_takip.db", backup_file)
+                # Dosya kopyalamak WAL'daki son yazmaları kaçırabilir
+                self.db_manager.backup(backup_file)
                 messagebox.showinfo("Başarılı", f"Veritabanı yedeklendi:\n{backup_file}")
                 
         except Exception as e:
             messagebox.showerror("Hata", f"Yedekleme hatası: {str(e)}")
     
+    def run_background_task(self, task, progress_text: str, on_done):
+        """Uzun işi ayrı bir thread'de çalıştır, ilerlemeyi durum çubuğunda göster
+
+        task(db, progress) işçi thread'de paylaşılan veritabanı yöneticisiyle
+        çağrılır (okumalar thread'in kendi bağlantısından, yazmalar ortak yazıcı
+        kuyruğundan geçer); progress(n) ile ilerleme bildirir. Bittiğinde
+        on_done(sonuç) ana thread'de çağrılır; hata olursa mesaj kutusu gösterilir.
+        """
+        state = {'ilerleme': 0, 'sonuc': None, 'hata': None}
+
+        def progress(count):
+            state['ilerleme'] = count
+
+        def worker():
+            try:
+                state['sonuc'] = task(self.db_manager, progress)
+            except Exception as e:
+                state['hata'] = e
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+
+        def poll():
+            if thread.is_alive():
+                self.status_var.set(progress_text.format(state['ilerleme']))
+                self.root.after(200, poll)
+            elif state['hata'] is not None:
+                messagebox.showerror("Hata", str(state['hata']))
+            else:
+                on_done(state['sonuc'])
+
+        poll()
+
+    def import_csv(self):
+        """CSV / UYAP dışa aktarım dosyasını arka planda içe aktar"""
+        from tkinter import filedialog
+
+        csv_file = filedialog.askopenfilename(
+            title="İçe Aktarılacak CSV Dosyası",
+            filetypes=[("CSV Dosyaları", "*.csv"), ("Tüm Dosyalar", "*.*")]
+        )
+        if not csv_file:
+            return
+
+        def task(db, progress):
+            return DosyaImporter(db, progress_callback=progress).import_csv(csv_file)
+
+        def on_done(ozet):
+            self.refresh_data()
+            message = (f"Eklenen: {ozet['eklenen']}\nGüncellenen: {ozet['guncellenen']}\n"
+                       f"Geçersiz satır: {ozet['gecersiz']}")
+            if ozet['hatalar']:
+                message += "\n\n" + "\n".join(ozet['hatalar'][:10])
+            messagebox.showinfo("İçe Aktarma Tamamlandı", message)
+
+        self.run_background_task(task, "İçe aktarılıyor... {} satır işlendi", on_done)
+
+    def export_data(self):
+        """Dosyaları arka planda CSV / JSONL olarak dışa aktar"""
+        from tkinter import filedialog
+
+        export_file = filedialog.asksaveasfilename(
+            title="Dışa Aktar",
+            defaultextension=".csv",
+            filetypes=[("CSV Dosyası", "*.csv"), ("JSON Lines", "*.jsonl"),
+                       ("Tüm Dosyalar", "*.*")]
+        )
+        if not export_file:
+            return
+
+        # Görünüm filtresi: tamamlananlar gizliyse yalnızca aktifler aktarılır
+        include_completed = self.show_completed_var.get()
+
+        def task(db, progress):
+            exporter = DosyaExporter(db, progress_callback=progress)
+            return exporter.export(export_file, include_completed=include_completed)
+
+        def on_done(count):
+            self.update_status(f"{count} dosya dışa aktarıldı.")
+            messagebox.showinfo("Başarılı", f"{count} dosya dışa aktarıldı:\n{export_file}")
+
+        self.run_background_task(task, "Dışa aktarılıyor... {} satır yazıldı", on_done)
+
     def show_about(self):
         """Hakkında diyaloğunu göster"""
         about_text = """
@@ -693,93 +784,129 @@ tarihlerinin takibi için geliştirilmiştir.
     def refresh_data(self):
         """Verileri yenile"""
         try:
-            dosyalar = self.db_manager.get_all_dosyalar(
-                include_completed=self.show_completed_var.get()
-            )
-            self.populate_tree(dosyalar)
-            self.update_statistics()
-            self.update_dashboard()  # Dashboard'u güncelle
+            with log_duration(logger, "Veriler yenilendi"):
+                self.db_manager.invalidate_dosya_cache()
+                self.load_file_list()
+                self.refresh_summary()
             self.update_status("Veriler yenilendi.")
         except Exception as e:
             messagebox.showerror("Hata", f"Veri yenileme hatası: {str(e)}")
     
-    def populate_tree(self, dosyalar: List[Dict]):
-        """Ağaç görünümünü doldur"""
-        # Mevcut öğeleri temizle
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def apply_pending_changes(self):
+        """Son yüklemeden beri değişen satırları listeye uygula, panelleri güncelle"""
+        try:
+            seq, changed_ids = self.db_manager.get_changes_since(self.change_seq)
+            if changed_ids is None:
+                # Değişiklik günlüğü budanmış: tam yenileme gerekli
+                self.refresh_data()
+                return
+
+            self.change_seq = seq
+            if changed_ids:
+                self.db_manager.invalidate_dosya_cache(changed_ids)
+                include_completed = self.show_completed_var.get()
+                self.virtual_list.apply_changes(
+                    changed_ids,
+                    self.db_manager.get_dosyalar_by_ids(changed_ids),
+                    lambda dosya: include_completed or not dosya['tamamlandi']
+                )
+            self.refresh_summary()
+        except Exception as e:
+            messagebox.showerror("Hata", f"Veri yenileme hatası: {str(e)}")
+
+    def load_file_list(self):
+        """Dosya listesini keyset sayfalı kaynaktan yükle (yalnızca ilk pencere)"""
+        include_completed = self.show_completed_var.get()
+        # Yüklemeden önce alınır; arada gelen değişiklikler tekrar uygulanır
+        self.change_seq = self.db_manager.get_change_counter()
+        
+        def fetch_page(after=None, before=None, limit=200):
+            return self.db_manager.get_dosyalar_page(
+                include_completed=include_completed, after=after, before=before, limit=limit
+            )
         
+        self.virtual_list.set_source(fetch_page)
+    
+    def populate_tree(self, dosyalar: List[Dict]):
+        """Ağaç görünümünü verilen liste ile doldur (arama / filtre sonuçları)"""
+        self.change_seq = self.db_manager.get_change_counter()
+        self.virtual_list.set_rows(dosyalar)
+    
+    def build_tree_row(self, dosya: Dict):
+        """Bir dosya için Treeview değerlerini ve renk etiketini hazırla"""
         today = datetime.now().date()
         
-        for dosya in dosyalar:
-            # Kalan gün hesapla
-            try:
-                son_teslim = datetime.strptime(dosya['dilekce_son_teslim_tarihi'], '%Y-%m-%d').date()
-                kalan_gun = (son_teslim - today).days
-                
-                if kalan_gun < 0:
-                    kalan_gun_text = f"GEÇTİ ({abs(kalan_gun)})"
-                    tag = 'overdue'
-                elif kalan_gun == 0:
-                    kalan_gun_text = "BUGÜN"
-                    tag = 'due_today'
-                elif kalan_gun <= 3:
-                    kalan_gun_text = str(kalan_gun)
-                    tag = 'urgent'
-                elif kalan_gun <= 7:
-                    kalan_gun_text = str(kalan_gun)
-                    tag = 'warning'
-                else:
-                    kalan_gun_text = str(kalan_gun)
-                    tag = 'normal'
-                    
-            except ValueError as e:
-                kalan_gun_text = "?"
-                tag = 'normal'
-                # Log the error for debugging
-                print(f"Tarih formatı hatası: {e} - Dosya: {dosya.get('dosya_numarasi', 'N/A')}")
-            
-            # Durum
-            durum = "Tamamlandı" if dosya['tamamlandi'] else "Aktif"
-            if dosya['tamamlandi']:
-                tag = 'completed'
-            
-            # Tarihleri formatla
-            try:
-                son_teslim_str = datetime.strptime(dosya['dilekce_son_teslim_tarihi'], '%Y-%m-%d').strftime('%d.%m.%Y')
-                sunum_tarihi_str = datetime.strptime(dosya['ana_avukata_sunum_tarihi'], '%Y-%m-%d').strftime('%d.%m.%Y')
-            except ValueError as e:
-                son_teslim_str = dosya['dilekce_son_teslim_tarihi']
-                sunum_tarihi_str = dosya['ana_avukata_sunum_tarihi']
-                # Log the error for debugging
-                print(f"Tarih formatı hatası: {e} - Dosya: {dosya.get('dosya_numarasi', 'N/A')}")
+        # Kalan gün hesapla
+        try:
+            son_teslim = dosya_tarihi(dosya, 'dilekce_son_teslim_tarihi')
+            kalan_gun = (son_teslim - today).days
             
-            # Öğeyi ekle
-            self.tree.insert('', 'end', values=(
-                dosya['dosya_numarasi'],
-                son_teslim_str,
-                sunum_tarihi_str,
-                kalan_gun_text,
-                durum
-            ), tags=(tag,))
-        
-        # Renk kodları
-        self.tree.tag_configure('overdue', background='#ffcccc', foreground='#cc0000')
-        self.tree.tag_configure('due_today', background='#ffeecc', foreground='#cc6600')
-        self.tree.tag_configure('urgent', background='#ffffcc', foreground='#cc9900')
-        self.tree.tag_configure('warning', background='#ccffcc', foreground='#009900')
-        self.tree.tag_configure('normal', background='white', foreground='black')
-        self.tree.tag_configure('completed', background='#f0f0f0', foreground='#666666')
-    
-    def update_statistics(self):
-        """İstatistikleri güncelle"""
+            if kalan_gun < 0:
+                kalan_gun_text = f"GEÇTİ ({abs(kalan_gun)})"
+                tag = 'overdue'
+            elif kalan_gun == 0:
+                kalan_gun_text = "BUGÜN"
+                tag = 'due_today'
+            elif kalan_gun <= 3:
+                kalan_gun_text = str(kalan_gun)
+                tag = 'urgent'
+            elif kalan_gun <= 7:
+                kalan_gun_text = str(kalan_gun)
+                tag = 'warning'
+            else:
+                kalan_gun_text = str(kalan_gun)
+                tag = 'normal'
+                
+        except ValueError as e:
+            kalan_gun_text = "?"
+            tag = 'normal'
+            # Bozuk tarih her satır çiziminde tekrar eder; log sınırlanır
+            logger.warning("Tarih formatı hatası: %s", e,
+                           extra={'dosya_numarasi': dosya.get('dosya_numarasi', 'N/A')})
+        
+        # Durum
+        durum = "Tamamlandı" if dosya['tamamlandi'] else "Aktif"
+        if dosya['tamamlandi']:
+            tag = 'completed'
+        
+        # Tarihleri formatla
         try:
-            stats = self.db_manager.get_statistics()
-            stats_text = f"Toplam: {stats['toplam_dosya']} | Aktif: {stats['aktif_dosya']} | Bu Hafta: {stats['bu_hafta_son_tarih']}"
-            self.stats_var.set(stats_text)
-        except Exception as e:
+            son_teslim_str = dosya_tarihi(dosya, 'dilekce_son_teslim_tarihi').strftime('%d.%m.%Y')
+            sunum_tarihi_str = dosya_tarihi(dosya, 'ana_avukata_sunum_tarihi').strftime('%d.%m.%Y')
+        except ValueError as e:
+            son_teslim_str = dosya['dilekce_son_teslim_tarihi']
+            sunum_tarihi_str = dosya['ana_avukata_sunum_tarihi']
+            # Bozuk tarih her satır çiziminde tekrar eder; log sınırlanır
+            logger.warning("Tarih formatı hatası: %s", e,
+                           extra={'dosya_numarasi': dosya.get('dosya_numarasi', 'N/A')})
+        
+        values = (
+            dosya['dosya_numarasi'],
+            son_teslim_str,
+            sunum_tarihi_str,
+            kalan_gun_text,
+            durum
+        )
+        return values, tag
+    
+    def refresh_summary(self):
+        """Durum çubuğunu ve dashboard'u tek bir veritabanı anlık görüntüsünden güncelle"""
+        def on_done(snapshot):
+            self.update_statistics(snapshot)
+            self.update_dashboard(snapshot)
+        
+        def on_error(e):
             self.stats_var.set("İstatistik bilgisi alınamadı")
-            print(f"İstatistik güncelleme hatası: {e}")
+            logger.error("İstatistik güncelleme hatası: %s", e)
+        
+        self.async_bridge.submit(self.async_db.get_dashboard_snapshot(), on_done, on_error,
+                                 key='ozet')
+    
+    def update_statistics(self, snapshot: Dict):
+        """Durum çubuğundaki istatistikleri güncelle"""
+        stats_text = (f"Toplam: {snapshot['toplam_dosya']} | Aktif: {snapshot['aktif_dosya']} | "
+                      f"Bu Hafta: {snapshot['bu_hafta_son_tarih']}")
+        self.stats_var.set(stats_text)
     
     def update_status(self, message: str):
         """Durum mesajını güncelle"""
@@ -790,6 +917,8 @@ tarihlerinin takibi için geliştirilmiştir.
     def on_closing(self):
         """Uygulama kapatılırken"""
         if messagebox.askokcancel("Çıkış", "Uygulamadan çıkmak istediğinizden emin misiniz?"):
+            self.async_bridge.close()
+            self.async_db.close()
             self.root.destroy()
     
     def change_theme(self, theme_name: str):
@@ -970,12 +1099,14 @@ class DosyaDialog:
                     return
                 tarih = datetime.strptime(tarih_str, '%d.%m.%Y').date()
             
-            sunum_tarihi = tarih - timedelta(days=2)
+            # Hafta sonu, resmi tatil ve adli tatil günleri sayılmaz
+            takvim = self.db_manager.judicial_calendar
+            sunum_tarihi = takvim.working_days_before(tarih, takvim.offset_days)
             self.sunum_tarihi_var.set(sunum_tarihi.strftime('%d.%m.%Y'))
             
         except ValueError as e:
             self.sunum_tarihi_var.set("Geçersiz tarih")
-            print(f"Sunum tarihi hesaplama hatası: {e}")
+            logger.debug("Sunum tarihi hesaplama hatası: %s", e)
     
     def save_dosya(self):
         """Dosyayı kaydet"""
@@ -1091,8 +1222,8 @@ class DosyaDetayWindow:
         
         # Tarihleri formatla
         try:
-            dilekce_tarih = datetime.strptime(dosya['dilekce_son_teslim_tarihi'], '%Y-%m-%d').strftime('%d.%m.%Y')
-            sunum_tarih = datetime.strptime(dosya['ana_avukata_sunum_tarihi'], '%Y-%m-%d').strftime('%d.%m.%Y')
+            dilekce_tarih = dosya_tarihi(dosya, 'dilekce_son_teslim_tarihi').strftime('%d.%m.%Y')
+            sunum_tarih = dosya_tarihi(dosya, 'ana_avukata_sunum_tarihi').strftime('%d.%m.%Y')
             olusturma = datetime.strptime(dosya['olusturma_tarihi'], '%Y-%m-%d %H:%M:%S').strftime('%d.%m.%Y %H:%M')
             guncelleme = datetime.strptime(dosya['guncelleme_tarihi'], '%Y-%m-%d %H:%M:%S').strftime('%d.%m.%Y %H:%M')
         except ValueError as e:
@@ -1100,17 +1231,19 @@ class DosyaDetayWindow:
             sunum_tarih = dosya['ana_avukata_sunum_tarihi']
             olusturma = dosya['olusturma_tarihi']
             guncelleme = dosya['guncelleme_tarihi']
-            print(f"Detay tarih formatı hatası: {e}")
+            logger.warning("Detay tarih formatı hatası: %s", e,
+                           extra={'dosya_numarasi': dosya['dosya_numarasi']})
         
         # Kalan gün hesapla
         try:
             today = datetime.now().date()
-            son_teslim = datetime.strptime(dosya['dilekce_son_teslim_tarihi'], '%Y-%m-%d').date()
+            son_teslim = dosya_tarihi(dosya, 'dilekce_son_teslim_tarihi')
             kalan_gun = (son_teslim - today).days
             kalan_gun_text = f"{kalan_gun} gün" if kalan_gun >= 0 else f"GEÇMİŞ ({abs(kalan_gun)} gün)"
         except ValueError as e:
             kalan_gun_text = "Bilinmiyor"
-            print(f"Kalan gün hesaplama hatası: {e}")
+            logger.warning("Kalan gün hesaplama hatası: %s", e,
+                           extra={'dosya_numarasi': dosya['dosya_numarasi']})
         
         info_text = f"""
 Dosya Numarası: {dosya['dosya_numarasi']}
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+CSV / UYAP dışa aktarım dosyalarını içe aktarma modülü
+
+Satırlar üreteçlerle (generator) okunur ve sınırlı parçalar halinde
+veritabanına yazılır; bellek kullanımı dosya boyutundan bağımsızdır.
+
+Komut satırından kullanım:
+    python importer.py dosyalar.csv [--db hukuk_takip.db] [--chunk-size 1000]
+"""
+
+import csv
+import sys
+import argparse
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from database import DatabaseManager, turkce_katla
+
+# Kabul edilen sütun başlıkları (Türkçe katlanmış, küçük harf)
+SUTUN_ESLEMELERI = {
+    'dosya_numarasi': ('dosya_numarasi', 'dosya numarası', 'dosya no', 'dosya',
+                       'esas no', 'esas numarası'),
+    'dilekce_son_teslim_tarihi': ('dilekce_son_teslim_tarihi', 'dilekçe son teslim tarihi',
+                                  'son teslim tarihi', 'son teslim', 'süre sonu'),
+    'notlar': ('notlar', 'not', 'açıklama'),
+    'tamamlandi': ('tamamlandi', 'tamamlandı'),
+}
+
+# Tamamlanma sütununda kabul edilen değerler (Türkçe katlanmış); boş hücre
+# mevcut durumu korur
+TAMAMLANDI_DEGERLERI = {
+    True: ('true', '1', 'evet', 'e', 'yes', 'tamamlandi', 'tamamlandı'),
+    False: ('false', '0', 'hayir', 'hayır', 'h', 'no', 'aktif'),
+}
+
+# GUI'de kullanılan ve veritabanında saklanan tarih biçimleri
+TARIH_FORMATLARI = ('%Y-%m-%d', '%d.%m.%Y')
+
+# Özet içinde saklanacak en fazla hata sayısı (bellek sabit kalsın)
+MAX_HATA_KAYDI = 100
+
+
+def normalize_tarih(deger: str) -> str:
+    """Tarihi veritabanı biçimine (YYYY-MM-DD) çevir"""
+    deger = (deger or '').strip()
+    for tarih_formati in TARIH_FORMATLARI:
+        try:
+            return datetime.strptime(deger, tarih_formati).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    raise ValueError(f"Geçersiz tarih: '{deger}' (GG.AA.YYYY veya YYYY-AA-GG bekleniyor)")
+
+
+def normalize_tamamlandi(deger: str) -> Optional[bool]:
+    """Tamamlanma hücresini bool'a çevir (boşsa None: mevcut durum korunur)"""
+    katli = turkce_katla((deger or '').strip())
+    if not katli:
+        return None
+    for sonuc, degerler in TAMAMLANDI_DEGERLERI.items():
+        if katli in degerler:
+            return sonuc
+    raise ValueError(f"Geçersiz tamamlanma değeri: '{deger}' (Evet/Hayır bekleniyor)")
+
+
+def _sutun_indeksleri(baslik: List[str]) -> Dict[str, int]:
+    """Başlık satırından alan -> sütun indeksi eşlemesini çıkar"""
+    katli_baslik = [turkce_katla(sutun.strip()) for sutun in baslik]
+    indeksler = {}
+
+    for alan, adlar in SUTUN_ESLEMELERI.items():
+        for ad in adlar:
+            katli_ad = turkce_katla(ad)
+            if katli_ad in katli_baslik:
+                indeksler[alan] = katli_baslik.index(katli_ad)
+                break
+
+    eksik = [alan for alan in ('dosya_numarasi', 'dilekce_son_teslim_tarihi')
+             if alan not in indeksler]
+    if eksik:
+        raise ValueError(f"CSV başlığında zorunlu sütunlar bulunamadı: {', '.join(eksik)}")
+
+    return indeksler
+
+
+def satirlari_oku(dosya_yolu: str, encoding: str = 'utf-8-sig') -> Iterator[Tuple[int, Dict[str, str]]]:
+    """CSV satırlarını (satır no, alanlar) olarak tek tek üret"""
+    with open(dosya_yolu, 'r', encoding=encoding, newline='') as f:
+        # Ayraç tespiti (UYAP çıktıları genelde ';' kullanır)
+        ornek = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(ornek, delimiters=',;\t')
+        except csv.Error:
+            dialect = csv.excel
+
+        reader = csv.reader(f, dialect)
+        baslik = next(reader, None)
+        if baslik is None:
+            return
+        indeksler = _sutun_indeksleri(baslik)
+
+        for satir_no, satir in enumerate(reader, start=2):
+            if not any(hucre.strip() for hucre in satir):
+                continue  # Boş satırları atla
+            yield satir_no, {
+                alan: satir[indeks].strip() if indeks < len(satir) else ''
+                for alan, indeks in indeksler.items()
+            }
+
+
+class DosyaImporter:
+    """CSV satırlarını parça parça dosyalar tablosuna aktarır (dosya no ile upsert)"""
+
+    def __init__(self, db_manager: DatabaseManager, chunk_size: int = 1000,
+                 progress_callback: Optional[Callable[[int], None]] = None):
+        self.db_manager = db_manager
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+
+    def import_csv(self, dosya_yolu: str, encoding: str = 'utf-8-sig') -> Dict:
+        """CSV dosyasını içe aktar ve özet döndür"""
+        return self.import_rows(satirlari_oku(dosya_yolu, encoding))
+
+    def import_rows(self, satirlar: Iterator[Tuple[int, Dict[str, str]]]) -> Dict:
+        """(satır no, alanlar) üretecini içe aktar
+
+        Her parça ayrı bir işlemde yazılır; hatalı satırlar atlanıp özete eklenir.
+        """
+        ozet = {'islenen': 0, 'eklenen': 0, 'guncellenen': 0, 'gecersiz': 0, 'hatalar': []}
+        gecerli_satirlar = self._normalize(satirlar, ozet)
+
+        while True:
+            parca = list(islice(gecerli_satirlar, self.chunk_size))
+            if not parca:
+                break
+
+            sonuc = self.db_manager.upsert_dosyalar(parca)
+            ozet['eklenen'] += sonuc['eklenen']
+            ozet['guncellenen'] += sonuc['guncellenen']
+
+            if self.progress_callback:
+                self.progress_callback(ozet['islenen'])
+
+        return ozet
+
+    def _normalize(self, satirlar, ozet: Dict) -> Iterator[Tuple[str, str, Optional[str], Optional[bool]]]:
+        """Satırları doğrula, tarihleri normalize et; geçersizleri özete yaz"""
+        for satir_no, alanlar in satirlar:
+            ozet['islenen'] += 1
+            try:
+                dosya_numarasi = alanlar.get('dosya_numarasi', '')
+                if not dosya_numarasi:
+                    raise ValueError("Dosya numarası boş olamaz")
+                tarih = normalize_tarih(alanlar.get('dilekce_son_teslim_tarihi', ''))
+                tamamlandi = normalize_tamamlandi(alanlar.get('tamamlandi'))
+            except ValueError as e:
+                ozet['gecersiz'] += 1
+                if len(ozet['hatalar']) < MAX_HATA_KAYDI:
+                    ozet['hatalar'].append(f"Satır {satir_no}: {e}")
+                continue
+
+            # Notlar / tamamlanma sütunu yoksa veya hücre boşsa mevcut değer korunur
+            yield dosya_numarasi, tarih, alanlar.get('notlar') or None, tamamlandi
+
+
+def main():
+    """Komut satırından içe aktarma"""
+    parser = argparse.ArgumentParser(description="CSV / UYAP dosya listesini içe aktar")
+    parser.add_argument('csv_dosyasi', help="İçe aktarılacak CSV dosyası")
+    parser.add_argument('--db', default='hukuk_takip.db', help="Veritabanı dosyası")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="İşlem başına satır sayısı")
+    parser.add_argument('--encoding', default='utf-8-sig', help="Dosya karakter kodlaması")
+    args = parser.parse_args()
+
+    db = DatabaseManager(args.db)
+    try:
+        importer = DosyaImporter(
+            db, chunk_size=args.chunk_size,
+            progress_callback=lambda n: print(f"\r📥 {n} satır işlendi", end='', flush=True)
+        )
+        ozet = importer.import_csv(args.csv_dosyasi, encoding=args.encoding)
+    except Exception as e:
+        print(f"\n❌ İçe aktarma hatası: {e}")
+        return 1
+    finally:
+        db.close()
+
+    print(f"\n✅ Eklenen: {ozet['eklenen']} | Güncellenen: {ozet['guncellenen']} | "
+          f"Geçersiz: {ozet['gecersiz']}")
+    for hata in ozet['hatalar']:
+        print(f"   ⚠️  {hata}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Adli takvim (iş günü) hesaplama modülü
+
+Hafta sonları, resmi tatiller, dini bayramlar ve adli tatil (20 Temmuz -
+31 Ağustos) iş günü sayılmaz. Takvim aralığındaki her gün için bir bitlik
+"iş günü mü" tablosu ve önek toplamları bir kez hesaplanır; böylece
+"N iş günü öncesi" sorgusu döngü olmadan, iki dizi okumasıyla yanıtlanır.
+"""
+
+import threading
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Ana avukata sunum: son teslim tarihinden kaç iş günü önce
+SUNUM_OFFSET_GUN = 2
+
+# Her yıl aynı gün olan resmi tatiller (ay, gün)
+RESMI_TATILLER = [
+    (1, 1),    # Yılbaşı
+    (4, 23),   # Ulusal Egemenlik ve Çocuk Bayramı
+    (5, 1),    # Emek ve Dayanışma Günü
+    (5, 19),   # Atatürk'ü Anma, Gençlik ve Spor Bayramı
+    (7, 15),   # Demokrasi ve Milli Birlik Günü
+    (8, 30),   # Zafer Bayramı
+    (10, 29),  # Cumhuriyet Bayramı
+]
+
+# Dini bayramlar: Ramazan ve Kurban Bayramı, Diyanet takvimine göre (yarım
+# gün olan arifeler iş günü sayılır). Tablo yalnızca burada bulunan yılları
+# kapsar; yeni yıllar yayımlandıkça eklenir
+DINI_BAYRAMLAR: Dict[int, List[Tuple[int, int, int]]] = {
+    # (ay, gün, gün sayısı)
+    2020: [(5, 24, 3), (7, 31, 4)],
+    2021: [(5, 13, 3), (7, 20, 4)],
+    2022: [(5, 2, 3), (7, 9, 4)],
+    2023: [(4, 21, 3), (6, 28, 4)],
+    2024: [(4, 10, 3), (6, 16, 4)],
+    2025: [(3, 30, 3), (6, 6, 4)],
+    2026: [(3, 20, 3), (5, 27, 4)],
+    2027: [(3, 9, 3), (5, 16, 4)],
+    2028: [(2, 26, 3), (5, 5, 4)],
+    2029: [(2, 14, 3), (4, 24, 4)],
+    2030: [(2, 4, 3), (4, 13, 4)],
+}
+
+# Varsayılan tablo aralığı: dini bayramları bilinen yıllar
+TABLO_BASLANGIC_YILI = min(DINI_BAYRAMLAR)
+TABLO_BITIS_YILI = max(DINI_BAYRAMLAR)
+
+# Adli tatil aralığı (HMK m.102): (ay, gün) başlangıç ve bitiş dahil
+ADLI_TATIL = ((7, 20), (8, 31))
+
+
+class JudicialCalendar:
+    """İş günü tablosu ve "N iş günü öncesi" hesaplayıcı
+
+    Tablo start_year - end_year aralığını kapsar; aralık dışındaki tarihler
+    için aynı kurallar gün gün uygulanır (yavaş). Dini bayramı
+    DINI_BAYRAMLAR'da bulunmayan yıllarda yalnızca hafta sonu, resmi tatil
+    ve adli tatil atlanır.
+    """
+
+    def __init__(self, start_year: int = TABLO_BASLANGIC_YILI, end_year: int = TABLO_BITIS_YILI,
+                 offset_days: int = SUNUM_OFFSET_GUN, adli_tatil: bool = True,
+                 dini_bayramlar: Dict[int, List[Tuple[int, int, int]]] = None,
+                 extra_holidays: Iterable[date] = ()):
+        self.offset_days = offset_days
+        self.adli_tatil = adli_tatil
+        self.start = date(start_year, 1, 1)
+        self.end = date(end_year, 12, 31)
+
+        self._holidays = set(extra_holidays)
+        for year, bayramlar in (DINI_BAYRAMLAR if dini_bayramlar is None else dini_bayramlar).items():
+            for month, day, length in bayramlar:
+                first = date(year, month, day)
+                self._holidays.update(first + timedelta(days=i) for i in range(length))
+
+        # Bit tablosu: gün sırası i iş günüyse (i >> 3). baytın (i & 7). biti 1
+        # prefix[i]: tablonun başından i. güne kadar (hariç) iş günü sayısı
+        # working[k]: k. iş gününün gün sırası (ters arama için)
+        size = (self.end - self.start).days + 1
+        self._bits = bytearray((size + 7) // 8)
+        self._prefix = array('l', [0]) * (size + 1)
+        self._working = array('l')
+        count = 0
+        day = self.start
+        for i in range(size):
+            self._prefix[i] = count
+            if self._is_working_by_rules(day):
+                self._bits[i >> 3] |= 1 << (i & 7)
+                self._working.append(i)
+                count += 1
+            day += timedelta(days=1)
+        self._prefix[size] = count
+
+    def _is_working_by_rules(self, day: date) -> bool:
+        """Kurallara göre iş günü mü? (tablo kurulumu ve aralık dışı için)"""
+        if day.weekday() >= 5 or day in self._holidays:
+            return False
+        if (day.month, day.day) in RESMI_TATILLER:
+            return False
+        if self.adli_tatil and ADLI_TATIL[0] <= (day.month, day.day) <= ADLI_TATIL[1]:
+            return False
+        return True
+
+    def _index(self, day: date) -> Optional[int]:
+        """Günün tablodaki sırası (aralık dışıysa None)"""
+        if self.start <= day <= self.end:
+            return (day - self.start).days
+        return None
+
+    def is_working_day(self, day: date) -> bool:
+        """Gün iş günü mü?"""
+        i = self._index(day)
+        if i is None:
+            return self._is_working_by_rules(day)
+        return bool(self._bits[i >> 3] & (1 << (i & 7)))
+
+    def working_days_before(self, day: date, n: int) -> date:
+        """Günden önceki n. iş günü (gün kendisi sayılmaz)
+
+        n <= 0 ise gün iş günüyse kendisi, değilse önceki ilk iş günü döner.
+        """
+        if n <= 0:
+            return day if self.is_working_day(day) else self.working_days_before(day, 1)
+
+        i = self._index(day)
+        if i is not None:
+            # Bu günden önceki iş günleri: prefix[i]; istenen sıra prefix[i] - n
+            rank = self._prefix[i] - n
+            if rank >= 0:
+                return self.start + timedelta(days=self._working[rank])
+
+        # Tablo dışı: gün gün geri say
+        while n > 0:
+            day -= timedelta(days=1)
+            if self.is_working_day(day):
+                n -= 1
+        return day
+
+    def working_days_between(self, start: date, end: date) -> int:
+        """[start, end) aralığındaki iş günü sayısı"""
+        i, j = self._index(start), self._index(end)
+        if i is not None and j is not None and i <= j:
+            return self._prefix[j] - self._prefix[i]
+
+        count = 0
+        day = start
+        while day < end:
+            count += self.is_working_day(day)
+            day += timedelta(days=1)
+        return count
+
+    def sunum_tarihi(self, dilekce_son_teslim_tarihi: str, offset_days: int = None) -> str:
+        """Son teslim tarihinden (YYYY-MM-DD) ana avukata sunum tarihini hesapla"""
+        son_teslim = datetime.strptime(dilekce_son_teslim_tarihi, "%Y-%m-%d").date()
+        offset = self.offset_days if offset_days is None else offset_days
+        return self.working_days_before(son_teslim, offset).strftime("%Y-%m-%d")
+
+
+_default_calendar = None
+_default_lock = threading.Lock()
+
+
+def get_default_calendar() -> JudicialCalendar:
+    """Varsayılan kurallarla oluşturulmuş (paylaşılan) adli takvim"""
+    global _default_calendar
+    with _default_lock:
+        if _default_calendar is None:
+            _default_calendar = JudicialCalendar()
+        return _default_calendar
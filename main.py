@@ -10,8 +10,6 @@ from tkinter import messagebox
 import sys
 import os
 from datetime import datetime, timedelta
-import threading
-import time
 
 # Modern UI için ttkbootstrap
 try:
@@ -23,9 +21,11 @@ except ImportError:
     TTKBOOTSTRAP_AVAILABLE = False
 
 # Yerel modülleri import et
+from app_logging import setup_logging, shutdown_logging, get_logger
 from database import DatabaseManager
 from gui import MainGUI
 from notifications import NotificationManager
+from scheduler import Scheduler
 
 class HukukTakipSistemi:
     def __init__(self):
@@ -44,7 +44,7 @@ class HukukTakipSistemi:
             self.root.place_window_center()  # Pencereyi merkeze yerleştir
         
         # Veritabanı yöneticisini başlat
-        self.db_manager = DatabaseManager()
+        self.db_manager = DatabaseManager(row_records=True)
         
         # Bildirim yöneticisini başlat
         self.notification_manager = NotificationManager(self.db_manager)
@@ -56,20 +56,12 @@ class HukukTakipSistemi:
         self.start_notification_thread()
         
     def start_notification_thread(self):
-        """Günlük bildirimleri başlat"""
-        def notification_loop():
-            while True:
-                current_time = datetime.now()
-                # Her gün saat 09:00'da bildirimleri kontrol et
-                if current_time.hour == 9 and current_time.minute == 0:
-                    self.notification_manager.check_and_send_notifications()
-                    time.sleep(60)  # 1 dakika bekle
-                else:
-                    time.sleep(30)  # 30 saniye bekle
-        
-        # Daemon thread olarak çalıştır (ana program kapandığında otomatik kapansın)
-        notification_thread = threading.Thread(target=notification_loop, daemon=True)
-        notification_thread.start()
+        """Günlük bildirimleri zamanlayıcıya bağla ve zamanlayıcıyı başlat"""
+        # Zamanlayıcı yalnızca sıradaki işin zamanına kadar uyur; bildirim
+        # saati kaçırılırsa (ör. bilgisayar uykudaysa) kontrol bir kez telafi edilir
+        self.scheduler = Scheduler()
+        self.notification_manager.attach_scheduler(self.scheduler)
+        self.scheduler.start()
     
     def run(self):
         """Uygulamayı çalıştır"""
@@ -82,16 +74,21 @@ class HukukTakipSistemi:
     
     def shutdown(self):
         """Temiz kapatma"""
+        if hasattr(self, 'scheduler'):
+            self.scheduler.stop()
         if hasattr(self, 'db_manager'):
             self.db_manager.close()
+        shutdown_logging()
         self.root.quit()
 
 def main():
     """Ana fonksiyon"""
+    setup_logging()
     try:
         app = HukukTakipSistemi()
         app.run()
     except Exception as e:
+        get_logger(__name__).exception("Uygulama başlatılamadı")
         messagebox.showerror("Hata", f"Uygulama başlatılırken hata oluştu: {str(e)}")
         sys.exit(1)
 
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Sistem bildirimi arka uçları modülü
+
+Hangi bildirim yönteminin kullanılabileceği uygulama açılışında bir kez
+denetlenir ve sonuç önbelleğe alınır. Linux'ta bildirimler tek bir kalıcı
+D-Bus bağlantısı üzerinden (saf Python jeepney istemcisi ile) gönderilir;
+böylece her bildirim için kabuk ya da yeni süreç başlatılmaz.
+"""
+
+import shutil
+import subprocess
+import sys
+import threading
+from typing import List, Optional, Tuple
+
+# D-Bus için saf Python istemci (isteğe bağlı)
+try:
+    from jeepney import DBusAddress, new_method_call
+    try:
+        from jeepney.io.blocking import open_dbus_connection
+    except ImportError:  # jeepney < 0.7
+        from jeepney.integrate.blocking import connect_and_authenticate as open_dbus_connection
+    JEEPNEY_AVAILABLE = True
+except ImportError:
+    JEEPNEY_AVAILABLE = False
+
+# Sistem bildirimi için gerekli kütüphaneler
+try:
+    from plyer import notification
+    PLYER_AVAILABLE = True
+except ImportError:
+    PLYER_AVAILABLE = False
+
+# Windows için
+if sys.platform == "win32":
+    try:
+        import win32api
+        import win32con
+        WIN32_AVAILABLE = True
+    except ImportError:
+        WIN32_AVAILABLE = False
+else:
+    WIN32_AVAILABLE = False
+
+APP_NAME = "Hukuk Takip Sistemi"
+
+
+class NotificationBackend:
+    """Sistem bildirimi arka ucu için temel sınıf"""
+
+    name = "temel"
+
+    # Bildirim kullanıcıya gerçekten gösteriliyor mu? (boş arka uç için False)
+    displays = True
+
+    @classmethod
+    def probe(cls) -> Optional['NotificationBackend']:
+        """Arka uç bu sistemde kullanılabiliyorsa örneğini döndür"""
+        return None
+
+    def notify(self, title: str, message: str):
+        """Bildirimi gönder"""
+        raise NotImplementedError
+
+    def close(self):
+        """Arka ucun kaynaklarını serbest bırak"""
+        pass
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class DBusBackend(NotificationBackend):
+    """org.freedesktop.Notifications servisine kalıcı D-Bus bağlantısı
+
+    Aynı bağlantı tüm bildirimler için yeniden kullanılır. Yeni bildirim bir
+    öncekinin yerine geçer (replaces_id); bildirim yağmurunda masaüstü
+    bildirim balonlarıyla dolmaz.
+    """
+
+    name = "dbus"
+
+    # Bildirimin ekranda kalma süresi (ms)
+    TIMEOUT_MS = 10000
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._lock = threading.Lock()  # Bağlantı thread güvenli değil
+        self._last_id = 0
+        self._address = DBusAddress('/org/freedesktop/Notifications',
+                                    bus_name='org.freedesktop.Notifications',
+                                    interface='org.freedesktop.Notifications')
+
+    @classmethod
+    def probe(cls) -> Optional['DBusBackend']:
+        """Oturum D-Bus'ına bağlanıp bildirim servisini sorgula"""
+        if not JEEPNEY_AVAILABLE or sys.platform in ("win32", "darwin"):
+            return None
+        try:
+            connection = open_dbus_connection(bus='SESSION')
+        except Exception:
+            return None
+
+        backend = cls(connection)
+        try:
+            msg = new_method_call(backend._address, 'GetServerInformation')
+            connection.send_and_get_reply(msg, timeout=2)
+        except Exception:
+            backend.close()
+            return None
+        return backend
+
+    def notify(self, title: str, message: str):
+        """Bildirimi mevcut bağlantı üzerinden gönder"""
+        with self._lock:
+            msg = new_method_call(self._address, 'Notify', 'susssasa{sv}i', (
+                APP_NAME, self._last_id, '', title, message, [], {}, self.TIMEOUT_MS
+            ))
+            reply = self._connection.send_and_get_reply(msg, timeout=5)
+            self._last_id = reply.body[0]
+
+    def close(self):
+        """D-Bus bağlantısını kapat"""
+        with self._lock:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+
+
+class PlyerBackend(NotificationBackend):
+    """plyer kütüphanesi ile bildirim"""
+
+    name = "plyer"
+
+    @classmethod
+    def probe(cls) -> Optional['PlyerBackend']:
+        """plyer kuruluysa kullan"""
+        return cls() if PLYER_AVAILABLE else None
+
+    def notify(self, title: str, message: str):
+        """plyer üzerinden bildirim gönder"""
+        notification.notify(title=title, message=message, app_name=APP_NAME, timeout=10)
+
+
+class Win32Backend(NotificationBackend):
+    """Windows mesaj kutusu ile bildirim"""
+
+    name = "win32"
+
+    @classmethod
+    def probe(cls) -> Optional['Win32Backend']:
+        """pywin32 kuruluysa kullan"""
+        return cls() if WIN32_AVAILABLE else None
+
+    def notify(self, title: str, message: str):
+        """Windows sistem bildirimi göster"""
+        win32api.MessageBox(0, message, title, win32con.MB_OK | win32con.MB_TOPMOST)
+
+
+class NotifySendBackend(NotificationBackend):
+    """notify-send programı ile bildirim (son çare)
+
+    Program yolu açılışta bir kez bulunur; bildirim kabuk olmadan argüman
+    listesiyle başlatılır, böylece tırnak içeren dosya numaraları komutu
+    bozmaz. Süreç beklenmez, biten süreçler sonraki çağrıda toplanır.
+    """
+
+    name = "notify-send"
+
+    def __init__(self, executable: str):
+        self.executable = executable
+        self._processes = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def probe(cls) -> Optional['NotifySendBackend']:
+        """notify-send PATH'te varsa kullan"""
+        if sys.platform == "win32":
+            return None
+        executable = shutil.which("notify-send")
+        return cls(executable) if executable else None
+
+    def notify(self, title: str, message: str):
+        """notify-send sürecini başlat"""
+        with self._lock:
+            self._processes = [p for p in self._processes if p.poll() is None]
+            self._processes.append(subprocess.Popen(
+                [self.executable, "--app-name", APP_NAME, "--", title, message],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            ))
+
+    def close(self):
+        """Bitmemiş süreçleri topla"""
+        with self._lock:
+            for process in self._processes:
+                try:
+                    process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    pass
+            self._processes = []
+
+
+class NullBackend(NotificationBackend):
+    """Sistem bildirimi yokken kullanılan boş arka uç"""
+
+    name = "yok"
+    displays = False
+
+    @classmethod
+    def probe(cls) -> 'NullBackend':
+        """Her zaman kullanılabilir"""
+        return cls()
+
+    def notify(self, title: str, message: str):
+        """Hiçbir şey yapma"""
+        pass
+
+
+class RecordingBackend(NotificationBackend):
+    """Testler için gönderilen bildirimleri kaydeden arka uç"""
+
+    name = "kayit"
+
+    def __init__(self):
+        self.sent: List[Tuple[str, str]] = []
+
+    @classmethod
+    def probe(cls) -> 'RecordingBackend':
+        """Her zaman kullanılabilir"""
+        return cls()
+
+    def notify(self, title: str, message: str):
+        """Bildirimi listeye ekle"""
+        self.sent.append((title, message))
+
+
+# Denetim sırası: kalıcı bağlantılı arka uçlar önce
+BACKEND_ORDER = [DBusBackend, PlyerBackend, Win32Backend, NotifySendBackend, NullBackend]
+
+_default_backend = None
+_default_lock = threading.Lock()
+
+
+def probe_backend(order: List[type] = None) -> NotificationBackend:
+    """Sırayla denetleyip ilk kullanılabilir arka ucu döndür"""
+    for backend_class in order or BACKEND_ORDER:
+        try:
+            backend = backend_class.probe()
+        except Exception:
+            backend = None
+        if backend is not None:
+            return backend
+    return NullBackend()
+
+
+def get_default_backend() -> NotificationBackend:
+    """Süreç boyunca önbelleğe alınmış varsayılan arka ucu getir"""
+    global _default_backend
+    with _default_lock:
+        if _default_backend is None:
+            _default_backend = probe_backend()
+        return _default_backend
+
+
+def set_default_backend(backend: Optional[NotificationBackend]):
+    """Varsayılan arka ucu değiştir (None: bir sonraki çağrıda yeniden denetle)"""
+    global _default_backend
+    with _default_lock:
+        if _default_backend is not None and _default_backend is not backend:
+            _default_backend.close()
+        _default_backend = backend
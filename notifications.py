@@ -8,41 +8,69 @@ Bildirim yönetimi modülü
 import tkinter as tk
 from tkinter import messagebox
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
+import functools
 import threading
 import time
-import os
-import sys
 
-# Sistem bildirimi için gerekli kütüphaneler
-try:
-    from plyer import notification
-    PLYER_AVAILABLE = True
-except ImportError:
-    PLYER_AVAILABLE = False
+from app_logging import get_logger
+from database import DatabaseManager
+from notification_backends import NotificationBackend, get_default_backend
+from reminders import ReminderDispatcher
 
-# Windows için
-if sys.platform == "win32":
-    try:
-        import win32gui
-        import win32con
-        WIN32_AVAILABLE = True
-    except ImportError:
-        WIN32_AVAILABLE = False
-else:
-    WIN32_AVAILABLE = False
+logger = get_logger(__name__)
 
-from database import DatabaseManager
 
 class NotificationManager:
-    def __init__(self, db_manager: DatabaseManager):
+    # Gönderim defterinde bu yöneticinin bildirimlerinin kaydedildiği kanal
+    NOTIFICATION_CHANNEL = 'masaustu'
+    
+    def __init__(self, db_manager: DatabaseManager,
+                 backend: Optional[NotificationBackend] = None):
         self.db_manager = db_manager
+        # Sistem bildirimi arka ucu (açılışta bir kez denetlenir)
+        self.backend = backend or get_default_backend()
         self.notification_time = "09:00"  # Varsayılan bildirim saati
         self.days_ahead = 7  # Kaç gün öncesinden bildirim gönderilecek
         self.last_check_date = None
         
-        # Bildirim pencereleri listesi
-        self.notification_windows = []
+        # Tüm bildirimlerin toplandığı tek pencere (ilk bildirimde oluşturulur)
+        self.notification_center = None
+        
+        # Günlük kontrolü çalıştıran zamanlayıcı (attach_scheduler ile bağlanır)
+        self.scheduler = None
+        self.daily_job = None
+        self.reminder_dispatcher = None
+    
+    def attach_scheduler(self, scheduler):
+        """Günlük bildirim kontrolünü ve ertelenen bildirimleri zamanlayıcıya bağla"""
+        self.scheduler = scheduler
+        self.daily_job = scheduler.add_daily_job(
+            self.check_and_send_notifications,
+            lambda: self.notification_time,
+            name="gunluk_bildirim"
+        )
+        
+        # Önceki oturumdan kalan ertelemeler de kuyruktan devam eder
+        self.reminder_dispatcher = ReminderDispatcher(self.db_manager, scheduler,
+                                                      self.show_reminders)
+        self.reminder_dispatcher.start()
+    
+    def snooze(self, title: str, message: str, data: Dict, delay_seconds: int = None):
+        """Bildirimi ertele (varsayılan 1 saat); kalıcı kuyruğa yazılır"""
+        if self.reminder_dispatcher is None:
+            logger.warning("Erteleme yapılamadı: zamanlayıcı bağlı değil")
+            return
+        try:
+            self.reminder_dispatcher.snooze(title, message, data, delay_seconds)
+        except Exception as e:
+            logger.error("Erteleme hatası: %s", e)
+    
+    def show_reminders(self, reminders: List[Dict]):
+        """Zamanı gelen ertelenmiş bildirimleri tek grup olarak göster"""
+        self.show_notification_batch([
+            {'title': r['baslik'], 'message': r['mesaj'], 'data': r['veri']} for r in reminders
+        ])
     
     def set_notification_time(self, time_str: str):
         """Bildirim saatini ayarla (HH:MM formatında)"""
@@ -51,6 +79,10 @@ class NotificationManager:
             self.notification_time = time_str
         except ValueError:
             raise ValueError("Geçersiz saat formatı. HH:MM formatında giriniz.")
+        
+        # Zamanlayıcıdaki günlük işi yeni saate taşı
+        if self.scheduler is not None and self.daily_job is not None:
+            self.scheduler.reschedule(self.daily_job)
     
     def set_days_ahead(self, days: int):
         """Kaç gün öncesinden bildirim gönderileceğini ayarla"""
@@ -59,106 +91,124 @@ class NotificationManager:
         self.days_ahead = days
     
     def check_and_send_notifications(self):
-        """Yaklaşan tarihleri kontrol et ve bildirim gönder"""
+        """Yaklaşan tarihleri kontrol et ve henüz gönderilmemiş bildirimleri gönder
+
+        Gönderilen olaylar veritabanındaki defterde tutulur; yeniden başlatma,
+        manuel kontrol veya aynı veritabanını kullanan başka bir uygulama aynı
+        bildirimi tekrar göndermez. Olaylar ancak gösterildikten sonra
+        gönderildi sayılır; gösterilemeyenler sonraki kontrolde tekrar denenir.
+        Uygulama içi gösterim ana thread'de sonradan gerçekleştiği için talep,
+        sonuç belli olduğunda _finish_claims ile onaylanır ya da bırakılır.
+        """
         try:
             today = datetime.now().date()
             
-            # Bugün zaten kontrol edilmiş mi?
-            if self.last_check_date == today:
-                return
-            
-            # Yaklaşan tarihleri al
-            upcoming_dosyalar = self.db_manager.get_upcoming_deadlines(self.days_ahead)
+            # Gönderilmemiş grupları al ve tek işlemde talep et
+            buckets = self.db_manager.claim_notification_buckets(
+                self.days_ahead, today, kanal=self.NOTIFICATION_CHANNEL
+            )
+            self.last_check_date = today
             
-            if not upcoming_dosyalar:
-                self.last_check_date = today
+            if not buckets:
                 return
             
-            # Bildirimleri grupla
-            notifications = self.prepare_notifications(upcoming_dosyalar)
-            
-            # Bildirimleri gönder
-            for notification_data in notifications:
-                self.send_notification(notification_data)
-            
-            self.last_check_date = today
+            # Bildirimleri hazırla ve tek grup olarak gönder
+            try:
+                self.send_notifications(self.prepare_notifications(buckets),
+                                        on_result=functools.partial(self._finish_claims, buckets))
+            except Exception:
+                # Onaylanmış olaylar silinmez; yalnızca bekleyen talepler bırakılır
+                self.db_manager.release_notification_claims(buckets, self.NOTIFICATION_CHANNEL)
+                raise
             
         except Exception as e:
             # Hata durumunda sessizce logla (debug için)
-            self.log_error(f"Bildirim kontrolü hatası: {str(e)}")
+            logger.exception("Bildirim kontrolü hatası: %s", e)
+    
+    def _finish_claims(self, buckets: List[Dict], gosterildi: bool):
+        """Gösterim sonucuna göre talepleri onayla ya da bırak"""
+        try:
+            if gosterildi:
+                self.db_manager.confirm_notification_claims(buckets, self.NOTIFICATION_CHANNEL)
+            else:
+                self.db_manager.release_notification_claims(buckets, self.NOTIFICATION_CHANNEL)
+        except Exception as e:
+            logger.exception("Bildirim defteri güncelleme hatası: %s", e)
     
-    def prepare_notifications(self, dosyalar: List[Dict]) -> List[Dict]:
-        """Bildirimleri hazırla ve grupla"""
-        today = datetime.now().date()
+    def prepare_notifications(self, buckets: List[Dict]) -> List[Dict]:
+        """Veritabanı gruplarından bildirimleri hazırla
+
+        Son teslim tarihleri tarih başına tek bildirimde toplanır; sunum
+        hatırlatmaları dosya başına ayrı gönderilir.
+        """
         notifications = []
         
-        # Tarihe göre grupla
-        by_date = {}
-        
-        for dosya in dosyalar:
-            if dosya['tamamlandi']:
-                continue
-            
-            # Son teslim tarihi kontrolü
-            try:
-                son_teslim = datetime.strptime(dosya['dilekce_son_teslim_tarihi'], '%Y-%m-%d').date()
-                kalan_gun = (son_teslim - today).days
-                
-                if kalan_gun <= self.days_ahead:
-                    date_key = son_teslim.strftime('%Y-%m-%d')
-                    if date_key not in by_date:
-                        by_date[date_key] = {'date': son_teslim, 'type': 'son_teslim', 'dosyalar': []}
-                    by_date[date_key]['dosyalar'].append({
+        for bucket in buckets:
+            if bucket['olay_turu'] == 'son_teslim':
+                notifications.append({
+                    'title': 'Dilekçe Son Teslim Hatırlatması',
+                    'type': 'son_teslim',
+                    'date': bucket['olay_tarihi'],
+                    'dosyalar': [{
+                        'dosya_id': dosya['id'],
                         'dosya_numarasi': dosya['dosya_numarasi'],
-                        'kalan_gun': kalan_gun,
-                        'tarih_str': son_teslim.strftime('%d.%m.%Y')
-                    })
-            except ValueError as e:
-                print(f"Bildirim tarih formatı hatası: {e} - Dosya: {dosya.get('dosya_numarasi', 'N/A')}")
-                pass
-            
-            # Ana avukata sunum tarihi kontrolü
-            try:
-                sunum_tarihi = datetime.strptime(dosya['ana_avukata_sunum_tarihi'], '%Y-%m-%d').date()
-                kalan_gun = (sunum_tarihi - today).days
-                
-                if kalan_gun <= self.days_ahead:
-                    date_key = sunum_tarihi.strftime('%Y-%m-%d') + '_sunum'
+                        'kalan_gun': bucket['kalan_gun'],
+                        'tarih_str': bucket['tarih_str']
+                    } for dosya in bucket['dosyalar']]
+                })
+            else:
+                for dosya in bucket['dosyalar']:
                     notifications.append({
                         'title': 'Ana Avukata Sunum Hatırlatması',
                         'type': 'sunum',
+                        'dosya_id': dosya['id'],
                         'dosya_numarasi': dosya['dosya_numarasi'],
-                        'tarih': sunum_tarihi,
-                        'kalan_gun': kalan_gun,
-                        'tarih_str': sunum_tarihi.strftime('%d.%m.%Y')
+                        'tarih': bucket['olay_tarihi'],
+                        'kalan_gun': bucket['kalan_gun'],
+                        'tarih_str': bucket['tarih_str']
                     })
-            except ValueError as e:
-                print(f"Bildirim tarih formatı hatası: {e} - Dosya: {dosya.get('dosya_numarasi', 'N/A')}")
-                pass
-        
-        # Son teslim tarihlerini ekle
-        for date_key, data in by_date.items():
-            notifications.append({
-                'title': 'Dilekçe Son Teslim Hatırlatması',
-                'type': 'son_teslim',
-                'date': data['date'],
-                'dosyalar': data['dosyalar']
-            })
         
         return notifications
     
     def send_notification(self, notification_data: Dict):
-        """Bildirim gönder"""
-        try:
-            if notification_data['type'] == 'son_teslim':
-                self.send_deadline_notification(notification_data)
-            elif notification_data['type'] == 'sunum':
-                self.send_presentation_notification(notification_data)
-        except Exception as e:
-            self.log_error(f"Bildirim gönderme hatası: {str(e)}")
+        """Tek bildirim gönder"""
+        self.send_notifications([notification_data])
+    
+    def send_notifications(self, notifications: List[Dict], on_result=None) -> bool:
+        """Bildirimleri tek seferde gönder: bir masaüstü özeti + bildirim merkezi
+
+        En az bir yolla gösterildiyse (veya gösterimi planlandıysa) True döner;
+        kesin sonuç on_result(bool) ile bildirilir (bkz. show_notification_batch).
+        """
+        entries = []
+        for notification_data in notifications:
+            try:
+                title, message = self.format_notification(notification_data)
+                entries.append({'title': title, 'message': message, 'data': notification_data})
+            except Exception as e:
+                logger.error("Bildirim gönderme hatası: %s", e)
+        
+        if not entries:
+            if on_result is not None:
+                on_result(False)
+            return False
+        return self.show_notification_batch(entries, on_result)
+    
+    def format_notification(self, data: Dict):
+        """Bildirimin (başlık, mesaj) metnini hazırla"""
+        if data['type'] == 'son_teslim':
+            return self.format_deadline_notification(data)
+        if data['type'] == 'sunum':
+            return self.format_presentation_notification(data)
+        raise ValueError(f"Bilinmeyen bildirim türü: {data['type']}")
     
     def send_deadline_notification(self, data: Dict):
         """Son teslim tarihi bildirimi gönder"""
+        title, message = self.format_deadline_notification(data)
+        self.show_notification(title, message, data)
+    
+    def format_deadline_notification(self, data: Dict):
+        """Son teslim tarihi bildiriminin metnini hazırla"""
         dosyalar = data['dosyalar']
         
         if len(dosyalar) == 1:
@@ -183,10 +233,15 @@ class NotificationManager:
             
             message += f"\nDosyalar: {', '.join([d['dosya_numarasi'] for d in dosyalar])}"
         
-        self.show_notification(title, message, data)
+        return title, message
     
     def send_presentation_notification(self, data: Dict):
         """Ana avukata sunum bildirimi gönder"""
+        title, message = self.format_presentation_notification(data)
+        self.show_notification(title, message, data)
+    
+    def format_presentation_notification(self, data: Dict):
+        """Ana avukata sunum bildiriminin metnini hazırla"""
         title = "Ana Avukata Sunum Hatırlatması"
         
         if data['kalan_gun'] == 0:
@@ -196,194 +251,206 @@ class NotificationManager:
         else:
             message = f"'{data['dosya_numarasi']}' numaralı dosyanın ana avukata sunum tarihine {data['kalan_gun']} gün kaldı!"
         
-        self.show_notification(title, message, data)
+        return title, message
     
     def show_notification(self, title: str, message: str, data: Dict):
-        """Bildirimi göster"""
-        # Önce sistem bildirimi göndermeyi dene
-        self.send_system_notification(title, message)
-        
-        # Sonra uygulama içi bildirim penceresi göster
-        self.show_app_notification(title, message, data)
+        """Tek bildirimi göster"""
+        self.show_notification_batch([{'title': title, 'message': message, 'data': data}])
     
-    def send_system_notification(self, title: str, message: str):
-        """Sistem bildirimi gönder"""
-        try:
-            if PLYER_AVAILABLE:
-                notification.notify(
-                    title=title,
-                    message=message,
-                    app_name="Hukuk Takip Sistemi",
-                    timeout=10
-                )
-            elif WIN32_AVAILABLE and sys.platform == "win32":
-                # Windows için alternatif yöntem
-                self.show_windows_notification(title, message)
-            else:
-                # Linux için notify-send dene
-                if os.system("which notify-send > /dev/null 2>&1") == 0:
-                    os.system(f'notify-send "{title}" "{message}"')
-        except:
-            pass  # Sistem bildirimi gösterilemezse sessizce devam et
+    def show_notification_batch(self, entries: List[Dict], on_result=None) -> bool:
+        """Bildirim grubunu göster: tek sistem bildirimi + bildirim merkezine ekleme
+
+        Sistem bildirimi başarılıysa veya bildirim merkezine ekleme planlandıysa
+        True döner. on_result verilirse gösterilip gösterilmediği belli olunca
+        (sistem bildirimi başarısızsa bildirim merkezi çalıştıktan sonra) tam
+        bir kez on_result(bool) çağrılır.
+        """
+        title, message = self.summarize_entries(entries)
+        sistem = self.send_system_notification(title, message)
+        if sistem and on_result is not None:
+            on_result(True)
+            on_result = None
+        planlandi = self.show_app_notification(entries, on_shown=on_result)
+        if not planlandi and on_result is not None:
+            on_result(False)
+        return sistem or planlandi
     
-    def show_windows_notification(self, title: str, message: str):
-        """Windows sistem bildirimi göster"""
+    @staticmethod
+    def summarize_entries(entries: List[Dict]):
+        """Bildirim grubu için tek masaüstü bildiriminin metnini hazırla"""
+        if len(entries) == 1:
+            return entries[0]['title'], entries[0]['message']
+        
+        title = f"Hukuk Takip: {len(entries)} hatırlatma"
+        lines = [entry['title'] for entry in entries[:3]]
+        if len(entries) > 3:
+            lines.append(f"... ve {len(entries) - 3} hatırlatma daha")
+        return title, "\n".join(lines)
+    
+    def send_system_notification(self, title: str, message: str) -> bool:
+        """Sistem bildirimi gönder (başarılıysa True)"""
         try:
-            import win32api
-            import win32con
-            
-            win32api.MessageBox(0, message, title, win32con.MB_OK | win32con.MB_TOPMOST)
-        except:
-            pass
+            self.backend.notify(title, message)
+            return self.backend.displays
+        except Exception as e:
+            # Sistem bildirimi gösterilemezse uygulama içi bildirimle devam et
+            logger.warning("Sistem bildirimi hatası (%s): %s", self.backend.name, e)
+            return False
     
-    def show_app_notification(self, title: str, message: str, data: Dict):
-        """Uygulama içi bildirim penceresi göster"""
+    def show_app_notification(self, entries: List[Dict], on_shown=None) -> bool:
+        """Bildirimleri uygulama içi bildirim merkezine ekle (planlandıysa True)
+
+        Ekleme ana thread'de sonradan yapılır; sonuç orada on_shown(bool) ile
+        bildirilir. Planlanamazsa on_shown çağrılmaz.
+        """
         try:
             # Ana thread'de çalıştır
             if hasattr(tk, '_default_root') and tk._default_root:
-                tk._default_root.after(0, lambda: self._create_notification_window(title, message, data))
+                tk._default_root.after(0, lambda: self._add_to_center(entries, on_shown))
+                return True
         except:
             pass
+        return False
     
-    def _create_notification_window(self, title: str, message: str, data: Dict):
-        """Bildirim penceresi oluştur"""
+    def _add_to_center(self, entries: List[Dict], on_shown=None):
+        """Bildirim merkezini (gerekirse) oluştur ve girdileri ekle"""
+        gosterildi = False
         try:
-            # Mevcut bildirim pencerelerini temizle
-            self.cleanup_notification_windows()
-            
-            # Yeni bildirim penceresi oluştur
-            notification_window = NotificationWindow(title, message, data)
-            self.notification_windows.append(notification_window)
-            
+            if self.notification_center is None:
+                self.notification_center = NotificationCenter(on_snooze=self.snooze)
+            self.notification_center.add_entries(entries)
+            gosterildi = True
         except Exception as e:
             # Hata durumunda basit messagebox göster
-            messagebox.showinfo(title, message)
-    
-    def cleanup_notification_windows(self):
-        """Kapatılmış bildirim pencerelerini temizle"""
-        self.notification_windows = [w for w in self.notification_windows if w.is_alive()]
+            logger.warning("Bildirim merkezi hatası: %s", e)
+            try:
+                title, message = self.summarize_entries(entries)
+                messagebox.showinfo(title, message)
+                gosterildi = True
+            except Exception as e:
+                logger.error("Bildirim gösterilemedi: %s", e)
+        if on_shown is not None:
+            on_shown(gosterildi)
     
     def manual_check(self):
-        """Manuel bildirim kontrolü (test için)"""
-        self.last_check_date = None  # Son kontrol tarihini sıfırla
+        """Manuel bildirim kontrolü (yalnızca gönderilmemiş bildirimler gönderilir)"""
         self.check_and_send_notifications()
-    
-    def log_error(self, error_message: str):
-        """Hata logu (debug için)"""
-        try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            log_message = f"{timestamp}: {error_message}\n"
-            
-            with open("hukuk_takip_errors.log", "a", encoding="utf-8") as f:
-                f.write(log_message)
-        except:
-            pass  # Log yazılamıyorsa sessizce devam et
 
 
-class NotificationWindow:
-    def __init__(self, title: str, message: str, data: Dict):
-        self.title = title
-        self.message = message
-        self.data = data
+class NotificationCenter:
+    """Tüm bildirimlerin toplandığı, yeniden kullanılan tek kaydırılabilir pencere
+
+    Yeni bildirim grupları mevcut pencereye eklenir; pencere kapatılınca
+    gizlenir ve sonraki grupta yeniden gösterilir.
+    """
+    
+    # Pencerede tutulacak en fazla girdi (eskiler atılır)
+    MAX_ENTRIES = 200
+    
+    def __init__(self, on_snooze=None):
+        self.on_snooze = on_snooze  # on_snooze(title, message, data)
+        self.entries = []
         self.window = None
-        self.is_window_alive = True
+        self.text = None
+        self.count_var = None
+    
+    def add_entries(self, entries: List[Dict]):
+        """Girdileri ekle ve pencereyi öne getir"""
+        if not self.is_alive():
+            self.create_window()
+        
+        self.entries.extend(entries)
+        if len(self.entries) > self.MAX_ENTRIES:
+            # En eski girdileri at, metni baştan yaz
+            self.entries = self.entries[-self.MAX_ENTRIES:]
+            self._render(self.entries, clear=True)
+        else:
+            self._render(entries)
         
-        self.create_window()
+        self.count_var.set(f"{len(self.entries)} hatırlatma")
+        self.window.deiconify()
+        self.window.lift()
     
     def create_window(self):
-        """Bildirim penceresini oluştur"""
-        try:
-            self.window = tk.Toplevel()
-            self.window.title(self.title)
-            self.window.geometry("400x250")
-            
-            # Pencereyi her zaman üstte tut
-            self.window.attributes('-topmost', True)
-            
-            # Pencereyi ekranın sağ alt köşesine yerleştir
-            self.window.update_idletasks()
-            screen_width = self.window.winfo_screenwidth()
-            screen_height = self.window.winfo_screenheight()
-            x = screen_width - self.window.winfo_width() - 50
-            y = screen_height - self.window.winfo_height() - 100
-            self.window.geometry(f"+{x}+{y}")
-            
-            # İçeriği oluştur
-            self.create_content()
-            
-            # Pencere kapatılma olayını yakala
-            self.window.protocol("WM_DELETE_WINDOW", self.close_window)
-            
-            # 10 saniye sonra otomatik kapat
-            self.window.after(10000, self.auto_close)
-            
-            # Pencereyi göster
-            self.window.focus_force()
-            
-        except Exception as e:
-            self.is_window_alive = False
-            # Pencere oluşturulamıyorsa basit messagebox göster
-            messagebox.showinfo(self.title, self.message)
-    
-    def create_content(self):
-        """Pencere içeriğini oluştur"""
-        main_frame = tk.Frame(self.window, bg='#f0f0f0', padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        """Bildirim merkezi penceresini oluştur (bir kez)"""
+        self.window = tk.Toplevel()
+        self.window.title("Bildirim Merkezi")
+        self.window.attributes('-topmost', True)
+        
+        # Pencereyi ekranın sağ alt köşesine yerleştir (boyut sabit, ölçüm gerekmez)
+        width, height = 420, 360
+        x = self.window.winfo_screenwidth() - width - 50
+        y = self.window.winfo_screenheight() - height - 100
+        self.window.geometry(f"{width}x{height}+{x}+{y}")
         
-        # İkon (emoji)
-        icon_text = "⚠️" if "Son Teslim" in self.title else "📋"
-        icon_label = tk.Label(main_frame, text=icon_text, font=('Arial', 24), bg='#f0f0f0')
-        icon_label.pack(pady=(0, 10))
+        main_frame = tk.Frame(self.window, bg='#f0f0f0', padx=10, pady=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Başlık
-        title_label = tk.Label(main_frame, text=self.title, 
-                              font=('Arial', 12, 'bold'), bg='#f0f0f0')
-        title_label.pack(pady=(0, 10))
+        self.count_var = tk.StringVar()
+        tk.Label(main_frame, textvariable=self.count_var, font=('Arial', 12, 'bold'),
+                 bg='#f0f0f0').pack(anchor=tk.W, pady=(0, 5))
         
-        # Mesaj
-        message_label = tk.Label(main_frame, text=self.message, 
-                                font=('Arial', 10), bg='#f0f0f0', 
-                                wraplength=350, justify='center')
-        message_label.pack(pady=(0, 20))
+        # Kaydırılabilir bildirim listesi
+        list_frame = tk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text = tk.Text(list_frame, wrap=tk.WORD, font=('Arial', 10),
+                            yscrollcommand=scrollbar.set, state=tk.DISABLED)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.text.yview)
+        self.text.tag_configure('baslik', font=('Arial', 10, 'bold'))
         
         # Butonlar
         button_frame = tk.Frame(main_frame, bg='#f0f0f0')
-        button_frame.pack()
+        button_frame.pack(pady=(10, 0))
         
-        ok_button = tk.Button(button_frame, text="Tamam", 
-                             command=self.close_window, 
-                             bg='#4CAF50', fg='white', 
-                             font=('Arial', 10, 'bold'),
-                             padx=20)
-        ok_button.pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Tamam", command=self.clear,
+                  bg='#4CAF50', fg='white', font=('Arial', 10, 'bold'),
+                  padx=20).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="1 Saat Sonra Hatırlat", command=self.snooze_all,
+                  bg='#FF9800', fg='white', font=('Arial', 10),
+                  padx=20).pack(side=tk.LEFT, padx=5)
         
-        snooze_button = tk.Button(button_frame, text="1 Saat Sonra Hatırlat", 
-                                 command=self.snooze_notification, 
-                                 bg='#FF9800', fg='white', 
-                                 font=('Arial', 10),
-                                 padx=20)
-        snooze_button.pack(side=tk.LEFT, padx=5)
-    
-    def close_window(self):
-        """Pencereyi kapat"""
-        self.is_window_alive = False
-        if self.window:
-            self.window.destroy()
-    
-    def auto_close(self):
-        """Otomatik kapatma"""
-        if self.is_window_alive:
-            self.close_window()
-    
-    def snooze_notification(self):
-        """Bildirimi 1 saat sonraya ertele"""
-        self.close_window()
-        # Gerçek bir uygulamada burada ertele mantığı olurdu
-        # Şimdilik sadece pencereyi kapat
+        # Kapatma düğmesi pencereyi yok etmez, gizler
+        self.window.protocol("WM_DELETE_WINDOW", self.clear)
+    
+    def _render(self, entries: List[Dict], clear: bool = False):
+        """Girdileri metin alanına yaz"""
+        self.text.configure(state=tk.NORMAL)
+        if clear:
+            self.text.delete('1.0', tk.END)
+        for entry in entries:
+            icon = "⚠️" if "Son Teslim" in entry['title'] else "📋"
+            self.text.insert(tk.END, f"{icon} {entry['title']}\n", 'baslik')
+            self.text.insert(tk.END, f"{entry['message']}\n\n")
+        self.text.configure(state=tk.DISABLED)
+        self.text.see(tk.END)
+    
+    def clear(self):
+        """Girdileri temizle ve pencereyi gizle"""
+        self.entries = []
+        if self.is_alive():
+            self._render([], clear=True)
+            self.window.withdraw()
+    
+    def snooze_all(self):
+        """Penceredeki tüm bildirimleri tek hatırlatıcı olarak ertele"""
+        entries = self.entries
+        self.clear()
+        if not self.on_snooze or not entries:
+            return
+        
+        if len(entries) == 1:
+            self.on_snooze(entries[0]['title'], entries[0]['message'], entries[0]['data'])
+        else:
+            title, _ = NotificationManager.summarize_entries(entries)
+            message = "\n\n".join(f"{e['title']}: {e['message']}" for e in entries)
+            self.on_snooze(title, message, {'type': 'grup', 'adet': len(entries)})
     
     def is_alive(self):
-        """Pencere hala açık mı?"""
-        return self.is_window_alive and self.window and self.window.winfo_exists()
+        """Pencere hala mevcut mu?"""
+        return self.window is not None and self.window.winfo_exists()
 
 
 # Test fonksiyonu
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Hafif dosya kayıtları
+
+Dosya, her satır için sözlük yerine __slots__ kullanan küçük bir nesnedir;
+tarih sütunları okunurken bir kez datetime.date'e çevrilir. Sözlük arayüzü
+(dosya['alan'], dosya.get, 'alan' in dosya, dict(dosya)) veritabanındaki
+gösterimi döndürdüğü için sözlük bekleyen mevcut kodlar değişmeden çalışır.
+"""
+
+from datetime import date, datetime
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+
+def _tarih(value) -> Union[date, str, None]:
+    """'YYYY-MM-DD' metnini date'e çevir (bozuk değer olduğu gibi bırakılır)"""
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class Dosya:
+    """Tek bir dosya satırı (dosyalar tablosunun sütun sırasıyla)
+
+    Öznitelikler türlendirilmiş değerlerdir (dosya.dilekce_son_teslim_tarihi
+    bir date'tir); anahtarla erişim ise 'YYYY-MM-DD' metnini döndürür.
+    """
+
+    FIELDS = ('id', 'dosya_numarasi', 'dilekce_son_teslim_tarihi', 'ana_avukata_sunum_tarihi',
+              'olusturma_tarihi', 'guncelleme_tarihi', 'tamamlandi', 'notlar')
+    DATE_FIELDS = frozenset(('dilekce_son_teslim_tarihi', 'ana_avukata_sunum_tarihi'))
+    _FIELD_SET = frozenset(FIELDS)
+
+    __slots__ = FIELDS
+
+    def __init__(self, id, dosya_numarasi, dilekce_son_teslim_tarihi, ana_avukata_sunum_tarihi,
+                 olusturma_tarihi=None, guncelleme_tarihi=None, tamamlandi=0, notlar=''):
+        self.id = id
+        self.dosya_numarasi = dosya_numarasi
+        self.dilekce_son_teslim_tarihi = _tarih(dilekce_son_teslim_tarihi)
+        self.ana_avukata_sunum_tarihi = _tarih(ana_avukata_sunum_tarihi)
+        self.olusturma_tarihi = olusturma_tarihi
+        self.guncelleme_tarihi = guncelleme_tarihi
+        self.tamamlandi = tamamlandi
+        self.notlar = notlar
+
+    @classmethod
+    def row_factory(cls, cursor, row: Tuple) -> 'Dosya':
+        """sqlite3 imleci için satır fabrikası (SELECT * FROM dosyalar sırası)"""
+        return cls(*row)
+
+    @classmethod
+    def from_mapping(cls, mapping) -> 'Dosya':
+        """Sözlükten (veya sqlite3.Row'dan) kayıt oluştur"""
+        return cls(*(mapping[name] for name in cls.FIELDS))
+
+    # --- Sözlük uyumluluğu ---
+
+    def __getitem__(self, key: str):
+        if key not in self._FIELD_SET:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if key in self.DATE_FIELDS and isinstance(value, date):
+            return value.isoformat()
+        return value
+
+    def __setitem__(self, key: str, value):
+        if key not in self._FIELD_SET:
+            raise KeyError(key)
+        setattr(self, key, _tarih(value) if key in self.DATE_FIELDS else value)
+
+    def __contains__(self, key) -> bool:
+        return key in self._FIELD_SET
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def get(self, key: str, default=None):
+        """dict.get ile aynı"""
+        return self[key] if key in self._FIELD_SET else default
+
+    def keys(self) -> Tuple[str, ...]:
+        """Alan adları"""
+        return self.FIELDS
+
+    def items(self):
+        """(alan, değer) çiftleri (veritabanı gösterimiyle)"""
+        return [(name, self[name]) for name in self.FIELDS]
+
+    def to_dict(self) -> Dict:
+        """Sözlüğe çevir"""
+        return dict(self.items())
+
+    def copy(self) -> 'Dosya':
+        """Sığ kopya"""
+        clone = Dosya.__new__(Dosya)
+        for name in self.FIELDS:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Dosya):
+            return all(getattr(self, n) == getattr(other, n) for n in self.FIELDS)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"<Dosya {self.id} {self.dosya_numarasi} {self['dilekce_son_teslim_tarihi']}>"
+
+
+def dosya_tarihi(dosya, alan: str) -> Optional[date]:
+    """Dosyanın tarih alanını date olarak getir
+
+    Dosya kayıtlarında okuma sırasında çözülmüş değer kullanılır; sözlüklerde
+    metin ayrıştırılır. Geçersiz tarihte ValueError fırlatır.
+    """
+    value = getattr(dosya, alan) if isinstance(dosya, Dosya) else dosya[alan]
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, '%Y-%m-%d').date()
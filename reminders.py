@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Ertelenen bildirimler (hatırlatıcı kuyruğu) modülü
+
+Hatırlatıcılar veritabanında saklanır, böylece uygulama kapanıp açılsa da
+kaybolmaz. Zamanlayıcıda kuyruğun tamamı için tek bir iş bulunur: en yakın
+hatırlatıcının zamanı. Tablo yoklanmaz; kuyrukta binlerce kayıt olsa da
+her tetiklemede yalnızca indeksli bir MIN(zaman) sorgusu çalışır.
+"""
+
+import threading
+from typing import Callable, Dict, List
+
+from database import DatabaseManager
+from scheduler import Scheduler
+
+
+class ReminderDispatcher:
+    """Kalıcı hatırlatıcıları zamanı gelince tetikler
+
+    Aynı dakika içinde zamanı gelen hatırlatıcılar tek seferde
+    on_fire(hatirlaticilar) ile teslim edilir.
+    """
+
+    # Varsayılan erteleme süresi (saniye)
+    DEFAULT_SNOOZE_SECONDS = 60 * 60
+
+    def __init__(self, db_manager: DatabaseManager, scheduler: Scheduler,
+                 on_fire: Callable[[List[Dict]], None]):
+        self.db_manager = db_manager
+        self.scheduler = scheduler
+        self.on_fire = on_fire
+        self._job = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Kalıcı kuyruktaki en yakın hatırlatıcıyı zamanlayıcıya bağla"""
+        self._schedule_next()
+
+    def snooze(self, baslik: str, mesaj: str, veri: Dict = None,
+               delay_seconds: int = None) -> int:
+        """Bildirimi ertele; hatırlatıcı id'sini döndür"""
+        delay = self.DEFAULT_SNOOZE_SECONDS if delay_seconds is None else delay_seconds
+        zaman = self.scheduler.clock() + delay
+        reminder_id = self.db_manager.add_reminder(zaman, baslik, mesaj, veri)
+        self._schedule_next()
+        return reminder_id
+
+    def _schedule_next(self):
+        """Zamanlayıcıdaki tek işi en yakın hatırlatıcıya ayarla"""
+        next_time = self.db_manager.get_next_reminder_time()
+        with self._lock:
+            if next_time is None:
+                if self._job is not None:
+                    self.scheduler.cancel(self._job)
+                return
+
+            if self._job is None:
+                self._job = self.scheduler.add_job(self._fire, next_time, name="hatirlatici")
+            elif self._job.cancelled or self._job.due != next_time:
+                self.scheduler.reschedule(self._job, next_time)
+
+    def _fire(self):
+        """Zamanı gelen (aynı dakikadaki) hatırlatıcıları teslim et"""
+        with self._lock:
+            due = self._job.due if self._job is not None else 0
+        now = max(self.scheduler.clock(), due)
+        # Bu dakikanın sonuna kadar olanlar tek açılır pencerede toplanır
+        minute_end = (int(now) // 60) * 60 + 59
+        reminders = self.db_manager.claim_due_reminders(minute_end)
+
+        # Tek seferlik iş çalıştı; bir sonraki hatırlatıcı için yeniden kur
+        with self._lock:
+            self._job = None
+        self._schedule_next()
+
+        if reminders:
+            self.on_fire(reminders)
+
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Zamanlanmış işler modülü
+
+İşler bir min-heap içinde zamanına göre tutulur; zamanlayıcı thread'i
+yalnızca en yakın işin zamanına kadar uyur. Zamanlar duvar saatine göre
+tutulduğu için bilgisayar uykudan uyandığında kaçırılan iş bir kez
+çalıştırılır (her kaçırılan gün için ayrı ayrı değil).
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from app_logging import get_logger, log_duration
+
+logger = get_logger(__name__)
+
+
+class ScheduledJob:
+    """Zamanlayıcıdaki tek bir iş (tek seferlik veya günlük)"""
+
+    def __init__(self, func: Callable[[], None], name: str = None,
+                 time_of_day: Callable[[], str] = None):
+        self.func = func
+        self.name = name or getattr(func, '__name__', 'is')
+        # Günlük işler için "SS:DD" döndüren fonksiyon (her seferinde yeniden okunur)
+        self.time_of_day = time_of_day
+        self.due = None  # Epoch saniyesi
+        self.cancelled = False
+        self._version = 0  # Yeniden planlanınca heap'teki eski kayıt geçersiz olur
+
+    @property
+    def is_daily(self) -> bool:
+        """Her gün tekrarlanan iş mi?"""
+        return self.time_of_day is not None
+
+    def __repr__(self):
+        due = datetime.fromtimestamp(self.due).strftime('%Y-%m-%d %H:%M:%S') if self.due else '-'
+        return f"<ScheduledJob {self.name} @ {due}>"
+
+
+def bugunku_zaman(saat_str: str, now: float) -> float:
+    """'SS:DD' saatinin verilen günkü gerçekleşmesi (epoch saniyesi)"""
+    saat, dakika = (int(parca) for parca in saat_str.split(':'))
+    gun = datetime.fromtimestamp(now)
+    return gun.replace(hour=saat, minute=dakika, second=0, microsecond=0).timestamp()
+
+
+def sonraki_gunluk_zaman(saat_str: str, after: float) -> float:
+    """'SS:DD' saatinin verilen andan sonraki ilk gerçekleşmesi"""
+    aday = bugunku_zaman(saat_str, after)
+    if aday <= after:
+        saat, dakika = (int(parca) for parca in saat_str.split(':'))
+        yarin = datetime.fromtimestamp(after) + timedelta(days=1)
+        aday = yarin.replace(hour=saat, minute=dakika, second=0, microsecond=0).timestamp()
+    return aday
+
+
+class Scheduler:
+    """Min-heap tabanlı iş zamanlayıcı
+
+    Tek bir daemon thread en yakın işin zamanına kadar Condition üzerinde
+    bekler. Yeni iş eklenince / iptal edilince thread uyandırılır.
+    """
+
+    # Condition.wait monoton saatle çalışır ve uyku kipinde durabilir; bu
+    # yüzden en fazla bu kadar uyunup duvar saati yeniden kontrol edilir.
+    MAX_SLEEP_SECONDS = 15 * 60
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self._heap = []  # (due, sıra, versiyon, iş)
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def add_job(self, func: Callable[[], None], when, name: str = None) -> ScheduledJob:
+        """Tek seferlik iş ekle (when: datetime veya epoch saniyesi)"""
+        job = ScheduledJob(func, name)
+        self._push(job, self._timestamp(when))
+        return job
+
+    def add_daily_job(self, func: Callable[[], None], time_of_day: Callable[[], str],
+                      name: str = None, catch_up: bool = True) -> ScheduledJob:
+        """Her gün time_of_day() saatinde çalışacak iş ekle
+
+        catch_up True ise bugünün saati geçmiş olsa bile iş hemen bir kez
+        çalışır (uygulama geç açıldığında o günün kontrolü kaçırılmasın).
+        """
+        job = ScheduledJob(func, name, time_of_day)
+        now = self.clock()
+        due = bugunku_zaman(time_of_day(), now)
+        if due <= now:
+            # Bugünün saati geçmiş: telafi için hemen, aksi halde yarın
+            due = now if catch_up else sonraki_gunluk_zaman(time_of_day(), now)
+        self._push(job, due)
+        return job
+
+    def reschedule(self, job: ScheduledJob, when=None):
+        """İşi yeniden planla; günlük işlerde saat time_of_day()'den yeniden okunur"""
+        if when is None:
+            if not job.is_daily:
+                raise ValueError("Tek seferlik iş için yeni zaman verilmelidir")
+            due = sonraki_gunluk_zaman(job.time_of_day(), self.clock())
+        else:
+            due = self._timestamp(when)
+        self._push(job, due)
+
+    def cancel(self, job: ScheduledJob):
+        """İşi iptal et (heap'ten tembel olarak silinir)"""
+        with self._condition:
+            job.cancelled = True
+            job._version += 1
+            self._condition.notify()
+
+    def pending_jobs(self) -> List[ScheduledJob]:
+        """Bekleyen işleri zaman sırasıyla getir"""
+        with self._condition:
+            return [job for _, _, version, job in sorted(self._heap)
+                    if not job.cancelled and version == job._version]
+
+    def next_due(self) -> Optional[float]:
+        """En yakın işin zamanı (yoksa None)"""
+        with self._condition:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def run_pending(self, now: float = None) -> int:
+        """Zamanı gelmiş tüm işleri çalıştır, çalışan iş sayısını döndür"""
+        now = self.clock() if now is None else now
+        due_jobs = self._pop_due(now)
+        for job in due_jobs:
+            try:
+                with log_duration(logger, "Zamanlanmış iş çalıştı: %s", job.name):
+                    job.func()
+            except Exception:
+                logger.exception("Zamanlanmış iş hatası (%s)", job.name)
+
+            if job.is_daily and not job.cancelled:
+                # Kaçırılan günler tek tek telafi edilmez: bir sonraki gerçek saat
+                after = max(now, job.due)
+                self._push(job, sonraki_gunluk_zaman(job.time_of_day(), after))
+        return len(due_jobs)
+
+    def start(self):
+        """Zamanlayıcı thread'ini başlat"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="zamanlayici", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Zamanlayıcıyı durdur"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def _run(self):
+        """En yakın işin zamanına kadar uyu, zamanı gelenleri çalıştır"""
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                self._drop_stale()
+                now = self.clock()
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                delay = self._heap[0][0] - now
+                if delay > 0:
+                    self._condition.wait(min(delay, self.MAX_SLEEP_SECONDS))
+                    continue
+
+            self.run_pending()
+
+    def _push(self, job: ScheduledJob, due: float):
+        """İşi heap'e (yeni versiyonla) ekle ve thread'i uyandır"""
+        with self._condition:
+            job._version += 1
+            job.due = due
+            job.cancelled = False
+            heapq.heappush(self._heap, (due, next(self._counter), job._version, job))
+            self._condition.notify()
+
+    def _pop_due(self, now: float) -> List[ScheduledJob]:
+        """Zamanı gelmiş geçerli işleri heap'ten çıkar"""
+        due_jobs = []
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, version, job = heapq.heappop(self._heap)
+                if not job.cancelled and version == job._version:
+                    due_jobs.append(job)
+        return due_jobs
+
+    def _drop_stale(self):
+        """Heap başındaki iptal edilmiş / eskimiş kayıtları at"""
+        while self._heap:
+            _, _, version, job = self._heap[0]
+            if not job.cancelled and version == job._version:
+                break
+            heapq.heappop(self._heap)
+
+    @staticmethod
+    def _timestamp(when) -> float:
+        """datetime veya epoch saniyesini epoch saniyesine çevir"""
+        if isinstance(when, datetime):
+            return when.timestamp()
+        return float(when)
@@ -14,6 +14,21 @@ import shutil
 
 # Test modülleri
 from database import DatabaseManager
+from async_database import AsyncDatabaseManager
+import unittest.mock
+import calendar_canvas
+from calendar_canvas import CalendarCanvas
+from calendar_view import CalendarView, MonthCache, month_grid_range
+from year_heatmap import heat_color, year_cell_position
+from judicial_calendar import JudicialCalendar, DINI_BAYRAMLAR
+from records import Dosya, dosya_tarihi
+from scheduler import Scheduler
+from reminders import ReminderDispatcher
+from notifications import NotificationManager
+import logging
+from app_logging import (setup_logging, shutdown_logging, get_logger, log_duration,
+                         RateLimitFilter)
+from notification_backends import RecordingBackend, NullBackend, probe_backend
 
 class TestDatabaseManager(unittest.TestCase):
     """Veritabanı yöneticisi test sınıfı"""
@@ -39,6 +54,34 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(len(dosyalar), 1)
         self.assertEqual(dosyalar[0]['dosya_numarasi'], "TEST-001")
     
+    def test_add_dosyalar_bulk(self):
+        """Toplu ekleme testi"""
+        self.db.add_dosya("TEST-001", "2024-12-31", "Önceden var")
+
+        results = self.db.add_dosyalar_bulk([
+            ("TEST-001", "2024-12-31", "Mevcut"),
+            ("TEST-002", "2024-12-15", "Yeni"),
+            {"dosya_numarasi": "TEST-003", "dilekce_son_teslim_tarihi": "2024-11-30"},
+            ("TEST-004", "31.12.2024", "Hatalı tarih"),
+            ("", "2024-12-31"),
+            ("TEST-002", "2024-12-16", "Listede tekrar"),
+        ])
+
+        durumlar = [r['durum'] for r in results]
+        self.assertEqual(durumlar, [
+            DatabaseManager.BULK_DUPLICATE,
+            DatabaseManager.BULK_INSERTED,
+            DatabaseManager.BULK_INSERTED,
+            DatabaseManager.BULK_INVALID,
+            DatabaseManager.BULK_INVALID,
+            DatabaseManager.BULK_DUPLICATE,
+        ])
+        self.assertEqual(self.db.get_dosya_count(), 3)
+
+        # Sunum tarihi de hesaplanmış olmalı
+        dosya = self.db.search_dosyalar("TEST-003")[0]
+        self.assertEqual(dosya['ana_avukata_sunum_tarihi'], "2024-11-28")
+
     def test_duplicate_dosya(self):
         """Duplicate dosya testi"""
         # İlk dosyayı ekle
@@ -53,12 +96,12 @@ class TestDatabaseManager(unittest.TestCase):
         self.db.add_dosya("TEST-001", "2024-12-31", "Test dosyası")
         dosyalar = self.db.get_all_dosyalar()
         
-        dilekce_tarihi = datetime.strptime(dosyalar[0]['dilekce_son_teslim_tarihi'], '%Y-%m-%d')
-        sunum_tarihi = datetime.strptime(dosyalar[0]['ana_avukata_sunum_tarihi'], '%Y-%m-%d')
+        dilekce_tarihi = datetime.strptime(dosyalar[0]['dilekce_son_teslim_tarihi'], '%Y-%m-%d').date()
+        sunum_tarihi = datetime.strptime(dosyalar[0]['ana_avukata_sunum_tarihi'], '%Y-%m-%d').date()
         
-        # 2 gün fark olmalı
-        fark = (dilekce_tarihi - sunum_tarihi).days
-        self.assertEqual(fark, 2)
+        # 2 iş günü fark olmalı: 31.12.2024 Salı -> 27.12.2024 Cuma
+        self.assertEqual(sunum_tarihi.isoformat(), "2024-12-27")
+        self.assertEqual(self.db.judicial_calendar.working_days_between(sunum_tarihi, dilekce_tarihi), 2)
     
     def test_search_dosyalar(self):
         """Arama testi"""
@@ -80,7 +123,93 @@ class TestDatabaseManager(unittest.TestCase):
         results = self.db.search_dosyalar("Acil")
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]['dosya_numarasi'], "TEST-002")
-    
+
+    def test_search_ranking_and_turkish_folding(self):
+        """Sıralı arama ve Türkçe harf katlama testi"""
+        self.db.add_dosya("2024/123", "2024-12-31", "İstanbul Asliye Hukuk")
+        self.db.add_dosya("2024/1234 E.", "2024-12-01", "Ankara")
+        self.db.add_dosya("2023/2024/12", "2024-11-01", "Izmir")
+
+        # Tam eşleşme ilk sırada, önek eşleşmesi ikinci
+        results = self.db.search_dosyalar("2024/123")
+        numaralar = [d['dosya_numarasi'] for d in results]
+        self.assertEqual(numaralar, ["2024/123", "2024/1234 E."])
+
+        # Alt dize ve büyük/küçük harf duyarsız eşleşme
+        results = self.db.search_dosyalar("1234 e.")
+        self.assertEqual([d['dosya_numarasi'] for d in results], ["2024/1234 E."])
+
+        # I/İ/ı farkı aramayı etkilememeli
+        for terim in ("ISTANBUL", "istanbul", "ıstanbul"):
+            results = self.db.search_dosyalar(terim)
+            self.assertEqual(len(results), 1, terim)
+        self.assertEqual(len(self.db.search_dosyalar("izmir")), 1)
+
+        # Güncelleme ve silme indekse yansımalı
+        dosya_id = self.db.search_dosyalar("Ankara")[0]['id']
+        self.db.update_dosya(dosya_id, notlar="Bursa")
+        self.assertEqual(len(self.db.search_dosyalar("Ankara")), 0)
+        self.assertEqual(len(self.db.search_dosyalar("Bursa")), 1)
+        self.db.delete_dosya(dosya_id)
+        self.assertEqual(len(self.db.search_dosyalar("Bursa")), 0)
+
+    def test_external_client_writes(self):
+        """Uygulama dışı SQLite istemcisi (Python fonksiyonu olmadan) yazabilmeli"""
+        import sqlite3
+        from database import turkce_katla, _sql_turkce_katla
+
+        metin = "İSTANBUL Çağlayan ŞİŞLİ Öğüt ırmak ÜMİT Âdil"
+        baglanti = sqlite3.connect(self.test_db_path)
+        try:
+            sql_katli = baglanti.execute(f"SELECT {_sql_turkce_katla('?')}", (metin,)).fetchone()[0]
+            self.assertEqual(sql_katli, turkce_katla(metin))
+
+            baglanti.execute("INSERT INTO dosyalar (dosya_numarasi, dilekce_son_teslim_tarihi, "
+                             "ana_avukata_sunum_tarihi, notlar) "
+                             "VALUES ('DIS-001', '2024-12-31', '2024-12-27', 'İzmir Çiğli')")
+            baglanti.execute("UPDATE dosyalar SET notlar = 'Şişli' WHERE dosya_numarasi = 'DIS-001'")
+            baglanti.commit()
+        finally:
+            baglanti.close()
+
+        self.assertEqual(len(self.db.search_dosyalar("şişli")), 1)
+        self.assertEqual(len(self.db.search_dosyalar("ŞİŞLİ")), 1)
+        self.assertEqual(len(self.db.search_dosyalar("Çiğli")), 0)
+
+    def test_memory_database_readers(self):
+        """Bellek içi veritabanında okuyucular yazıcı bağlantısını paylaşmamalı"""
+        import threading
+
+        db = DatabaseManager(":memory:")
+        diger = DatabaseManager(":memory:")
+        try:
+            db.add_dosya("BELLEK-001", "2024-12-31", "Bellek")
+            self.assertIsNot(db._read_connection(), db.connection)
+            self.assertEqual(len(diger.get_all_dosyalar()), 0)
+
+            hatalar = []
+
+            def oku():
+                try:
+                    for _ in range(50):
+                        self.assertGreaterEqual(len(db.get_all_dosyalar()), 1)
+                except Exception as e:
+                    hatalar.append(e)
+
+            okuyucular = [threading.Thread(target=oku) for _ in range(4)]
+            for okuyucu in okuyucular:
+                okuyucu.start()
+            for i in range(50):
+                db.add_dosya(f"BELLEK-{i + 2:03d}", "2024-12-31")
+            for okuyucu in okuyucular:
+                okuyucu.join()
+
+            self.assertEqual(hatalar, [])
+            self.assertEqual(len(db.get_all_dosyalar()), 51)
+        finally:
+            db.close()
+            diger.close()
+
     def test_update_dosya(self):
         """Dosya güncelleme testi"""
         # Dosya ekle
@@ -112,6 +241,52 @@ class TestDatabaseManager(unittest.TestCase):
         dosyalar_after = self.db.get_all_dosyalar()
         self.assertEqual(len(dosyalar_after), 0)
     
+    def test_get_dosya_by_id_cache(self):
+        """Birincil anahtar ile getirme ve satır önbelleği testi"""
+        self.db.add_dosya("2024/12", "2024-12-31", "Kısa numara")
+        self.db.add_dosya("2024/123", "2024-12-30", "Uzun numara")
+        dosya_id = self.db.search_dosyalar("2024/12")[0]['id']
+
+        dosya = self.db.get_dosya_by_id(dosya_id)
+        self.assertEqual(dosya['dosya_numarasi'], "2024/12")
+
+        # Dönen sözlük önbelleğin kopyası olmalı
+        dosya['notlar'] = "Değiştirildi"
+        self.assertEqual(self.db.get_dosya_by_id(dosya_id)['notlar'], "Kısa numara")
+
+        # Güncelleme ve silme önbelleği geçersiz kılmalı
+        self.db.update_dosya(dosya_id, notlar="Yeni not")
+        self.assertEqual(self.db.get_dosya_by_id(dosya_id)['notlar'], "Yeni not")
+        self.db.delete_dosya(dosya_id)
+        self.assertIsNone(self.db.get_dosya_by_id(dosya_id))
+    
+    def test_get_dosya_by_id_cache_race(self):
+        """Okuma ile önbelleğe yazma arasında gelen güncelleme eski satırı önbelleğe bırakmamalı"""
+        self.db.add_dosya("2024/12", "2024-12-31", "Eski not")
+        dosya_id = self.db.search_dosyalar("2024/12")[0]['id']
+        
+        db = self.db
+        asil_cursor = db._dosya_cursor
+        
+        class AraYazmaliCursor:
+            """fetchone eski satırı döndürdükten sonra başka thread'in yazmasını taklit eder"""
+            def __init__(self, cursor):
+                self.cursor = cursor
+            
+            def execute(self, *args):
+                return self.cursor.execute(*args)
+            
+            def fetchone(self):
+                row = self.cursor.fetchone()
+                db.update_dosya(dosya_id, notlar="Yeni not")
+                return row
+        
+        with unittest.mock.patch.object(db, '_dosya_cursor',
+                                        lambda: AraYazmaliCursor(asil_cursor())):
+            self.assertEqual(db.get_dosya_by_id(dosya_id)['notlar'], "Eski not")
+        
+        self.assertEqual(db.get_dosya_by_id(dosya_id)['notlar'], "Yeni not")
+    
     def test_get_statistics(self):
         """İstatistik testi"""
         # Test verileri ekle
@@ -128,6 +303,25 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(stats['tamamlanan_dosya'], 1)
         self.assertEqual(stats['aktif_dosya'], 1)
     
+    def test_get_dashboard_snapshot(self):
+        """Dashboard anlık görüntüsü testi"""
+        today = datetime(2024, 12, 10).date()
+        self.db.add_dosya("TEST-001", "2024-12-08", "Süresi geçmiş")
+        self.db.add_dosya("TEST-002", "2024-12-10", "Bugün")
+        self.db.add_dosya("TEST-003", "2024-12-13", "Üç gün sonra")
+        self.db.add_dosya("TEST-004", "2024-12-16", "Bu hafta")
+        self.db.add_dosya("TEST-005", "2024-12-10", "Tamamlanmış")
+        tamamlanan_id = self.db.search_dosyalar("TEST-005")[0]['id']
+        self.db.update_dosya(tamamlanan_id, tamamlandi=True)
+        
+        snapshot = self.db.get_dashboard_snapshot(today)
+        self.assertEqual(snapshot['toplam_dosya'], 5)
+        self.assertEqual(snapshot['tamamlanan_dosya'], 1)
+        self.assertEqual(snapshot['aktif_dosya'], 4)
+        self.assertEqual(snapshot['bu_hafta_son_tarih'], 3)
+        self.assertEqual(snapshot['acil_dosya'], 3)
+        self.assertEqual(snapshot['bugun_son_tarih'], 1)
+    
     def test_get_upcoming_deadlines(self):
         """Yaklaşan tarihler testi"""
         today = datetime.now().date()
@@ -172,6 +366,91 @@ class TestDatabaseManager(unittest.TestCase):
         
         self.assertTrue(found_target)
 
+    def test_concurrent_reads_and_writes(self):
+        """Farklı thread'lerden eşzamanlı okuma/yazma ve yedekleme testi"""
+        import threading
+        
+        hatalar = []
+        
+        def yazici(no):
+            try:
+                for i in range(50):
+                    self.db.add_dosya(f"T{no}-{i:03d}", "2024-12-31", "Eşzamanlı")
+            except Exception as e:
+                hatalar.append(e)
+        
+        def okuyucu():
+            try:
+                for _ in range(50):
+                    self.db.get_dashboard_snapshot()
+                    self.db.get_dosyalar_page(limit=20)
+            except Exception as e:
+                hatalar.append(e)
+        
+        threads = [threading.Thread(target=yazici, args=(no,)) for no in range(3)]
+        threads += [threading.Thread(target=okuyucu) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(hatalar, [])
+        self.assertEqual(self.db.get_dosya_count(), 150)
+        self.assertEqual(self.db.connection.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+        
+        # Yedek, WAL'daki son yazmaları da içermeli
+        yedek_yolu = tempfile.mktemp(suffix='.db')
+        try:
+            self.db.backup(yedek_yolu)
+            yedek = DatabaseManager(yedek_yolu)
+            self.assertEqual(yedek.get_dosya_count(), 150)
+            yedek.close()
+        finally:
+            for ek in ('', '-wal', '-shm'):
+                if os.path.exists(yedek_yolu + ek):
+                    os.remove(yedek_yolu + ek)
+
+    def test_schema_migration(self):
+        """Şema göçü ve indeks testi"""
+        self.assertEqual(self.db.schema_version, self.db.latest_schema_version)
+
+        indexes = {row['name'] for row in self.db.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn('idx_dosyalar_aktif_son_teslim', indexes)
+        self.assertIn('idx_dosyalar_sunum', indexes)
+
+    def test_migrate_existing_database(self):
+        """Eski (sürümsüz) veritabanı yerinde yükseltilmeli"""
+        import sqlite3
+
+        old_db_path = tempfile.mktemp(suffix='.db')
+        conn = sqlite3.connect(old_db_path)
+        conn.execute('''
+            CREATE TABLE dosyalar (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dosya_numarasi TEXT UNIQUE NOT NULL,
+                dilekce_son_teslim_tarihi DATE NOT NULL,
+                ana_avukata_sunum_tarihi DATE NOT NULL,
+                olusturma_tarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+                guncelleme_tarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+                tamamlandi BOOLEAN DEFAULT FALSE,
+                notlar TEXT DEFAULT ''
+            )
+        ''')
+        conn.execute("INSERT INTO dosyalar (dosya_numarasi, dilekce_son_teslim_tarihi, "
+                     "ana_avukata_sunum_tarihi) VALUES ('ESKI-001', '2024-12-31', '2024-12-29')")
+        conn.commit()
+        conn.close()
+
+        try:
+            db = DatabaseManager(old_db_path)
+            self.assertEqual(db.schema_version, db.latest_schema_version)
+            self.assertEqual(db.get_dosya_count(), 1)
+            db.close()
+        finally:
+            if os.path.exists(old_db_path):
+                os.remove(old_db_path)
+
 
 class TestCalendarView(unittest.TestCase):
     """Takvim görünümü test sınıfı"""
@@ -212,6 +491,291 @@ class TestCalendarView(unittest.TestCase):
         except ValueError:
             self.fail("Tarih formatı hatalı")
 
+    def test_get_dosyalar_by_range(self):
+        """Tarih aralığına göre gruplu veri testi"""
+        self.db.add_dosya("TEST-002", "2025-03-10", "Aralık dışı")
+
+        by_date = self.db.get_dosyalar_by_range("2024-12-01", "2024-12-31")
+
+        # TEST-001: son teslim 31.12, sunum 27.12 (2 iş günü önce)
+        self.assertEqual(set(by_date.keys()), {"2024-12-27", "2024-12-31"})
+        self.assertEqual(by_date["2024-12-31"][0]['type'], 'dilekce')
+        self.assertEqual(by_date["2024-12-27"][0]['type'], 'sunum')
+        self.assertEqual(by_date["2024-12-31"][0]['dosya']['dosya_numarasi'], "TEST-001")
+        self.assertNotIn('olay_tarihi', by_date["2024-12-31"][0]['dosya'])
+
+    def test_month_cache(self):
+        """Ay önbelleği: komşu aylar önceden yüklenmeli, yazma önbelleği boşaltmalı"""
+        sorgular = []
+        asil = self.db.get_dosyalar_by_range
+        self.db.get_dosyalar_by_range = lambda s, e: sorgular.append(s) or asil(s, e)
+        cache = MonthCache(self.db)
+        try:
+            self.assertEqual(month_grid_range(2024, 12)[0].isoformat(), "2024-11-25")
+            
+            cache.validate()
+            aralik = cache.get_month(2024, 12)
+            self.assertIn("2024-12-31", aralik)
+            cache.prefetch(2024, 12)
+            cache.get_month(2025, 1)
+            cache.get_month(2024, 11)
+            cache.get_month(2024, 12)
+            self.assertEqual(len(sorgular), 3)
+            
+            # Gün detayları önbellekten gelir
+            gun = cache.get_day(datetime(2024, 12, 31).date())
+            self.assertEqual([o['dosya']['dosya_numarasi'] for o in gun], ["TEST-001"])
+            self.assertEqual(len(sorgular), 3)
+            
+            # Veri değişince yeniden yüklenmeli
+            self.db.add_dosya("TEST-002", "2024-12-20", "Yeni")
+            cache.validate()
+            self.assertIsNone(cache.get_day(datetime(2024, 12, 20).date()))
+            self.assertIn("2024-12-20", cache.get_month(2024, 12))
+            self.assertEqual(len(sorgular), 4)
+        finally:
+            cache.close()
+
+
+class TestCalendarCanvas(unittest.TestCase):
+    """Canvas tabanlı takvim ızgarası testleri"""
+
+    def test_calendar_cell_diff(self):
+        """Takvim hücreleri tek Canvas'ta çizilmeli, yalnızca değişen öğeler güncellenmeli"""
+        class SahteCanvas:
+            def __init__(self, parent, **secenekler):
+                self.secenekler = secenekler
+                self.sayac = 0
+                self.guncellemeler = []
+            
+            def _olustur(self, *args, **kwargs):
+                self.sayac += 1
+                return self.sayac
+            create_text = create_oval = create_rectangle = _olustur
+            
+            def itemconfigure(self, item, **secenekler):
+                self.guncellemeler.append((item, secenekler))
+            
+            def __getitem__(self, anahtar):
+                return self.secenekler[anahtar]
+            
+            def bind(self, *args):
+                pass
+            coords = after_cancel = tag_raise = bind
+        
+        today = datetime(2024, 12, 10).date()
+        gun = datetime(2024, 12, 31).date()
+        olaylar = [
+            {'type': 'dilekce', 'dosya': {'dosya_numarasi': "A-1"}},
+            {'type': 'dilekce', 'dosya': {'dosya_numarasi': "A-2"}},
+            {'type': 'sunum', 'dosya': {'dosya_numarasi': "A-3"}},
+        ]
+        state = CalendarView.build_cell_state(gun, olaylar, True, today)
+        self.assertEqual(state, ("31", '#ffddff', 'black', 2, 1))
+        self.assertEqual(CalendarView.build_cell_state(gun, olaylar[:1], False, gun)[1:],
+                         ('#ffcccc', '#cccccc', 1, 0))
+        
+        with unittest.mock.patch.object(calendar_canvas.tk, 'Canvas', SahteCanvas):
+            grid = CalendarCanvas(None)
+        canvas = grid.canvas
+        
+        grid.set_cell(40, gun, state, olaylar)
+        ilk = len(canvas.guncellemeler)
+        grid.set_cell(40, gun, state, olaylar)
+        self.assertEqual(len(canvas.guncellemeler), ilk)
+        
+        # Yalnızca ST sayısı değişirse yalnızca o rozet güncellenir
+        grid.set_cell(40, gun, ("31", '#ffddff', 'black', 3, 1), olaylar)
+        oval, text = grid.cells[40]['badges']['dilekce']
+        self.assertEqual([item for item, _ in canvas.guncellemeler[ilk:]], [oval, text])
+        
+        # Tıklama koordinattan hücreye çevrilir; ipucu dosya numaralarını listeler
+        self.assertEqual(grid.cell_at(1, 10), None)
+        self.assertEqual(grid.cell_at(5 * 100 + 1, grid.HEADER_HEIGHT + 5 * 66 + 1), 40)
+        self.assertEqual(grid.tooltip_lines(40), ["ST: A-1", "ST: A-2", "AS: A-3"])
+
+
+class TestYearHeatmap(unittest.TestCase):
+    """Yıllık iş yükü ısı haritası testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.test_db_path = tempfile.mktemp(suffix='.db')
+        self.db = DatabaseManager(self.test_db_path)
+        self.db.add_dosya("TEST-001", "2024-12-31", "Test dosyası")
+
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.db.close()
+        if os.path.exists(self.test_db_path):
+            os.remove(self.test_db_path)
+
+    def test_year_event_counts(self):
+        """Yıllık ısı haritası verisi tek toplama sorgusundan gelmeli ve önbelleğe alınmalı"""
+        self.db.add_dosya("TEST-002", "2024-12-31", "Aynı gün")
+        self.db.add_dosya("TEST-003", "2025-01-02", "Sonraki yıl")
+        tamamlanan = self.db.search_dosyalar("TEST-003")[0]['id']
+        
+        sayilar = self.db.get_year_event_counts(2024)
+        # TEST-003'ün sunumu 1 Ocak tatili atlanarak 30.12'ye düşer
+        self.assertEqual(sayilar["2024-12-31"], (2, 0))
+        self.assertEqual(sayilar["2024-12-30"], (0, 1))
+        self.assertEqual(sayilar["2024-12-27"], (0, 2))
+        # İkinci çağrı önbellekten gelir ama kopyadır: değiştirmek önbelleği bozmaz
+        sayilar["2024-12-31"] = (99, 99)
+        with unittest.mock.patch.object(self.db, 'get_daily_event_counts',
+                                        side_effect=AssertionError("önbellek kullanılmadı")):
+            tekrar = self.db.get_year_event_counts(2024)
+        self.assertEqual(tekrar["2024-12-31"], (2, 0))
+        self.assertIsNot(tekrar, sayilar)
+        
+        # Tamamlanan dosyalar varsayılan olarak sayılmaz; yazma önbelleği geçersiz kılar
+        self.assertIn("2025-01-02", self.db.get_year_event_counts(2025))
+        self.db.update_dosya(tamamlanan, tamamlandi=True)
+        self.assertNotIn("2025-01-02", self.db.get_year_event_counts(2025))
+        self.assertIn("2025-01-02", self.db.get_year_event_counts(2025, include_completed=True))
+        
+        # Izgara konumu ve renkler
+        self.assertEqual(year_cell_position(datetime(2024, 1, 1).date()), (0, 0))
+        self.assertEqual(year_cell_position(datetime(2024, 12, 31).date()), (52, 1))
+        self.assertEqual(heat_color(0, True), heat_color(0, False))
+        self.assertNotEqual(heat_color(3, True), heat_color(3, False))
+
+
+class TestJudicialCalendar(unittest.TestCase):
+    """Adli takvim (iş günü) hesaplama testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.takvim = JudicialCalendar(2023, 2026)
+        self.test_db_path = tempfile.mktemp(suffix='.db')
+    
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        if os.path.exists(self.test_db_path):
+            os.remove(self.test_db_path)
+    
+    def gun(self, metin):
+        return datetime.strptime(metin, '%Y-%m-%d').date()
+    
+    def test_working_days_before(self):
+        """Hafta sonu, resmi tatil, bayram ve adli tatil atlanmalı"""
+        ornekler = [
+            ("2024-12-31", "2024-12-27"),  # Hafta sonu
+            ("2025-01-02", "2024-12-30"),  # Yılbaşı
+            ("2024-04-15", "2024-04-08"),  # Ramazan Bayramı (10-12 Nisan), arife iş günü
+            ("2024-09-03", "2024-07-19"),  # Adli tatil (20 Temmuz - 31 Ağustos)
+            ("2024-10-30", "2024-10-25"),  # Cumhuriyet Bayramı
+        ]
+        for son_teslim, beklenen in ornekler:
+            self.assertEqual(self.takvim.sunum_tarihi(son_teslim), beklenen, son_teslim)
+        
+        self.assertFalse(self.takvim.is_working_day(self.gun("2024-08-15")))
+        self.assertTrue(JudicialCalendar(2024, 2024, adli_tatil=False).is_working_day(
+            self.gun("2024-08-15")))
+        self.assertEqual(self.takvim.sunum_tarihi("2024-12-31", offset_days=3), "2024-12-26")
+    
+    def test_bayram_coverage(self):
+        """Varsayılan tablonun her yılı için dini bayram tarihleri bulunmalı"""
+        takvim = JudicialCalendar()
+        for yil in range(takvim.start.year, takvim.end.year + 1):
+            self.assertIn(yil, DINI_BAYRAMLAR, yil)
+            self.assertEqual(len(DINI_BAYRAMLAR[yil]), 2, yil)
+        
+        # 2027 Ramazan Bayramı (9-11 Mart)
+        self.assertEqual(takvim.sunum_tarihi("2027-03-12"), "2027-03-05")
+    
+    def test_zero_offset(self):
+        """Sıfır gün öncesi: iş günüyse kendisi, değilse önceki iş günü"""
+        ornekler = [
+            ("2024-12-27", "2024-12-27"),  # Cuma
+            ("2024-12-28", "2024-12-27"),  # Cumartesi
+            ("2026-12-31", "2026-12-31"),  # Tablonun son günü
+        ]
+        for gun, beklenen in ornekler:
+            self.assertEqual(self.takvim.working_days_before(self.gun(gun), 0), self.gun(beklenen))
+            # Tablo dışı yol aynı sonucu vermeli
+            self.assertEqual(JudicialCalendar(2020, 2020).working_days_before(self.gun(gun), 0),
+                             self.gun(beklenen))
+        
+        # Tablonun son günü hafta sonu
+        son_gun_pazar = JudicialCalendar(2023, 2023)
+        self.assertEqual(son_gun_pazar.working_days_before(self.gun("2023-12-31"), 0),
+                         self.gun("2023-12-29"))
+        self.assertEqual(self.takvim.sunum_tarihi("2024-12-28", offset_days=0), "2024-12-27")
+    
+    def test_out_of_range_matches_table(self):
+        """Tablo dışındaki tarihler aynı kurallarla hesaplanmalı"""
+        dar = JudicialCalendar(2024, 2024)
+        gun = self.gun("2024-01-01")
+        while gun.year == 2024:
+            self.assertEqual(dar.working_days_before(gun, 2),
+                             self.takvim.working_days_before(gun, 2), gun)
+            gun += timedelta(days=1)
+        self.assertEqual(dar.working_days_between(self.gun("2023-12-25"), self.gun("2024-01-08")),
+                         self.takvim.working_days_between(self.gun("2023-12-25"),
+                                                          self.gun("2024-01-08")))
+    
+    def test_recompute_sunum_tarihleri(self):
+        """Kurallar değişince tüm sunum tarihleri tek işlemde yeniden yazılmalı"""
+        db = DatabaseManager(self.test_db_path, judicial_calendar=self.takvim)
+        try:
+            db.add_dosyalar_bulk([("A-1", "2024-12-31"), ("A-2", "2024-12-31"),
+                                  ("A-3", "2024-12-20")])
+            self.assertEqual(db.recompute_sunum_tarihleri(), 0)
+            
+            seq = db.get_change_counter()
+            guncellenen = db.recompute_sunum_tarihleri(JudicialCalendar(2023, 2026, offset_days=1))
+            self.assertEqual(guncellenen, 3)
+            self.assertEqual(db.search_dosyalar("A-1")[0]['ana_avukata_sunum_tarihi'], "2024-12-30")
+            self.assertEqual(db.search_dosyalar("A-3")[0]['ana_avukata_sunum_tarihi'], "2024-12-19")
+            self.assertEqual(len(db.get_changes_since(seq)[1]), 3)
+            
+            # Yeni eklenen dosya da yeni kuralı kullanır
+            db.add_dosya("A-4", "2024-12-31")
+            self.assertEqual(db.search_dosyalar("A-4")[0]['ana_avukata_sunum_tarihi'], "2024-12-30")
+        finally:
+            db.close()
+    
+    def test_migration_converts_calendar_day_offsets(self):
+        """Eski veritabanındaki 2 takvim günlük sunum tarihleri göçte düzeltilmeli"""
+        db = DatabaseManager(self.test_db_path)
+        db.add_dosya("A-1", "2024-12-31")
+        db.close()
+        
+        import sqlite3
+        baglanti = sqlite3.connect(self.test_db_path)
+        baglanti.execute("UPDATE dosyalar SET ana_avukata_sunum_tarihi = '2024-12-29'")
+        baglanti.execute("PRAGMA user_version = 6")
+        baglanti.commit()
+        baglanti.close()
+        
+        db = DatabaseManager(self.test_db_path)
+        try:
+            self.assertEqual(db.search_dosyalar("A-1")[0]['ana_avukata_sunum_tarihi'], "2024-12-27")
+        finally:
+            db.close()
+
+    def test_migration_uses_manager_calendar(self):
+        """Göç, yöneticiye verilen adli takvimi kullanmalı"""
+        db = DatabaseManager(self.test_db_path)
+        db.add_dosya("A-1", "2024-12-31")
+        db.close()
+
+        import sqlite3
+        baglanti = sqlite3.connect(self.test_db_path)
+        baglanti.execute("UPDATE dosyalar SET ana_avukata_sunum_tarihi = '2024-12-29'")
+        baglanti.execute("PRAGMA user_version = 6")
+        baglanti.commit()
+        baglanti.close()
+
+        db = DatabaseManager(self.test_db_path,
+                             judicial_calendar=JudicialCalendar(2023, 2026, offset_days=1))
+        try:
+            self.assertEqual(db.search_dosyalar("A-1")[0]['ana_avukata_sunum_tarihi'], "2024-12-30")
+        finally:
+            db.close()
+
 
 class TestNotificationSystem(unittest.TestCase):
     """Bildirim sistemi test sınıfı"""
@@ -246,6 +810,372 @@ class TestNotificationSystem(unittest.TestCase):
         self.assertIn('dosya_numarasi', dosya)
         self.assertIn('dilekce_son_teslim_tarihi', dosya)
         self.assertIn('tamamlandi', dosya)
+    
+    def test_notification_buckets(self):
+        """Bildirimler SQL tarafında tarih ve türe göre gruplanmalı"""
+        from notifications import NotificationManager
+        
+        today = datetime(2024, 12, 10).date()
+        self.db.add_dosya("TEST-001", "2024-12-12", "Sunumu bugün")
+        self.db.add_dosya("TEST-002", "2024-12-12", "Aynı gün")
+        self.db.add_dosya("TEST-003", "2024-12-20", "Pencere dışında")
+        self.db.add_dosya("TEST-004", "2024-12-12", "Tamamlanmış")
+        self.db.update_dosya(self.db.search_dosyalar("TEST-004")[0]['id'], tamamlandi=True)
+        
+        buckets = self.db.get_notification_buckets(7, today)
+        ozet = [(b['olay_tarihi'], b['olay_turu'], b['kalan_gun'],
+                 [d['dosya_numarasi'] for d in b['dosyalar']]) for b in buckets]
+        self.assertEqual(ozet, [
+            ('2024-12-10', 'sunum', 0, ['TEST-001', 'TEST-002']),
+            ('2024-12-12', 'son_teslim', 2, ['TEST-001', 'TEST-002']),
+        ])
+        self.assertEqual(buckets[1]['tarih_str'], '12.12.2024')
+        
+        # Son teslimler tek bildirimde, sunumlar dosya başına
+        notifications = NotificationManager(self.db).prepare_notifications(buckets)
+        turler = sorted(n['type'] for n in notifications)
+        self.assertEqual(turler, ['son_teslim', 'sunum', 'sunum'])
+    
+    def test_notification_ledger(self):
+        """Gönderilen bildirimler tekrar gönderilmemeli (başka örnek dahil)"""
+        today = datetime(2024, 12, 10).date()
+        self.db.add_dosya("TEST-001", "2024-12-12", "Birinci")
+        
+        ilk = self.db.claim_notification_buckets(7, today)
+        self.assertEqual([b['olay_turu'] for b in ilk], ['sunum', 'son_teslim'])
+        self.assertEqual(self.db.claim_notification_buckets(7, today), [])
+        
+        # Aynı veritabanını açan ikinci uygulama da göndermemeli
+        diger = DatabaseManager(self.test_db_path)
+        try:
+            self.assertEqual(diger.claim_notification_buckets(7, today), [])
+        finally:
+            diger.close()
+        
+        # Yeni eklenen dosya yalnızca kendisi için bildirim üretmeli
+        self.db.add_dosya("TEST-002", "2024-12-15", "İkinci")
+        yeni = self.db.claim_notification_buckets(7, today)
+        self.assertEqual({d['dosya_numarasi'] for b in yeni for d in b['dosyalar']}, {"TEST-002"})
+        
+        # Başka kanal ayrı tutulur; okuma sürümü defteri değiştirmez
+        self.assertEqual(len(self.db.get_notification_buckets(7, today, kanal='eposta')), 4)
+        self.assertEqual(len(self.db.get_notification_buckets(7, today, kanal='masaustu')), 0)
+
+    def test_notification_batch_coalesced(self):
+        """Bir kontroldeki tüm bildirimler tek masaüstü bildirimi olmalı"""
+        self.db.add_dosya("TEST-001", "2024-12-12", "Birinci")
+        self.db.add_dosya("TEST-002", "2024-12-15", "İkinci")
+        buckets = self.db.get_notification_buckets(7, datetime(2024, 12, 10).date())
+        
+        backend = RecordingBackend()
+        manager = NotificationManager(self.db, backend=backend)
+        merkez = []
+        manager.show_app_notification = lambda entries, on_shown=None: merkez.append(entries)
+        manager.send_notifications(manager.prepare_notifications(buckets))
+        
+        self.assertEqual(len(backend.sent), 1)
+        self.assertEqual(backend.sent[0][0], "Hukuk Takip: 4 hatırlatma")
+        self.assertIn("... ve 1 hatırlatma daha", backend.sent[0][1])
+        self.assertEqual(len(merkez), 1)
+        self.assertEqual(len(merkez[0]), 4)
+
+    def test_notification_retried_after_failed_send(self):
+        """Gösterilemeyen bildirim gönderildi sayılmamalı, sonraki kontrolde tekrar gönderilmeli"""
+        yarin = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        self.db.add_dosya("TEST-001", yarin, "Birinci")
+        
+        class BozukBackend(RecordingBackend):
+            def notify(self, title, message):
+                raise OSError("bildirim sunucusu yok")
+        
+        manager = NotificationManager(self.db, backend=BozukBackend())
+        manager.check_and_send_notifications()
+        
+        # Arka uç düzelince olay tekrar gönderilir ve onaylanır
+        backend = RecordingBackend()
+        manager.backend = backend
+        manager.check_and_send_notifications()
+        self.assertEqual(len(backend.sent), 1)
+        manager.check_and_send_notifications()
+        self.assertEqual(len(backend.sent), 1)
+        
+        # Hazırlık sırasında hata: talep bırakılır
+        self.db.add_dosya("TEST-002", yarin, "İkinci")
+        with unittest.mock.patch.object(manager, 'prepare_notifications',
+                                        side_effect=RuntimeError("bozuk")):
+            manager.check_and_send_notifications()
+        manager.check_and_send_notifications()
+        self.assertEqual(len(backend.sent), 2)
+    
+    def test_notification_claim_expires(self):
+        """Onaylanmayan talep (ör. gösterimden önce çökme) süre dolunca yeniden alınmalı"""
+        today = datetime(2024, 12, 10).date()
+        self.db.add_dosya("TEST-001", "2024-12-12", "Birinci")
+        
+        self.assertEqual(len(self.db.claim_notification_buckets(7, today)), 2)
+        self.assertEqual(self.db.claim_notification_buckets(7, today), [])
+        
+        self.db.connection.execute(
+            "UPDATE bildirim_kayitlari SET gonderim_zamani = datetime('now', '-1 hour')")
+        self.db.connection.commit()
+        tekrar = self.db.claim_notification_buckets(7, today)
+        self.assertEqual(len(tekrar), 2)
+        
+        # Onaylanan olay süre dolsa da tekrar alınmaz
+        self.db.confirm_notification_claims(tekrar)
+        self.db.connection.execute(
+            "UPDATE bildirim_kayitlari SET gonderim_zamani = datetime('now', '-1 hour')")
+        self.db.connection.commit()
+        self.assertEqual(self.db.claim_notification_buckets(7, today), [])
+
+    def test_app_notification_confirms_after_display(self):
+        """Uygulama içi bildirimde talep, ana thread'deki gösterimden sonra sonuçlanmalı"""
+        import notifications
+
+        yarin = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        self.db.add_dosya("TEST-001", yarin, "Birinci")
+
+        class SahteKok:
+            def __init__(self):
+                self.bekleyenler = []
+
+            def after(self, ms, func):
+                self.bekleyenler.append(func)
+
+            def calistir(self):
+                while self.bekleyenler:
+                    self.bekleyenler.pop(0)()
+
+        class BozukMerkez:
+            def __init__(self, on_snooze=None):
+                raise RuntimeError("pencere açılamadı")
+
+        def durumlar():
+            return [row[0] for row in self.db.connection.execute(
+                "SELECT durum FROM bildirim_kayitlari")]
+
+        kok = SahteKok()
+        manager = NotificationManager(self.db, backend=NullBackend())
+        with unittest.mock.patch.object(notifications.tk, '_default_root', kok, create=True), \
+                unittest.mock.patch.object(notifications, 'NotificationCenter', BozukMerkez), \
+                unittest.mock.patch.object(notifications.messagebox, 'showinfo',
+                                           side_effect=RuntimeError("ekran yok")):
+            manager.check_and_send_notifications()
+            # Gösterim henüz çalışmadı: talep onaylanmamalı
+            self.assertTrue(durumlar())
+            self.assertEqual(set(durumlar()), {'bekliyor'})
+            kok.calistir()
+        # Gösterilemedi: talep bırakılır
+        self.assertEqual(durumlar(), [])
+
+        merkez = []
+
+        class CalisanMerkez:
+            def __init__(self, on_snooze=None):
+                pass
+
+            def add_entries(self, entries):
+                merkez.append(entries)
+
+        with unittest.mock.patch.object(notifications.tk, '_default_root', kok, create=True), \
+                unittest.mock.patch.object(notifications, 'NotificationCenter', CalisanMerkez):
+            manager.check_and_send_notifications()
+            self.assertEqual(set(durumlar()), {'bekliyor'})
+            kok.calistir()
+        self.assertEqual(len(merkez), 1)
+        self.assertEqual(set(durumlar()), {'gonderildi'})
+
+    def test_notification_backend_probe(self):
+        """Arka uç denetimi ilk kullanılabilir arka ucu seçmeli"""
+        class Kullanilamaz(NullBackend):
+            @classmethod
+            def probe(cls):
+                return None
+        
+        class Bozuk(NullBackend):
+            @classmethod
+            def probe(cls):
+                raise OSError("bağlantı yok")
+        
+        backend = probe_backend([Kullanilamaz, Bozuk, RecordingBackend, NullBackend])
+        self.assertIsInstance(backend, RecordingBackend)
+        self.assertIsInstance(probe_backend([Kullanilamaz]), NullBackend)
+        
+        # Tırnak içeren başlık olduğu gibi iletilmeli
+        manager = NotificationManager(self.db, backend=backend)
+        manager.send_system_notification('Dosya "2024/1"', "Mesaj")
+        self.assertEqual(backend.sent, [('Dosya "2024/1"', "Mesaj")])
+
+
+class TestScheduler(unittest.TestCase):
+    """Heap tabanlı zamanlayıcı testleri"""
+    
+    def setUp(self):
+        """Sahte saatle zamanlayıcı oluştur"""
+        self.now = datetime(2024, 12, 10, 8, 0).timestamp()
+        self.scheduler = Scheduler(clock=lambda: self.now)
+    
+    def test_jobs_run_in_due_order(self):
+        """İşler zaman sırasına göre çalışmalı, iptal edilen çalışmamalı"""
+        calisan = []
+        self.scheduler.add_job(lambda: calisan.append('b'), self.now + 120)
+        self.scheduler.add_job(lambda: calisan.append('a'), self.now + 60)
+        iptal = self.scheduler.add_job(lambda: calisan.append('x'), self.now + 90)
+        self.scheduler.cancel(iptal)
+        
+        self.assertEqual(self.scheduler.next_due(), self.now + 60)
+        self.assertEqual(self.scheduler.run_pending(), 0)
+        self.assertEqual(self.scheduler.run_pending(self.now + 300), 2)
+        self.assertEqual(calisan, ['a', 'b'])
+        self.assertIsNone(self.scheduler.next_due())
+    
+    def test_daily_job_catch_up_and_reschedule(self):
+        """Günlük iş: kaçırılan gün bir kez telafi edilmeli, saat değişince taşınmalı"""
+        saat = {'deger': "09:00"}
+        calisma = []
+        job = self.scheduler.add_daily_job(lambda: calisma.append(self.now),
+                                           lambda: saat['deger'])
+        self.assertEqual(job.due, datetime(2024, 12, 10, 9, 0).timestamp())
+        
+        # Bilgisayar üç gün uykuda kaldı: yalnızca bir kez çalışmalı
+        self.now = datetime(2024, 12, 13, 14, 0).timestamp()
+        self.assertEqual(self.scheduler.run_pending(), 1)
+        self.assertEqual(job.due, datetime(2024, 12, 14, 9, 0).timestamp())
+        
+        # Bildirim saati değişti
+        saat['deger'] = "18:30"
+        self.scheduler.reschedule(job)
+        self.assertEqual(self.scheduler.next_due(), datetime(2024, 12, 13, 18, 30).timestamp())
+        self.assertEqual(len(self.scheduler.pending_jobs()), 1)
+    
+    def test_daily_job_runs_immediately_when_started_late(self):
+        """Uygulama bildirim saatinden sonra açıldıysa günün kontrolü hemen yapılmalı"""
+        self.now = datetime(2024, 12, 10, 11, 0).timestamp()
+        job = self.scheduler.add_daily_job(lambda: None, lambda: "09:00")
+        self.assertEqual(job.due, self.now)
+    
+    def test_background_thread(self):
+        """Zamanlayıcı thread'i zamanı gelen işi çalıştırmalı"""
+        import threading
+        import time
+        
+        scheduler = Scheduler()
+        calisti = threading.Event()
+        scheduler.start()
+        try:
+            scheduler.add_job(calisti.set, time.time() + 0.05)
+            self.assertTrue(calisti.wait(2))
+        finally:
+            scheduler.stop()
+
+
+class TestReminders(unittest.TestCase):
+    """Kalıcı hatırlatıcı kuyruğu testleri"""
+    
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.test_db_path = tempfile.mktemp(suffix='.db')
+        self.db = DatabaseManager(self.test_db_path)
+        self.now = datetime(2024, 12, 10, 9, 0, 5).timestamp()
+        self.scheduler = Scheduler(clock=lambda: self.now)
+        self.teslim = []
+        self.dispatcher = ReminderDispatcher(self.db, self.scheduler, self.teslim.append)
+    
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.db.close()
+        if os.path.exists(self.test_db_path):
+            os.remove(self.test_db_path)
+    
+    def test_snooze_batches_same_minute(self):
+        """Aynı dakikadaki hatırlatıcılar tek seferde teslim edilmeli"""
+        self.dispatcher.snooze("A", "Birinci", {'dosya_numarasi': 'TEST-001'}, delay_seconds=3600)
+        self.dispatcher.snooze("B", "İkinci", None, delay_seconds=3630)
+        self.dispatcher.snooze("C", "Üçüncü", None, delay_seconds=7200)
+        self.assertEqual(len(self.scheduler.pending_jobs()), 1)
+        
+        self.now += 3600
+        self.scheduler.run_pending()
+        self.assertEqual(len(self.teslim), 1)
+        self.assertEqual([r['baslik'] for r in self.teslim[0]], ["A", "B"])
+        self.assertEqual(self.teslim[0][0]['veri'], {'dosya_numarasi': 'TEST-001'})
+        
+        # Sıradaki hatırlatıcı için zamanlayıcıda yine tek iş olmalı
+        self.assertEqual(self.scheduler.next_due(), self.db.get_next_reminder_time())
+        self.assertEqual(self.db.get_reminder_count(), 1)
+    
+    def test_reminders_survive_restart(self):
+        """Bekleyen hatırlatıcılar yeniden açılışta zamanlanmalı"""
+        self.dispatcher.snooze("A", "Birinci", None, delay_seconds=600)
+        self.db.close()
+        
+        self.db = DatabaseManager(self.test_db_path)
+        scheduler = Scheduler(clock=lambda: self.now)
+        teslim = []
+        ReminderDispatcher(self.db, scheduler, teslim.append).start()
+        self.assertEqual(scheduler.next_due(), int(self.now + 600))
+        
+        scheduler.run_pending(self.now + 600)
+        self.assertEqual(len(teslim), 1)
+        self.assertEqual(self.db.get_reminder_count(), 0)
+        self.assertIsNone(scheduler.next_due())
+
+
+class TestLogging(unittest.TestCase):
+    """Merkezi log modülü testleri"""
+    
+    def setUp(self):
+        """Geçici log dosyası"""
+        self.test_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.test_dir, 'test.log')
+    
+    def tearDown(self):
+        """Loglamayı kapat ve dosyaları sil"""
+        shutdown_logging()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_rate_limit_filter(self):
+        """Aynı şablonla tekrar eden kayıtlar aralık dolana kadar bastırılmalı"""
+        self.now = 0.0
+        limiter = RateLimitFilter(interval=60, clock=lambda: self.now)
+        
+        def kayit(mesaj, *args):
+            return logging.LogRecord("hukuk_takip.gui", logging.WARNING, __file__, 1,
+                                     mesaj, args, None)
+        
+        self.assertTrue(limiter.filter(kayit("Tarih formatı hatası: %s", "A-1")))
+        self.assertFalse(limiter.filter(kayit("Tarih formatı hatası: %s", "A-2")))
+        self.assertFalse(limiter.filter(kayit("Tarih formatı hatası: %s", "A-3")))
+        self.assertTrue(limiter.filter(kayit("Başka hata")))
+        
+        self.now = 61.0
+        record = kayit("Tarih formatı hatası: %s", "A-4")
+        self.assertTrue(limiter.filter(record))
+        self.assertEqual(record.suppressed, 2)
+        
+        # WARNING altındaki kayıtlar (süre ölçümleri) sınırlanmaz
+        for _ in range(3):
+            self.assertTrue(limiter.filter(logging.LogRecord(
+                "hukuk_takip.scheduler", logging.DEBUG, __file__, 1,
+                "Zamanlanmış iş çalıştı: %s", ("yedek",), None)))
+    
+    def test_structured_file_logging(self):
+        """Kayıtlar yapısal alanlarla dosyaya yazılmalı, tekrarlar sınırlanmalı"""
+        setup_logging(self.log_path, level=logging.DEBUG, console=False)
+        logger = get_logger("test")
+        for i in range(100):
+            logger.warning("Tarih formatı hatası: %s", i, extra={'dosya_numarasi': f"T-{i}"})
+        for i in range(3):
+            with log_duration(logger, "Yükleme: %s", i, level=logging.INFO):
+                pass
+        shutdown_logging()
+        
+        with open(self.log_path, encoding='utf-8') as f:
+            satirlar = f.read().splitlines()
+        self.assertEqual(len(satirlar), 4)
+        self.assertIn("dosya_numarasi=T-0", satirlar[0])
+        self.assertIn("Yükleme: 2", satirlar[3])
+        self.assertIn("elapsed_ms=", satirlar[3])
 
 
 class TestDataIntegrity(unittest.TestCase):
@@ -305,6 +1235,62 @@ class TestDataIntegrity(unittest.TestCase):
         page2_ids = {dosya['id'] for dosya in page2}
         self.assertEqual(len(page1_ids.intersection(page2_ids)), 0)
     
+    def test_keyset_pagination(self):
+        """Keyset (tarih, id) sayfalama testi"""
+        for i in range(25):
+            self.db.add_dosya(f"TEST-{i:03d}", f"2024-12-{(i % 5) + 1:02d}", f"Test dosyası {i}")
+        tum_liste = self.db.get_dosyalar_page(limit=100)
+        self.assertEqual(len(tum_liste), 25)
+
+        # İleri doğru sayfa sayfa gezinme tüm listeyi sırasıyla vermeli
+        pages = []
+        after = None
+        while True:
+            page = self.db.get_dosyalar_page(after=after, limit=10)
+            if not page:
+                break
+            pages.extend(page)
+            after = (page[-1]['dilekce_son_teslim_tarihi'], page[-1]['id'])
+        self.assertEqual([d['id'] for d in pages], [d['id'] for d in tum_liste])
+
+        # Geriye doğru sayfa artan sırada dönmeli
+        son = tum_liste[-1]
+        onceki = self.db.get_dosyalar_page(before=(son['dilekce_son_teslim_tarihi'], son['id']),
+                                           limit=5)
+        self.assertEqual([d['id'] for d in onceki], [d['id'] for d in tum_liste[-6:-1]])
+
+        # Tamamlananlar hariç tutulabilmeli
+        self.db.update_dosya(tum_liste[0]['id'], tamamlandi=True)
+        aktif = self.db.get_dosyalar_page(include_completed=False, limit=100)
+        self.assertEqual(len(aktif), 24)
+
+    def test_change_log(self):
+        """Değişiklik günlüğü testi"""
+        baslangic = self.db.get_change_counter()
+        self.db.add_dosya("TEST-001", "2024-12-31", "Birinci")
+        self.db.add_dosya("TEST-002", "2024-12-30", "İkinci")
+        id1 = self.db.search_dosyalar("TEST-001")[0]['id']
+        id2 = self.db.search_dosyalar("TEST-002")[0]['id']
+
+        seq, ids = self.db.get_changes_since(baslangic)
+        self.assertEqual(ids, [id1, id2])
+        self.assertEqual(seq, self.db.get_change_counter())
+
+        # Güncelleme ve silme aynı dosya için tek id olarak dönmeli
+        self.db.update_dosya(id1, notlar="Güncel")
+        self.db.update_dosya(id1, tamamlandi=True)
+        self.db.delete_dosya(id2)
+        seq2, ids = self.db.get_changes_since(seq)
+        self.assertEqual(ids, [id1, id2])
+
+        mevcut = self.db.get_dosyalar_by_ids(ids)
+        self.assertIn(id1, mevcut)
+        self.assertNotIn(id2, mevcut)
+        self.assertTrue(mevcut[id1]['tamamlandi'])
+
+        # Değişiklik yoksa boş liste
+        self.assertEqual(self.db.get_changes_since(seq2), (seq2, []))
+
     def test_count_function(self):
         """Sayma fonksiyonu testi"""
         # Başlangıçta 0 dosya
@@ -328,6 +1314,245 @@ class TestDataIntegrity(unittest.TestCase):
         self.assertEqual(active_count, 4)
 
 
+class TestDosyaKaydi(unittest.TestCase):
+    """__slots__ tabanlı Dosya kaydı testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.test_db_path = tempfile.mktemp(suffix='.db')
+        self.db = DatabaseManager(self.test_db_path, row_records=True)
+        self.db.add_dosyalar_bulk([(f"KYT-{i:03d}", f"2024-12-{i + 1:02d}", f"Not {i}")
+                                   for i in range(10)])
+
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.db.close()
+        if os.path.exists(self.test_db_path):
+            os.remove(self.test_db_path)
+
+    def test_sozluk_uyumlulugu(self):
+        """Kayıtlar sözlük gibi okunur, tarihler date olarak çözülmüştür"""
+        dosya = self.db.get_all_dosyalar()[0]
+        self.assertIsInstance(dosya, Dosya)
+        self.assertFalse(hasattr(dosya, '__dict__'))
+
+        self.assertEqual(dosya['dilekce_son_teslim_tarihi'], "2024-12-01")
+        self.assertEqual(dosya.dilekce_son_teslim_tarihi, datetime(2024, 12, 1).date())
+        self.assertEqual(dosya_tarihi(dosya, 'ana_avukata_sunum_tarihi'),
+                         datetime(2024, 11, 28).date())
+        self.assertEqual(dosya_tarihi({'ana_avukata_sunum_tarihi': "2024-11-28"},
+                                      'ana_avukata_sunum_tarihi'),
+                         datetime(2024, 11, 28).date())
+
+        self.assertIn('notlar', dosya)
+        self.assertIsNone(dosya.get('yok'))
+        with self.assertRaises(KeyError):
+            dosya['yok']
+
+        # Sözlük modundaki satırla aynı içerik
+        sozluk_db = DatabaseManager(self.test_db_path)
+        try:
+            beklenen = sozluk_db.get_all_dosyalar()[0]
+        finally:
+            sozluk_db.close()
+        self.assertIsInstance(beklenen, dict)
+        self.assertEqual(dict(dosya), beklenen)
+        self.assertEqual(dosya, beklenen)
+
+    def test_okuma_yollari(self):
+        """Tüm okuma metotları kayıt döndürür"""
+        ilk = self.db.get_all_dosyalar()[0]
+        self.assertIsInstance(self.db.get_dosyalar_page(limit=3)[0], Dosya)
+        self.assertIsInstance(next(self.db.iter_dosyalar(batch_size=4)), Dosya)
+        self.assertIsInstance(self.db.get_dosyalar_by_ids([ilk['id']])[ilk['id']], Dosya)
+        self.assertIsInstance(self.db.search_dosyalar("KYT-001")[0], Dosya)
+        self.assertIsInstance(self.db.get_dosyalar_by_date("2024-12-05")[0], Dosya)
+
+        aralik = self.db.get_dosyalar_by_range("2024-12-01", "2024-12-01")
+        olay = aralik["2024-12-01"][0]
+        self.assertEqual(olay['type'], 'dilekce')
+        self.assertEqual(olay['dosya'], ilk)
+
+    def test_onbellek_kopyasi(self):
+        """Önbellekten dönen kayıt değiştirilince önbellek bozulmaz"""
+        dosya_id = self.db.get_all_dosyalar()[0]['id']
+        dosya = self.db.get_dosya_by_id(dosya_id)
+        dosya['notlar'] = "Değişti"
+        dosya['dilekce_son_teslim_tarihi'] = "2025-01-15"
+        self.assertEqual(dosya.dilekce_son_teslim_tarihi, datetime(2025, 1, 15).date())
+
+        tekrar = self.db.get_dosya_by_id(dosya_id)
+        self.assertEqual(tekrar['notlar'], "Not 0")
+        self.assertEqual(tekrar['dilekce_son_teslim_tarihi'], "2024-12-01")
+
+    def test_disa_aktarma(self):
+        """Dışa aktarma kayıtlarla da aynı çıktıyı üretir"""
+        import json
+        from exporter import DosyaExporter
+
+        jsonl_path = self.test_db_path + '.jsonl'
+        try:
+            DosyaExporter(self.db).export(jsonl_path)
+            with open(jsonl_path, encoding='utf-8') as f:
+                kayitlar = [json.loads(line) for line in f]
+        finally:
+            os.remove(jsonl_path)
+        self.assertEqual(len(kayitlar), 10)
+        self.assertEqual(kayitlar[0]['dilekce_son_teslim_tarihi'], "2024-12-01")
+
+
+class TestImportExport(unittest.TestCase):
+    """CSV içe / dışa aktarma testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.test_db_path = tempfile.mktemp(suffix='.db')
+        self.csv_path = tempfile.mktemp(suffix='.csv')
+        self.db = DatabaseManager(self.test_db_path)
+
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.db.close()
+        for path in (self.test_db_path, self.csv_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_import_keeps_values_for_empty_cells(self):
+        """Boş not ve tamamlanma hücreleri mevcut değerleri değiştirmemeli"""
+        from importer import DosyaImporter
+
+        self.db.add_dosya("2024/1 E.", "2024-01-01", "Eski not")
+        self.db.add_dosya("2024/2 E.", "2024-01-01", "Not")
+        ilk_id = self.db.search_dosyalar("2024/1 E.")[0]['id']
+        self.db.update_dosya(ilk_id, tamamlandi=True)
+
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write("Dosya No;Son Teslim Tarihi;Açıklama;Tamamlandı\n")
+            f.write("2024/1 E.;31.12.2024;;\n")
+            f.write("2024/2 E.;31.12.2024;;Evet\n")
+            f.write("2024/3 E.;31.12.2024;Yeni;Belki\n")
+
+        ozet = DosyaImporter(self.db).import_csv(self.csv_path)
+        self.assertEqual((ozet['guncellenen'], ozet['gecersiz']), (2, 1))
+
+        ilk = self.db.get_dosya_by_id(ilk_id)
+        self.assertEqual(ilk['notlar'], "Eski not")
+        self.assertTrue(ilk['tamamlandi'])
+        self.assertEqual(ilk['dilekce_son_teslim_tarihi'], "2024-12-31")
+        self.assertTrue(self.db.search_dosyalar("2024/2 E.")[0]['tamamlandi'])
+
+    def test_import_csv_upsert(self):
+        """Tarih normalizasyonu, upsert ve hatalı satır testi"""
+        from importer import DosyaImporter
+
+        self.db.add_dosya("2024/1 E.", "2024-01-01", "Eski not")
+
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write("Dosya No;Son Teslim Tarihi;Açıklama\n")
+            f.write("2024/1 E.;31.12.2024;Güncel not\n")
+            f.write("2024/2 E.;2024-12-15;Yeni dosya\n")
+            f.write("2024/3 E.;15/12/2024;Hatalı tarih\n")
+            f.write(";2024-12-15;Numarasız\n")
+            f.write("2024/4 E.;01.02.2025;\n")
+
+        progress = []
+        importer = DosyaImporter(self.db, chunk_size=2, progress_callback=progress.append)
+        ozet = importer.import_csv(self.csv_path)
+
+        self.assertEqual(ozet['islenen'], 5)
+        self.assertEqual(ozet['eklenen'], 2)
+        self.assertEqual(ozet['guncellenen'], 1)
+        self.assertEqual(ozet['gecersiz'], 2)
+        self.assertTrue(progress)
+
+        guncel = self.db.search_dosyalar("2024/1 E.")[0]
+        self.assertEqual(guncel['dilekce_son_teslim_tarihi'], "2024-12-31")
+        self.assertEqual(guncel['notlar'], "Güncel not")
+        self.assertEqual(self.db.get_dosya_count(), 3)
+
+    def test_export_csv_and_jsonl(self):
+        """Filtreli akış halinde dışa aktarma testi"""
+        import json
+        from exporter import DosyaExporter
+        from importer import DosyaImporter
+
+        self.db.add_dosyalar_bulk([(f"EXP-{i:03d}", f"2024-12-{i + 1:02d}", f"Not {i}")
+                                   for i in range(25)])
+        self.db.update_dosya(self.db.search_dosyalar("EXP-000")[0]['id'], tamamlandi=True)
+
+        progress = []
+        exporter = DosyaExporter(self.db, batch_size=10, progress_callback=progress.append)
+
+        # Yalnızca aktif dosyalar, tarih aralığı ile
+        jsonl_path = self.csv_path + '.jsonl'
+        try:
+            count = exporter.export(jsonl_path, include_completed=False,
+                                    start_date="2024-12-01", end_date="2024-12-10")
+            self.assertEqual(count, 9)
+            with open(jsonl_path, encoding='utf-8') as f:
+                kayitlar = [json.loads(line) for line in f]
+            self.assertEqual(len(kayitlar), 9)
+            self.assertFalse(kayitlar[0]['tamamlandi'])
+        finally:
+            os.remove(jsonl_path)
+
+        # CSV çıktısı tekrar içe aktarılabilmeli
+        count = exporter.export(self.csv_path)
+        self.assertEqual(count, 25)
+        self.assertEqual(progress[-1], 25)
+
+        ozet = DosyaImporter(self.db).import_csv(self.csv_path)
+        self.assertEqual(ozet['guncellenen'], 25)
+        self.assertEqual(ozet['gecersiz'], 0)
+
+        # Geri okunan tamamlanma durumu ve notlar korunmalı
+        tamamlanan = self.db.search_dosyalar("EXP-000")[0]
+        self.assertTrue(tamamlanan['tamamlandi'])
+        self.assertEqual(tamamlanan['notlar'], "Not 0")
+        self.assertFalse(self.db.search_dosyalar("EXP-001")[0]['tamamlandi'])
+
+
+class TestAsyncDatabase(unittest.TestCase):
+    """Asenkron veritabanı cephesi testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.test_db_path = tempfile.mktemp(suffix='.db')
+        self.db = DatabaseManager(self.test_db_path)
+        self.async_db = AsyncDatabaseManager(self.db)
+
+    def tearDown(self):
+        """Test sonrası temizlik"""
+        self.async_db.close()
+        self.db.close()
+        if os.path.exists(self.test_db_path):
+            os.remove(self.test_db_path)
+
+    def test_async_queries(self):
+        """Awaitable sorgular senkron sürümlerle aynı sonucu vermeli"""
+        import asyncio
+
+        async def senaryo():
+            await self.async_db.add_dosya("TEST-001", "2024-12-31", "Birinci")
+            await self.async_db.add_dosya("TEST-002", "2024-12-30", "İkinci")
+            # Sorgular eşzamanlı beklenebilmeli
+            return await asyncio.gather(
+                self.async_db.search_dosyalar("TEST-001"),
+                self.async_db.get_statistics(),
+                self.async_db.get_all_dosyalar()
+            )
+
+        loop = asyncio.new_event_loop()
+        try:
+            sonuclar, stats, dosyalar = loop.run_until_complete(senaryo())
+        finally:
+            loop.close()
+
+        self.assertEqual(sonuclar[0]['dosya_numarasi'], "TEST-001")
+        self.assertEqual(stats['toplam_dosya'], 2)
+        self.assertEqual([d['dosya_numarasi'] for d in dosyalar], ["TEST-002", "TEST-001"])
+
+
 class TestPerformance(unittest.TestCase):
     """Performans testleri"""
     
@@ -378,6 +1603,49 @@ class TestPerformance(unittest.TestCase):
         print(f"  Arama: {search_time:.2f}s")
 
 
+    def test_bulk_insert_performance(self):
+        """Toplu ekleme performans testi"""
+        import time
+
+        start_time = time.time()
+        results = self.db.add_dosyalar_bulk(
+            (f"BULK-{i:05d}", "2024-12-31", f"Toplu test dosyası {i}") for i in range(10000)
+        )
+        insert_time = time.time() - start_time
+
+        self.assertEqual(len(results), 10000)
+        self.assertEqual(self.db.get_dosya_count(), 10000)
+        self.assertLess(insert_time, 5.0, f"Toplu ekleme çok yavaş: {insert_time:.2f}s")
+
+        print(f"  10000 dosya toplu ekleme: {insert_time:.2f}s")
+
+    def test_short_term_search_performance(self):
+        """Kısa (FTS dışı) arama satır başına Python fonksiyonu çağırmamalı"""
+        import time
+
+        self.db.add_dosyalar_bulk(
+            (f"KISA-{i:05d}", "2024-12-31", "İŞ KAZASI" if i % 1000 == 0 else f"Not {i}")
+            for i in range(50000)
+        )
+
+        start_time = time.time()
+        results = self.db.search_dosyalar("iş")
+        search_time = time.time() - start_time
+        self.assertEqual(len(results), 50)
+
+        # Katlamasız yerleşik LIKE taraması ile karşılaştır
+        start_time = time.time()
+        self.db.connection.execute(
+            "SELECT * FROM dosyalar WHERE dosya_numarasi LIKE ? OR notlar LIKE ?",
+            ("%iş%", "%iş%")
+        ).fetchall()
+        baseline_time = time.time() - start_time
+
+        self.assertLess(search_time, baseline_time * 4 + 0.05,
+                        f"Kısa arama çok yavaş: {search_time:.3f}s (LIKE: {baseline_time:.3f}s)")
+        print(f"  50000 dosyada kısa arama: {search_time:.3f}s (LIKE: {baseline_time:.3f}s)")
+
+
 def run_gui_test():
     """GUI testi (eğer mümkünse)"""
     print("\n🖥️  GUI Test edilecek...")
@@ -411,8 +1679,17 @@ def main():
     test_classes = [
         TestDatabaseManager,
         TestCalendarView, 
+        TestCalendarCanvas,
+        TestYearHeatmap,
+        TestJudicialCalendar,
         TestNotificationSystem,
+        TestScheduler,
+        TestReminders,
+        TestLogging,
         TestDataIntegrity,
+        TestDosyaKaydi,
+        TestImportExport,
+        TestAsyncDatabase,
         TestPerformance
     ]
     
@@ -90,12 +90,8 @@ class TestDatabaseManager(unittest.TestCase):
         self.db.add_dosya("TEST-001", "2024-12-31", "Test")
         dosyalar = self.db.get_all_dosyalar()
         
-        # Ana avukata sunum tarihi 2 gün öncesi olmalı
-        dilekce_tarihi = datetime.strptime(dosyalar[0]['dilekce_son_teslim_tarihi'], '%Y-%m-%d')
-        sunum_tarihi = datetime.strptime(dosyalar[0]['ana_avukata_sunum_tarihi'], '%Y-%m-%d')
-        
-        fark = (dilekce_tarihi - sunum_tarihi).days
-        self.assertEqual(fark, 2)
+        # Ana avukata sunum tarihi 2 iş günü öncesi olmalı (hafta sonu atlanır)
+        self.assertEqual(dosyalar[0]['ana_avukata_sunum_tarihi'], "2024-12-27")
 
 class TestNotificationManager(unittest.TestCase):
     """Bildirim yöneticisi testleri"""
@@ -113,15 +109,17 @@ class TestNotificationManager(unittest.TestCase):
     
     def test_upcoming_deadlines(self):
         """Yaklaşan tarihler testi"""
+        # Sabit "bugün": sunum tarihleri tatillere göre değiştiği için sonuç
+        # testin çalıştığı güne bağlı olmamalı
+        today = datetime(2024, 12, 2).date()
+        
         # Yarın için bir dosya ekle
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        self.db.add_dosya("TEST-001", tomorrow, "Yarınki dosya")
+        self.db.add_dosya("TEST-001", "2024-12-03", "Yarınki dosya")
         
-        # Gelecek hafta için bir dosya ekle
-        next_week = (datetime.now() + timedelta(days=8)).strftime('%Y-%m-%d')
-        self.db.add_dosya("TEST-002", next_week, "Gelecek haftaki dosya")
+        # İki hafta sonrası için bir dosya ekle (sunum tarihi 12.12, 7 günün dışında)
+        self.db.add_dosya("TEST-002", "2024-12-16", "Gelecek haftaki dosya")
         
-        upcoming = self.db.get_upcoming_deadlines(7)
+        upcoming = self.db.get_upcoming_deadlines(7, today=today)
         self.assertEqual(len(upcoming), 1)  # Sadece yarınki dosya 7 gün içinde
         self.assertEqual(upcoming[0]['dosya_numarasi'], "TEST-001")
 
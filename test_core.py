@@ -37,10 +37,9 @@ def test_database():
         print("✅ Veri okuma testi başarılı")
         
         # Tarih hesaplama kontrolü
-        dilekce_tarihi = datetime.strptime(dosyalar[0]['dilekce_son_teslim_tarihi'], '%Y-%m-%d')
-        sunum_tarihi = datetime.strptime(dosyalar[0]['ana_avukata_sunum_tarihi'], '%Y-%m-%d')
-        fark = (dilekce_tarihi - sunum_tarihi).days
-        assert fark == 2, f"Tarih farkı yanlış: {fark}"
+        # 31.12.2024 Salı: 2 iş günü öncesi 27.12.2024 Cuma (hafta sonu sayılmaz)
+        sunum_tarihi = dosyalar[0]['ana_avukata_sunum_tarihi']
+        assert sunum_tarihi == "2024-12-27", f"Sunum tarihi yanlış: {sunum_tarihi}"
         print("✅ Otomatik tarih hesaplama testi başarılı")
         
         # Arama testi
@@ -174,13 +173,12 @@ def create_sample_data():
         ]
         
         added_count = 0
-        for dosya_no, tarih, notlar in sample_files:
-            try:
-                db.add_dosya(dosya_no, tarih, notlar)
+        for result in db.add_dosyalar_bulk(sample_files):
+            if result['durum'] == DatabaseManager.BULK_INSERTED:
                 added_count += 1
-                print(f"✅ Eklendi: {dosya_no}")
-            except Exception as e:
-                print(f"⚠️  Zaten mevcut: {dosya_no}")
+                print(f"✅ Eklendi: {result['dosya_numarasi']}")
+            else:
+                print(f"⚠️  Zaten mevcut: {result['dosya_numarasi']}")
         
         # İstatistikleri göster
         stats = db.get_statistics()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Sanal (pencereli) dosya listesi modülü
+
+Treeview'de tablonun tamamı yerine yalnızca görünen bölge ve bir ön yükleme
+payı tutulur. Kaydırma pencerenin kenarına yaklaştıkça sonraki / önceki
+sayfa keyset sayfalama ile getirilir, uzak kalan satırlar ağaçtan çıkarılır.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class VirtualTreeview:
+    """ttk.Treeview için sayfalı, sınırlı boyutlu satır penceresi
+
+    fetch_page(after=..., before=..., limit=...) -> List[Dict] artan
+    (dilekce_son_teslim_tarihi, id) sırasında satır döndürmelidir.
+    row_builder(dosya) -> (values, tag) bir satırın görünümünü üretir.
+    Ağaç öğelerinin iid değeri dosyanın id'sidir.
+    """
+
+    # Görünür alanın kenarına bu oran kadar yaklaşınca yeni sayfa yüklenir
+    PREFETCH_FRACTION = 0.2
+
+    def __init__(self, tree, scrollbar, row_builder: Callable[[Dict], Tuple[tuple, str]],
+                 page_size: int = 200, max_rows: int = 600):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_builder = row_builder
+        self.page_size = page_size
+        self.max_rows = max_rows
+
+        self.fetch_page = None
+        self.keys: List[Tuple[str, int]] = []  # Yüklü satırların anahtarları (ağaç sırasıyla)
+        self.has_more_before = False
+        self.has_more_after = False
+        self._check_pending = False
+
+        self.tree.configure(yscrollcommand=self._on_yscroll)
+
+    @staticmethod
+    def key_of(dosya: Dict) -> Tuple[str, int]:
+        """Satırın sıralama anahtarı"""
+        return (dosya['dilekce_son_teslim_tarihi'], dosya['id'])
+
+    def set_source(self, fetch_page: Callable[..., List[Dict]]):
+        """Sayfalı kaynağı bağla ve ilk pencereyi yükle"""
+        self.fetch_page = fetch_page
+        self._clear()
+
+        rows = fetch_page(after=None, before=None, limit=self.page_size + 1)
+        self.has_more_after = len(rows) > self.page_size
+        self._append(rows[:self.page_size])
+
+    def set_rows(self, rows: List[Dict]):
+        """Sabit bir satır listesini göster (arama / filtre sonuçları)"""
+        self.fetch_page = None
+        self._clear()
+        self._append(rows)
+
+    @property
+    def is_paged(self) -> bool:
+        """Liste sayfalı kaynaktan mı besleniyor?"""
+        return self.fetch_page is not None
+
+    def apply_changes(self, changed_ids: List[int], dosyalar: Dict[int, Dict],
+                      is_visible: Optional[Callable[[Dict], bool]] = None):
+        """Değişen satırları yerinde güncelle, taşı, ekle veya sil
+
+        dosyalar yalnızca hâlâ var olan kayıtları içerir; listede olmayan
+        id'ler silinmiş sayılır. Sabit listede (arama sonucu) yeni satır
+        eklenmez, yalnızca mevcut satırlar güncellenir veya çıkarılır.
+        """
+        for dosya_id in changed_ids:
+            iid = str(dosya_id)
+            dosya = dosyalar.get(dosya_id)
+            visible = dosya is not None and (is_visible is None or is_visible(dosya))
+
+            if self.tree.exists(iid):
+                old_index = self.tree.index(iid)
+                if not visible:
+                    self.tree.delete(iid)
+                    del self.keys[old_index]
+                    continue
+
+                new_key = self.key_of(dosya)
+                values, tag = self.row_builder(dosya)
+                if self.keys[old_index] == new_key or not self.is_paged:
+                    self.tree.item(iid, values=values, tags=(tag,))
+                    self.keys[old_index] = new_key
+                    continue
+
+                # Sıralama anahtarı değişti: yeni konuma taşı veya pencereden çıkar
+                del self.keys[old_index]
+                if self._in_window(new_key):
+                    index = bisect_left(self.keys, new_key)
+                    self.tree.detach(iid)  # İndeks, öğe çıkarılmış listeye göre hesaplandı
+                    self.tree.move(iid, '', index)
+                    self.tree.item(iid, values=values, tags=(tag,))
+                    self.keys.insert(index, new_key)
+                else:
+                    self.tree.delete(iid)
+
+            elif visible and self.is_paged:
+                new_key = self.key_of(dosya)
+                if self._in_window(new_key):
+                    index = bisect_left(self.keys, new_key)
+                    self._insert(index, dosya)
+                    self.keys.insert(index, new_key)
+
+    def _in_window(self, key: Tuple[str, int]) -> bool:
+        """Anahtar yüklü pencerenin aralığına düşüyor mu?"""
+        if self.has_more_before and (not self.keys or key < self.keys[0]):
+            return False
+        if self.has_more_after and (not self.keys or key > self.keys[-1]):
+            return False
+        return True
+
+    def _clear(self):
+        """Tüm öğeleri tek çağrıda sil"""
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self.keys = []
+        self.has_more_before = False
+        self.has_more_after = False
+
+    def _insert(self, index, dosya: Dict):
+        """Tek satırı ağaca ekle"""
+        values, tag = self.row_builder(dosya)
+        self.tree.insert('', index, iid=str(dosya['id']), values=values, tags=(tag,))
+
+    def _append(self, rows: List[Dict]):
+        """Satırları pencerenin sonuna ekle"""
+        for dosya in rows:
+            self._insert('end', dosya)
+            self.keys.append(self.key_of(dosya))
+
+    def _prepend(self, rows: List[Dict]):
+        """Satırları pencerenin başına ekle"""
+        for index, dosya in enumerate(rows):
+            self._insert(index, dosya)
+        self.keys[0:0] = [self.key_of(dosya) for dosya in rows]
+
+    def _trim_top(self, count: int):
+        """Pencerenin başından satır çıkar"""
+        if count <= 0:
+            return
+        self.tree.delete(*[str(key[1]) for key in self.keys[:count]])
+        del self.keys[:count]
+        self.has_more_before = True
+
+    def _trim_bottom(self, count: int):
+        """Pencerenin sonundan satır çıkar"""
+        if count <= 0:
+            return
+        self.tree.delete(*[str(key[1]) for key in self.keys[-count:]])
+        del self.keys[-count:]
+        self.has_more_after = True
+
+    def _on_yscroll(self, first, last):
+        """Treeview kaydırıldığında kaydırma çubuğunu güncelle, kenar kontrolü planla"""
+        self.scrollbar.set(first, last)
+        if self.fetch_page is not None and not self._check_pending:
+            self._check_pending = True
+            self.tree.after_idle(self._check_window)
+
+    def _top_index(self) -> int:
+        """Görünen ilk satırın pencere içindeki indeksi"""
+        first, _ = self.tree.yview()
+        return int(round(float(first) * len(self.keys)))
+
+    def _restore_top(self, index: int):
+        """Pencere değiştikten sonra aynı satırı üstte tut"""
+        if self.keys:
+            self.tree.yview_moveto(max(index, 0) / len(self.keys))
+
+    def _check_window(self):
+        """Görünen alan pencere kenarına yaklaştıysa komşu sayfayı yükle"""
+        self._check_pending = False
+        if self.fetch_page is None or not self.keys:
+            return
+
+        first, last = (float(f) for f in self.tree.yview())
+
+        if last >= 1.0 - self.PREFETCH_FRACTION and self.has_more_after:
+            top = self._top_index()
+            rows = self.fetch_page(after=self.keys[-1], before=None, limit=self.page_size + 1)
+            self.has_more_after = len(rows) > self.page_size
+            self._append(rows[:self.page_size])
+
+            overflow = len(self.keys) - self.max_rows
+            self._trim_top(overflow)
+            self._restore_top(top - max(overflow, 0))
+
+        elif first <= self.PREFETCH_FRACTION and self.has_more_before:
+            top = self._top_index()
+            rows = self.fetch_page(after=None, before=self.keys[0], limit=self.page_size + 1)
+            self.has_more_before = len(rows) > self.page_size
+            rows = rows[-self.page_size:]
+            self._prepend(rows)
+
+            self._trim_bottom(len(self.keys) - self.max_rows)
+            self._restore_top(top + len(rows))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hukuk Bürosu Dilekçe Takip Sistemi
+Yıllık iş yükü ısı haritası
+
+Yılın her günü, o gündeki aktif son teslim (ST) ve sunum (AS) sayısına göre
+renklendirilir; geçmiş günlerdeki işler gecikmiş sayılıp kırmızı tonlarla
+gösterilir. Veriler tek GROUP BY sorgusundan gelir ve yıl başına önbelleğe
+alınır; hücreler bir kez oluşturulur, yıl değişince yalnızca renkleri
+güncellenir.
+"""
+
+import tkinter as tk
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+try:
+    import ttkbootstrap as ttk
+except ImportError:
+    from tkinter import ttk
+
+from database import DatabaseManager
+
+# (en az olay sayısı, renk) - artan sırada
+FUTURE_COLORS = [(0, '#ebedf0'), (1, '#c6e48b'), (2, '#7bc96f'), (4, '#239a3b'), (7, '#196127')]
+OVERDUE_COLORS = [(1, '#ffd6d6'), (2, '#ff9e9e'), (4, '#e05555'), (7, '#a31515')]
+
+MONTH_NAMES = ['Oca', 'Şub', 'Mar', 'Nis', 'May', 'Haz',
+               'Tem', 'Ağu', 'Eyl', 'Eki', 'Kas', 'Ara']
+DAY_NAMES = ['Pzt', '', 'Çar', '', 'Cum', '', 'Paz']
+
+
+def heat_color(total: int, overdue: bool) -> str:
+    """Gündeki olay sayısına ve gecikme durumuna göre hücre rengi"""
+    palette = OVERDUE_COLORS if overdue and total else FUTURE_COLORS
+    color = palette[0][1]
+    for threshold, candidate in palette:
+        if total >= threshold:
+            color = candidate
+    return color
+
+
+def year_cell_position(day: date) -> Tuple[int, int]:
+    """Günün ızgaradaki (hafta sütunu, haftanın günü) konumu"""
+    jan1 = date(day.year, 1, 1)
+    return (day - jan1 + timedelta(days=jan1.weekday())).days // 7, day.weekday()
+
+
+class YearHeatmapWindow:
+    """Yılın tamamını tek Canvas üzerinde gösteren ısı haritası penceresi"""
+
+    CELL = 13
+    GAP = 2
+    LEFT = 34
+    TOP = 22
+    WEEKS = 54  # 1 Ocak Pazar ise ve yıl artıksa 54 sütun gerekir
+
+    def __init__(self, parent, db_manager: DatabaseManager, year: int = None):
+        self.db_manager = db_manager
+        self.year = year or datetime.now().year
+        self.counts = {}
+        self.cells = {}  # (sütun, satır) -> dikdörtgen öğesi
+        self.cell_dates = {}  # (sütun, satır) -> tarih (yıl dışı hücreler yok)
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Yıllık İş Yükü")
+        self.window.resizable(False, False)
+        self.window.transient(parent)
+
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Yıl navigasyonu
+        nav_frame = ttk.Frame(main_frame)
+        nav_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Button(nav_frame, text="◀", width=3,
+                   command=lambda: self.show_year(self.year - 1)).pack(side=tk.LEFT)
+        self.year_var = tk.StringVar()
+        ttk.Label(nav_frame, textvariable=self.year_var, font=('Arial', 12, 'bold'),
+                  width=8, anchor='center').pack(side=tk.LEFT, padx=10)
+        ttk.Button(nav_frame, text="▶", width=3,
+                   command=lambda: self.show_year(self.year + 1)).pack(side=tk.LEFT)
+        self.total_var = tk.StringVar()
+        ttk.Label(nav_frame, textvariable=self.total_var).pack(side=tk.RIGHT)
+
+        step = self.CELL + self.GAP
+        self.canvas = tk.Canvas(main_frame, background='white', highlightthickness=0,
+                                width=self.LEFT + self.WEEKS * step,
+                                height=self.TOP + 7 * step)
+        self.canvas.pack()
+        self._create_items()
+
+        # Üzerine gelinen günün ayrıntısı
+        self.info_var = tk.StringVar(value="Ayrıntı için bir günün üzerine gelin")
+        ttk.Label(main_frame, textvariable=self.info_var).pack(anchor=tk.W, pady=(8, 0))
+
+        self.canvas.bind('<Motion>', self.on_motion)
+        self.canvas.bind('<Leave>', lambda e: self.info_var.set(""))
+
+        self.show_year(self.year)
+        self.window.focus()
+
+    def _create_items(self):
+        """Gün etiketleri ve 54x7 hücre dikdörtgenlerini bir kez oluştur"""
+        step = self.CELL + self.GAP
+        for row, name in enumerate(DAY_NAMES):
+            if name:
+                self.canvas.create_text(self.LEFT - 4, self.TOP + row * step + self.CELL / 2,
+                                        text=name, anchor='e', font=('Arial', 8))
+        for column in range(self.WEEKS):
+            for row in range(7):
+                x = self.LEFT + column * step
+                y = self.TOP + row * step
+                self.cells[(column, row)] = self.canvas.create_rectangle(
+                    x, y, x + self.CELL, y + self.CELL, outline='', state='hidden',
+                    tags=('gun',)
+                )
+
+    def show_year(self, year: int):
+        """Yılın sayılarını al (önbellekten) ve hücreleri renklendir"""
+        self.year = year
+        self.year_var.set(str(year))
+        try:
+            self.counts = self.db_manager.get_year_event_counts(year)
+        except Exception as e:
+            self.counts = {}
+            self.info_var.set(f"Veriler alınamadı: {e}")
+
+        today = datetime.now().date()
+        canvas = self.canvas
+        canvas.itemconfigure('gun', state='hidden')
+        canvas.delete('ay')
+        self.cell_dates = {}
+
+        day = date(year, 1, 1)
+        step = self.CELL + self.GAP
+        while day.year == year:
+            position = year_cell_position(day)
+            dilekce, sunum = self.counts.get(day.strftime('%Y-%m-%d'), (0, 0))
+            canvas.itemconfigure(self.cells[position], state='normal',
+                                 fill=heat_color(dilekce + sunum, day < today))
+            self.cell_dates[position] = day
+            if day.day == 1:
+                canvas.create_text(self.LEFT + position[0] * step, self.TOP - 6,
+                                   text=MONTH_NAMES[day.month - 1], anchor='sw',
+                                   font=('Arial', 8), tags=('ay',))
+            day += timedelta(days=1)
+
+        toplam_dilekce = sum(d for d, _ in self.counts.values())
+        toplam_sunum = sum(s for _, s in self.counts.values())
+        self.total_var.set(f"Aktif işler - ST: {toplam_dilekce}  AS: {toplam_sunum}")
+
+    def cell_at(self, x: float, y: float) -> Optional[date]:
+        """Koordinattaki günün tarihi (boşluk veya yıl dışıysa None)"""
+        step = self.CELL + self.GAP
+        column, x_offset = divmod(x - self.LEFT, step)
+        row, y_offset = divmod(y - self.TOP, step)
+        if x_offset >= self.CELL or y_offset >= self.CELL:
+            return None
+        return self.cell_dates.get((int(column), int(row)))
+
+    def on_motion(self, event):
+        """Üzerine gelinen günün sayılarını göster"""
+        day = self.cell_at(event.x, event.y)
+        if day is None:
+            return
+        dilekce, sunum = self.counts.get(day.strftime('%Y-%m-%d'), (0, 0))
+        durum = " (gecikmiş)" if (dilekce or sunum) and day < datetime.now().date() else ""
+        self.info_var.set(f"{day.strftime('%d.%m.%Y')}: Son teslim {dilekce}, "
+                          f"Ana avukata sunum {sunum}{durum}")